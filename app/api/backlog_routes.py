@@ -2,19 +2,98 @@
 Backlog API Routes
 Endpoints for backlog card management and request ingestion.
 """
+import asyncio
+import hashlib
+from typing import Tuple
 from fastapi import APIRouter, HTTPException, Depends, status
 from sqlalchemy.ext.asyncio import AsyncSession
 from uuid import UUID
 
+from app.core.cache import SingleFlight, TTLCache
 from app.core.database import get_db
+from app.core.errors import ExternalServiceError
+from app.core.http_cache import cards_list_cache
 from app.schemas.backlog import BacklogIngestRequest, BacklogIngestResponse, CreateCardRequest, CreateCardResponse
 from app.services.backlog_matcher import find_matching_card_id
 from app.services.backlog_card_generation import generate_card_title_description
-from app.services.backlog_repository import process_incoming_request, create_manual_card
+from app.services.backlog_repository import ZERO_UUID, process_incoming_request, create_manual_card
 
 
 router = APIRouter(prefix="/api/v1/backlog", tags=["Backlog"])
 
+# Identical requests in flight share one match/create; recent ones skip matching
+_ingest_flights = SingleFlight()
+_recent_card_ids = TTLCache(maxsize=1024, ttl=300)
+
+# Upper bound for awaiting the speculative title/description generation
+CARD_GENERATION_TIMEOUT_SECONDS = 30
+
+
+def _ingest_key(prompt_text: str, comment_text: str) -> str:
+    """Content hash identifying duplicate ingest payloads"""
+    payload = f"{prompt_text.strip()}\x00{(comment_text or '').strip()}"
+    return hashlib.blake2b(payload.encode("utf-8"), digest_size=16).hexdigest()
+
+
+async def _match_or_create_card(
+    db: AsyncSession,
+    prompt_text: str,
+    comment_text: str
+) -> Tuple[UUID, bool]:
+    """
+    Match the request to an existing card or create a new one, storing the prompt.
+    
+    Returns:
+        Tuple of (card_id, is_new_card)
+    """
+    # Generate the title/description speculatively while matching runs; it is
+    # only awaited when no existing card matches, and cancelled otherwise
+    generation = asyncio.create_task(
+        generate_card_title_description(prompt_text=prompt_text, comment_text=comment_text)
+    )
+    # Consume the outcome so a discarded task never logs an unretrieved error
+    generation.add_done_callback(lambda task: task.cancelled() or task.exception())
+    
+    try:
+        matched_card_id = await find_matching_card_id(
+            db=db,
+            prompt_text=prompt_text,
+            comment_text=comment_text,
+            threshold=50
+        )
+    except BaseException:
+        generation.cancel()
+        raise
+    
+    is_new_card = matched_card_id == 0
+    
+    if is_new_card:
+        title, description = await asyncio.wait_for(
+            generation,
+            timeout=CARD_GENERATION_TIMEOUT_SECONDS
+        )
+        
+        card_id = await process_incoming_request(
+            db=db,
+            card_id=ZERO_UUID,
+            title=title,
+            description=description,
+            prompt_text=prompt_text,
+            comment_text=comment_text
+        )
+    else:
+        generation.cancel()
+        card_id = await process_incoming_request(
+            db=db,
+            card_id=matched_card_id,
+            title="",
+            description="",
+            prompt_text=prompt_text,
+            comment_text=comment_text
+        )
+    
+    return card_id, is_new_card
+
 
 @router.post(
     "/ingest",
@@ -28,6 +107,9 @@ router = APIRouter(prefix="/api/v1/backlog", tags=["Backlog"])
     2. If match found (≥50% similarity): adds request to existing card
     3. If no match: generates title/description and creates new card
     
+    Identical requests arriving concurrently (or within a few minutes) share a
+    single matching run and are attached to the same card.
+    
     All processing happens in English internally regardless of input language.
     """
 )
@@ -42,38 +124,46 @@ async def ingest_backlog_request(
     To enable response, change status_code and uncomment return statement.
     """
     try:
-        matched_card_id = await find_matching_card_id(
-            db=db,
-            prompt_text=request.prompt_text,
-            comment_text=request.comment_text,
-            threshold=50
-        )
+        key = _ingest_key(request.prompt_text, request.comment_text)
         
-        is_new_card = matched_card_id == 0
+        # Exact replay of a recent request: attach it to the same card directly
+        card_id = _recent_card_ids.get(key)
+        if card_id is not None:
+            try:
+                await process_incoming_request(
+                    db=db,
+                    card_id=card_id,
+                    title="",
+                    description="",
+                    prompt_text=request.prompt_text,
+                    comment_text=request.comment_text
+                )
+            except Exception:
+                # Card may have been deleted meanwhile: fall back to full matching
+                _recent_card_ids.pop(key)
+                card_id = None
         
-        if is_new_card:
-            title, description = await generate_card_title_description(
-                prompt_text=request.prompt_text,
-                comment_text=request.comment_text
+        if card_id is None:
+            (card_id, _), shared = await _ingest_flights.do(
+                key,
+                lambda: _match_or_create_card(db, request.prompt_text, request.comment_text)
             )
             
-            card_id = await process_incoming_request(
-                db=db,
-                card_id=UUID('00000000-0000-0000-0000-000000000000'),
-                title=title,
-                description=description,
-                prompt_text=request.prompt_text,
-                comment_text=request.comment_text
-            )
-        else:
-            card_id = await process_incoming_request(
-                db=db,
-                card_id=matched_card_id,
-                title="",
-                description="",
-                prompt_text=request.prompt_text,
-                comment_text=request.comment_text
-            )
+            if shared:
+                # Another identical request did the matching; just add our prompt
+                await process_incoming_request(
+                    db=db,
+                    card_id=card_id,
+                    title="",
+                    description="",
+                    prompt_text=request.prompt_text,
+                    comment_text=request.comment_text
+                )
+            
+            _recent_card_ids.set(key, card_id)
+        
+        # New card or incremented request count: cached card lists are stale
+        cards_list_cache.invalidate()
         
         # To enable response later, uncomment:
         # return BacklogIngestResponse(
@@ -89,14 +179,10 @@ async def ingest_backlog_request(
             detail=f"Invalid input: {str(e)}"
         )
     
+    except ExternalServiceError:
+        raise
+    
     except Exception as e:
-        error_msg = str(e).lower()
-        if "openai" in error_msg or "api" in error_msg or "embedding" in error_msg:
-            raise HTTPException(
-                status_code=status.HTTP_502_BAD_GATEWAY,
-                detail=f"External service error: {str(e)}"
-            )
-        
         raise HTTPException(
             status_code=status.HTTP_500_INTERNAL_SERVER_ERROR,
             detail=f"Failed to process backlog request: {str(e)}"
@@ -148,6 +234,7 @@ async def create_card(
             title=request.title,
             description=request.description
         )
+        cards_list_cache.invalidate()
         
         return CreateCardResponse(
             card_id=str(card_id),
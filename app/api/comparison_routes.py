@@ -6,6 +6,7 @@ from fastapi import APIRouter, HTTPException, Depends, status
 from sqlalchemy.ext.asyncio import AsyncSession
 
 from app.core.database import get_db
+from app.core.errors import ExternalServiceError
 from app.schemas.comparison import ComparisonRequest, ComparisonResponse
 from app.services.comparison import build_comparison, CompanyNotFoundException
 
@@ -50,7 +51,7 @@ async def compare_applications(
         HTTPException: 400 for invalid input, 404 for missing companies, 502 for service errors
     """
     # Validate company names are different
-    if request.company_a.lower() == request.company_b.lower():
+    if request.is_same_company:
         raise HTTPException(
             status_code=status.HTTP_400_BAD_REQUEST,
             detail="Company names must be different"
@@ -75,15 +76,9 @@ async def compare_applications(
             status_code=status.HTTP_404_NOT_FOUND,
             detail=str(e)
         )
+    except ExternalServiceError:
+        raise
     except Exception as e:
-        # Check if it's an OpenAI/service error
-        error_msg = str(e).lower()
-        if any(keyword in error_msg for keyword in ["openai", "api", "timeout", "connection"]):
-            raise HTTPException(
-                status_code=status.HTTP_502_BAD_GATEWAY,
-                detail=f"AI service error: {str(e)}"
-            )
-        # Re-raise as 500 for unexpected errors
         raise HTTPException(
             status_code=status.HTTP_500_INTERNAL_SERVER_ERROR,
             detail=f"Unexpected error during comparison: {str(e)}"
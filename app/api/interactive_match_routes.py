@@ -2,11 +2,13 @@
 Interactive Match API Routes
 Endpoints for multi-turn interactive matching with guided question flow.
 """
-from fastapi import APIRouter, HTTPException, status
+from fastapi import APIRouter, Depends, HTTPException, Response, status
+from pydantic import BaseModel
 from typing import Union
 import asyncpg
 
-from app.core.config import settings
+from app.core.database import get_asyncpg_pool
+from app.core.errors import ExternalServiceError
 from app.schemas.interactive_match import (
     StartRequest,
     ContinueRequest,
@@ -30,6 +32,23 @@ from app.services.interactive_match import (
 router = APIRouter(prefix="/api/v1/match/interactive", tags=["Interactive Matching"])
 
 
+def _model_response(model: BaseModel) -> Response:
+    """
+    Serialize a response model in one pass through pydantic-core.
+    
+    Returning a Response skips FastAPI's second validation of the model
+    against response_model (which for the Union responses tries each
+    member); response_model still documents the endpoint.
+    
+    Args:
+        model: Already validated response model
+    
+    Returns:
+        JSON response
+    """
+    return Response(content=model.model_dump_json(), media_type="application/json")
+
+
 @router.post(
     "/start",
     status_code=status.HTTP_200_OK,
@@ -66,28 +85,24 @@ async def start_interactive_session(request: StartRequest):
             state = get_state(result)
             final_prompt = compose_final_prompt(state)
             
-            return ReadyResponse(
+            return _model_response(ReadyResponse(
                 session=state,
                 final_prompt=final_prompt,
                 results=None
-            )
+            ))
         else:
             state = get_state(result)
             question = get_question(result)
             
-            return NeedsMoreResponse(
+            return _model_response(NeedsMoreResponse(
                 session=state,
                 question=question,
                 missing=state.missing
-            )
+            ))
     
+    except ExternalServiceError:
+        raise
     except Exception as e:
-        error_msg = str(e).lower()
-        if any(keyword in error_msg for keyword in ["openai", "api", "timeout", "connection"]):
-            raise HTTPException(
-                status_code=status.HTTP_502_BAD_GATEWAY,
-                detail=f"AI service error: {str(e)}"
-            )
         raise HTTPException(
             status_code=status.HTTP_500_INTERNAL_SERVER_ERROR,
             detail=f"Error starting session: {str(e)}"
@@ -129,28 +144,24 @@ async def continue_interactive_session(request: ContinueRequest):
             state = get_state(result)
             final_prompt = compose_final_prompt(state)
             
-            return ReadyResponse(
+            return _model_response(ReadyResponse(
                 session=state,
                 final_prompt=final_prompt,
                 results=None
-            )
+            ))
         else:
             state = get_state(result)
             question = get_question(result)
             
-            return NeedsMoreResponse(
+            return _model_response(NeedsMoreResponse(
                 session=state,
                 question=question,
                 missing=state.missing
-            )
+            ))
     
+    except ExternalServiceError:
+        raise
     except Exception as e:
-        error_msg = str(e).lower()
-        if any(keyword in error_msg for keyword in ["openai", "api", "timeout", "connection"]):
-            raise HTTPException(
-                status_code=status.HTTP_502_BAD_GATEWAY,
-                detail=f"AI service error: {str(e)}"
-            )
         raise HTTPException(
             status_code=status.HTTP_500_INTERNAL_SERVER_ERROR,
             detail=f"Error continuing session: {str(e)}"
@@ -174,12 +185,16 @@ async def continue_interactive_session(request: ContinueRequest):
     Session must be valid (is_valid=true).
     """
 )
-async def finalize_interactive_session(request: FinalizeRequest):
+async def finalize_interactive_session(
+    request: FinalizeRequest,
+    pool: asyncpg.Pool = Depends(get_asyncpg_pool)
+):
     """
     Run final matching on a valid session.
     
     Args:
         request: FinalizeRequest with valid session and parameters
+        pool: Shared asyncpg connection pool
         
     Returns:
         ReadyResponse with results
@@ -193,16 +208,14 @@ async def finalize_interactive_session(request: FinalizeRequest):
             detail="Session is not valid. Cannot run matching."
         )
     
-    conn = None
     try:
-        conn = await asyncpg.connect(settings.database_url)
-        
-        result = await run_final_match_with_names(
-            conn,
-            request.session,
-            top_k=request.top_k,
-            top_n=request.top_n
-        )
+        async with pool.acquire() as conn:
+            result = await run_final_match_with_names(
+                conn,
+                request.session,
+                top_k=request.top_k,
+                top_n=request.top_n
+            )
         
         matches = [
             MatchResult(
@@ -213,28 +226,21 @@ async def finalize_interactive_session(request: FinalizeRequest):
             for match in result["results"]
         ]
         
-        return ReadyResponse(
+        return _model_response(ReadyResponse(
             session=request.session,
             final_prompt=result["final_prompt"],
             results=matches
-        )
+        ))
     
     except ValueError as e:
         raise HTTPException(
             status_code=status.HTTP_400_BAD_REQUEST,
             detail=str(e)
         )
+    except ExternalServiceError:
+        raise
     except Exception as e:
-        error_msg = str(e).lower()
-        if any(keyword in error_msg for keyword in ["openai", "api", "timeout", "connection"]):
-            raise HTTPException(
-                status_code=status.HTTP_502_BAD_GATEWAY,
-                detail=f"AI service error: {str(e)}"
-            )
         raise HTTPException(
             status_code=status.HTTP_500_INTERNAL_SERVER_ERROR,
             detail=f"Error running match: {str(e)}"
         )
-    finally:
-        if conn:
-            await conn.close()
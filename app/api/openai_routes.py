@@ -1,8 +1,13 @@
 """
 OpenAI API Routes
 """
+import json
+from typing import AsyncIterator
+
 from fastapi import APIRouter, HTTPException, status
-from app.core.openai_client import get_chat_completion, get_embedding, create_image
+from fastapi.responses import ORJSONResponse, StreamingResponse
+from app.core.errors import ExternalServiceError
+from app.core.openai_client import get_chat_completion, stream_chat_completion, get_embedding, create_image
 from app.schemas.openai_schemas import (
     ChatRequest,
     ChatResponse,
@@ -46,6 +51,8 @@ async def chat_completion(request: ChatRequest):
             response=response,
             model=request.model
         )
+    except ExternalServiceError:
+        raise
     except Exception as e:
         raise HTTPException(
             status_code=status.HTTP_500_INTERNAL_SERVER_ERROR,
@@ -53,6 +60,39 @@ async def chat_completion(request: ChatRequest):
         )
 
 
+@router.post("/chat/stream")
+async def chat_completion_stream(request: ChatRequest):
+    """
+    Stream a chat completion from OpenAI as Server-Sent Events
+    
+    Takes the same body as /chat. Each event carries a JSON payload
+    `{"delta": "..."}` with the next text fragment; the stream ends with
+    `data: [DONE]`. Errors after the stream has started are sent as an
+    `error` event, since the status code has already been sent.
+    """
+    messages = [msg.model_dump() for msg in request.messages]
+    
+    async def sse_events() -> AsyncIterator[str]:
+        try:
+            async for delta in stream_chat_completion(
+                messages=messages,
+                model=request.model,
+                temperature=request.temperature,
+                max_tokens=request.max_tokens
+            ):
+                yield f"data: {json.dumps({'delta': delta})}\n\n"
+        except Exception as e:
+            yield f"event: error\ndata: {json.dumps({'detail': str(e)})}\n\n"
+            return
+        yield "data: [DONE]\n\n"
+    
+    return StreamingResponse(
+        sse_events(),
+        media_type="text/event-stream",
+        headers={"Cache-Control": "no-cache", "X-Accel-Buffering": "no"}
+    )
+
+
 @router.post("/embedding", response_model=EmbeddingResponse)
 async def get_text_embedding(request: EmbeddingRequest):
     """
@@ -72,10 +112,14 @@ async def get_text_embedding(request: EmbeddingRequest):
             model=request.model
         )
         
-        return EmbeddingResponse(
-            embedding=embedding,
-            model=request.model
-        )
+        # The vector goes straight to orjson: building an EmbeddingResponse
+        # would validate each of its floats, then again as response_model
+        return ORJSONResponse({
+            "embedding": embedding,
+            "model": request.model
+        })
+    except ExternalServiceError:
+        raise
     except Exception as e:
         raise HTTPException(
             status_code=status.HTTP_500_INTERNAL_SERVER_ERROR,
@@ -107,6 +151,8 @@ async def generate_image(request: ImageGenerationRequest):
         )
         
         return ImageGenerationResponse(urls=urls)
+    except ExternalServiceError:
+        raise
     except Exception as e:
         raise HTTPException(
             status_code=status.HTTP_500_INTERNAL_SERVER_ERROR,
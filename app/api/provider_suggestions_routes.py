@@ -2,18 +2,27 @@
 Provider Suggestions API Routes
 Endpoint for finding external provider suggestions for backlog cards.
 """
-from fastapi import APIRouter, HTTPException, Depends, status
-from sqlalchemy.ext.asyncio import AsyncSession
+import asyncio
+from fastapi import APIRouter, HTTPException, Response, status
 from uuid import UUID
 
-from app.core.database import get_db
+import orjson
+
+from app.core.cache import TTLCache
+from app.core.database import AsyncReadOnlySessionLocal
 from app.schemas.provider_suggestions import ProviderSuggestionResponse
 from app.services.card_fetcher import get_card_by_id
-from app.services.provider_suggestions.tavily_service import suggest_provider_with_tavily
+from app.services.provider_suggestions.tavily_service import FALLBACK_COMPANY_NAME, suggest_provider_with_tavily
 
 
 router = APIRouter(prefix="/api/v1/backlog", tags=["Provider Suggestions"])
 
+# Short-lived serialized responses per card, covering repeated clicks on the
+# same card without the card lookup or re-serialization (suggestions by
+# content are cached in the service). The no-result fallback is not cached,
+# as a failed search also produces it.
+_card_suggestions = TTLCache(maxsize=1024, ttl=120)
+
 
 @router.post(
     "/{card_id}/suggest-provider",
@@ -35,25 +44,31 @@ router = APIRouter(prefix="/api/v1/backlog", tags=["Provider Suggestions"])
     """
 )
 async def suggest_provider_for_card(
-    card_id: UUID,
-    db: AsyncSession = Depends(get_db)
-) -> ProviderSuggestionResponse:
+    card_id: UUID
+) -> Response:
     """
     Get external provider suggestion for a backlog card.
     
     Args:
         card_id: UUID of the backlog card
-        db: Database session (injected)
     
     Returns:
-        ProviderSuggestionResponse with company details and reasoning
+        ProviderSuggestionResponse JSON with company details and reasoning
+        (X-Cache header tells whether it was served from the cache)
     
     Raises:
         404: Card not found
         502: Error with web search or processing suggestion
+        503: Web search timed out or too many searches in progress
     """
-    # Fetch card from database
-    card = await get_card_by_id(db, card_id)
+    cached = _card_suggestions.get(card_id)
+    if cached is not None:
+        return Response(content=cached, media_type="application/json", headers={"X-Cache": "HIT"})
+    
+    # Fetch card from database. The session is closed before the web search
+    # so the connection goes back to the pool during the slow external call.
+    async with AsyncReadOnlySessionLocal() as db:
+        card = await get_card_by_id(db, card_id)
     
     if card is None:
         raise HTTPException(
@@ -69,7 +84,7 @@ async def suggest_provider_for_card(
         )
         
         # Build response
-        return ProviderSuggestionResponse(
+        response = ProviderSuggestionResponse(
             card_id=card_id,
             company_name=suggestion["company_name"],
             company_url=suggestion["company_url"],
@@ -77,8 +92,19 @@ async def suggest_provider_for_card(
             reasoning_brief=suggestion["reasoning_brief"]
         )
         
+    except asyncio.TimeoutError:
+        raise HTTPException(
+            status_code=status.HTTP_503_SERVICE_UNAVAILABLE,
+            detail="Provider search timed out, please retry later"
+        )
+    
     except Exception as e:
         raise HTTPException(
             status_code=status.HTTP_502_BAD_GATEWAY,
             detail=f"Error generating provider suggestion: {str(e)}"
         )
+    
+    body = orjson.dumps(response.model_dump(mode="json"))
+    if response.company_name != FALLBACK_COMPANY_NAME:
+        _card_suggestions.set(card_id, body)
+    return Response(content=body, media_type="application/json", headers={"X-Cache": "MISS"})
@@ -1,95 +1,176 @@
 """
 API Routes with Database Integration
 """
-from fastapi import APIRouter, Depends, HTTPException
+from fastapi import APIRouter, Depends, HTTPException, Query, Request, Response
+from pydantic import TypeAdapter
 from sqlalchemy.ext.asyncio import AsyncSession
-from sqlalchemy import select
+from sqlalchemy import select, update, delete, case, true, cast, func, bindparam, BigInteger
 from typing import List
-from uuid import UUID
+from uuid import UUID, uuid4
 
-from app.core.database import get_db
-from app.models.models import Application, Card, CardPromptComment, ApplicationClick, AppTag
+from app.core.database import get_db, get_db_ro
+from app.core.http_cache import application_links_cache, cards_list_cache, cached_json_response, compute_etag, etag_matches
+from app.models.models import Application, Card, CardPromptComment, ApplicationClick, ApplicationClickCounter, AppTag
 from app.schemas.schemas import ApplicationLinkResponse, ApplicationClickRequest, CardResponse, CardDeleteRequest, CardStatusToggleRequest, CardPromptCommentResponse, CardUpvoteRequest, CardCommentCreateRequest, CardCommentUpvoteRequest, MessageResponse, ClickStatsResponse, CategoryAnalyticsResponse, TopCategoriesResponse, CategoryClickStats
 
 router = APIRouter(prefix="/api/v1", tags=["application"])
 
+_application_links_adapter = TypeAdapter(List[ApplicationLinkResponse])
+_cards_adapter = TypeAdapter(List[CardResponse])
+
+# Largest page the list endpoints return in one response
+MAX_PAGE_SIZE = 500
+
+# Statements built once at import and executed with bound parameters, so
+# every request hits SQLAlchemy's compiled cache instead of rebuilding them
+# Application links carry their tag names as an array built in the same
+# query, instead of loading AppTag objects and projecting them per row
+_APPLICATION_LINK_COLUMNS = (
+    Application.id,
+    Application.name,
+    Application.description,
+    Application.url,
+    Application.image_url,
+    Application.price_text,
+    Application.rating,
+    func.array(
+        select(AppTag.tag).where(AppTag.app_id == Application.id).scalar_subquery()
+    ).label("tags"),
+)
+_LIST_APPLICATIONS_STMT = select(*_APPLICATION_LINK_COLUMNS).offset(bindparam("skip")).limit(bindparam("lim"))
+_GET_APPLICATION_STMT = select(*_APPLICATION_LINK_COLUMNS).where(Application.id == bindparam("app_id"))
+_LIST_CARDS_STMT = select(Card).offset(bindparam("skip")).limit(bindparam("lim"))
+_GET_CARD_STMT = select(Card).where(Card.id == bindparam("cid"))
+_GET_CARD_VERSION_STMT = select(
+    Card.updated_at, Card.upvote, Card.status, Card.number_of_requests
+).where(Card.id == bindparam("cid"))
+
+
+def _parse_uuid(value: str, detail: str) -> UUID:
+    """Parse a UUID string, raising a 400 with detail if it is malformed"""
+    try:
+        return UUID(value)
+    except ValueError:
+        raise HTTPException(status_code=400, detail=detail)
+
 
 @router.get("/application/links", response_model=List[ApplicationLinkResponse])
 async def get_application_links(
-    skip: int = 0,
-    limit: int = 100,
-    db: AsyncSession = Depends(get_db)
+    request: Request,
+    skip: int = Query(0, ge=0),
+    limit: int = Query(100, ge=1, le=MAX_PAGE_SIZE),
+    db: AsyncSession = Depends(get_db_ro)
 ):
     """Get all application links (id, name, and link only)"""
-    result = await db.execute(
-        select(Application).offset(skip).limit(limit)
-    )
-    application = result.scalars().all()
-    return application
+    key = (skip, limit)
+    cached = application_links_cache.get(key)
+    if cached is None:
+        version = application_links_cache.version
+        result = await db.execute(
+            _LIST_APPLICATIONS_STMT, {"skip": skip, "lim": limit}
+        )
+        application = result.all()
+        body = _application_links_adapter.dump_json(
+            _application_links_adapter.validate_python(application, from_attributes=True)
+        )
+        cached = application_links_cache.set(key, body, version)
+    
+    etag, body = cached
+    return cached_json_response(request, etag, body)
 
 
 @router.get("/cards", response_model=List[CardResponse])
 async def get_all_cards(
-    skip: int = 0,
-    limit: int = 100,
-    db: AsyncSession = Depends(get_db)
+    request: Request,
+    skip: int = Query(0, ge=0),
+    limit: int = Query(100, ge=1, le=MAX_PAGE_SIZE),
+    db: AsyncSession = Depends(get_db_ro)
 ):
     """Get all cards from the database"""
-    result = await db.execute(
-        select(Card).offset(skip).limit(limit)
-    )
-    cards = result.scalars().all()
-    return cards
+    key = (skip, limit)
+    cached = cards_list_cache.get(key)
+    if cached is None:
+        version = cards_list_cache.version
+        result = await db.execute(
+            _LIST_CARDS_STMT, {"skip": skip, "lim": limit}
+        )
+        cards = result.scalars().all()
+        body = _cards_adapter.dump_json(
+            _cards_adapter.validate_python(cards, from_attributes=True)
+        )
+        cached = cards_list_cache.set(key, body, version)
+    
+    etag, body = cached
+    return cached_json_response(request, etag, body)
+
+
+def _card_etag(updated_at, upvote, status, number_of_requests) -> str:
+    """ETag from the card fields that change after creation"""
+    return compute_etag(f"{updated_at}|{upvote}|{status}|{number_of_requests}".encode())
 
 
 @router.get("/cards/{card_id}", response_model=CardResponse)
 async def get_card(
     card_id: str,
-    db: AsyncSession = Depends(get_db)
+    request: Request,
+    response: Response,
+    db: AsyncSession = Depends(get_db_ro)
 ):
-    """Get a specific card by ID"""
-    try:
-        card_uuid = UUID(card_id)
-    except ValueError:
-        raise HTTPException(status_code=400, detail="Invalid card ID format")
+    """Get a specific card by ID (supports If-None-Match)"""
+    card_uuid = _parse_uuid(card_id, "Invalid card ID format")
+    
+    # Conditional request: check the cheap version columns before loading
+    # and serializing the full card
+    if request.headers.get("if-none-match"):
+        result = await db.execute(_GET_CARD_VERSION_STMT, {"cid": card_uuid})
+        version = result.one_or_none()
+        
+        if version is None:
+            raise HTTPException(status_code=404, detail="Card not found")
+        
+        etag = _card_etag(*version)
+        if etag_matches(request, etag):
+            return Response(
+                status_code=304,
+                headers={"ETag": etag, "Cache-Control": "private, max-age=2"}
+            )
     
     # Find the card
-    result = await db.execute(
-        select(Card).where(Card.id == card_uuid)
-    )
+    result = await db.execute(_GET_CARD_STMT, {"cid": card_uuid})
     card = result.scalar_one_or_none()
     
     if not card:
         raise HTTPException(status_code=404, detail="Card not found")
     
+    response.headers["ETag"] = _card_etag(
+        card.updated_at, card.upvote, card.status, card.number_of_requests
+    )
+    response.headers["Cache-Control"] = "private, max-age=2"
+    
     return card
 
 
 @router.get("/cards/{card_id}/comments", response_model=List[CardPromptCommentResponse])
 async def get_card_comments(
     card_id: str,
-    db: AsyncSession = Depends(get_db)
+    db: AsyncSession = Depends(get_db_ro)
 ):
     """Get all prompts and comments for a specific card"""
-    try:
-        card_uuid = UUID(card_id)
-    except ValueError:
-        raise HTTPException(status_code=400, detail="Invalid card ID format")
+    card_uuid = _parse_uuid(card_id, "Invalid card ID format")
     
-    # Verify card exists
-    card_result = await db.execute(
-        select(Card).where(Card.id == card_uuid)
+    # Card existence and its prompts/comments in one query: a card without
+    # comments yields a single row with a NULL comment
+    result = await db.execute(
+        select(Card.id, CardPromptComment)
+        .outerjoin(CardPromptComment, CardPromptComment.card_id == Card.id)
+        .where(Card.id == card_uuid)
     )
-    card = card_result.scalar_one_or_none()
+    rows = result.all()
     
-    if not card:
+    if not rows:
         raise HTTPException(status_code=404, detail="Card not found")
     
-    # Get all prompts and comments for this card
-    result = await db.execute(
-        select(CardPromptComment).where(CardPromptComment.card_id == card_uuid)
-    )
-    comments = result.scalars().all()
+    comments = [comment for _, comment in rows if comment is not None]
     
     return comments
 
@@ -100,25 +181,21 @@ async def drop_card(
     db: AsyncSession = Depends(get_db)
 ):
     """Delete a card from the database"""
-    try:
-        card_uuid = UUID(request.card_id)
-    except ValueError:
-        raise HTTPException(status_code=400, detail="Invalid card ID format")
+    card_uuid = _parse_uuid(request.card_id, "Invalid card ID format")
     
-    # Find the card
+    # Delete the card, returning its title (single round trip)
     result = await db.execute(
-        select(Card).where(Card.id == card_uuid)
+        delete(Card).where(Card.id == card_uuid).returning(Card.title)
     )
-    card = result.scalar_one_or_none()
+    title = result.scalar_one_or_none()
     
-    if not card:
+    if title is None:
         raise HTTPException(status_code=404, detail="Card not found")
     
-    # Delete the card
-    await db.delete(card)
     await db.commit()
+    cards_list_cache.invalidate()
     
-    return MessageResponse(message=f"Card '{card.title}' deleted successfully")
+    return MessageResponse(message=f"Card '{title}' deleted successfully")
 
 
 @router.post("/cards/toggle-status", response_model=CardResponse)
@@ -127,25 +204,22 @@ async def toggle_card_status(
     db: AsyncSession = Depends(get_db)
 ):
     """Toggle card status between 0 (not completed) and 1 (completed)"""
-    try:
-        card_uuid = UUID(request.card_id)
-    except ValueError:
-        raise HTTPException(status_code=400, detail="Invalid card ID format")
+    card_uuid = _parse_uuid(request.card_id, "Invalid card ID format")
     
-    # Find the card
+    # Toggle status between 0 and 1 in place, returning the updated card
     result = await db.execute(
-        select(Card).where(Card.id == card_uuid)
+        update(Card)
+        .where(Card.id == card_uuid)
+        .values(status=case((Card.status == 0, 1), else_=0))
+        .returning(Card)
     )
     card = result.scalar_one_or_none()
     
     if not card:
         raise HTTPException(status_code=404, detail="Card not found")
     
-    # Toggle status between 0 and 1
-    card.status = 1 if card.status == 0 else 0
-    
     await db.commit()
-    await db.refresh(card)
+    cards_list_cache.invalidate()
     
     return card
 
@@ -156,25 +230,22 @@ async def upvote_card(
     db: AsyncSession = Depends(get_db)
 ):
     """Increment the upvote count (number_of_requests) for a card"""
-    try:
-        card_uuid = UUID(request.card_id)
-    except ValueError:
-        raise HTTPException(status_code=400, detail="Invalid card ID format")
+    card_uuid = _parse_uuid(request.card_id, "Invalid card ID format")
     
-    # Find the card
+    # Increment upvote count in place (initialize to 0 if None)
     result = await db.execute(
-        select(Card).where(Card.id == card_uuid)
+        update(Card)
+        .where(Card.id == card_uuid)
+        .values(upvote=func.coalesce(Card.upvote, 0) + 1)
+        .returning(Card)
     )
     card = result.scalar_one_or_none()
     
     if not card:
         raise HTTPException(status_code=404, detail="Card not found")
     
-    # Increment upvote count (initialize to 0 if None)
-    card.upvote = (card.upvote or 0) + 1
-    
     await db.commit()
-    await db.refresh(card)
+    cards_list_cache.invalidate()
     
     return card
 
@@ -185,17 +256,10 @@ async def create_card_comment(
     db: AsyncSession = Depends(get_db)
 ):
     """Create a comment on a Bexio-created card"""
-    from uuid import uuid4
-    
-    try:
-        card_uuid = UUID(request.card_id)
-    except ValueError:
-        raise HTTPException(status_code=400, detail="Invalid card ID format")
+    card_uuid = _parse_uuid(request.card_id, "Invalid card ID format")
     
     # Find the card
-    result = await db.execute(
-        select(Card).where(Card.id == card_uuid)
-    )
+    result = await db.execute(_GET_CARD_STMT, {"cid": card_uuid})
     card = result.scalar_one_or_none()
     
     if not card:
@@ -230,25 +294,21 @@ async def upvote_comment(
     db: AsyncSession = Depends(get_db)
 ):
     """Increment the upvote count for a comment"""
-    try:
-        comment_uuid = UUID(request.comment_id)
-    except ValueError:
-        raise HTTPException(status_code=400, detail="Invalid comment ID format")
+    comment_uuid = _parse_uuid(request.comment_id, "Invalid comment ID format")
     
-    # Find the comment
+    # Increment upvote count in place (concurrent upvotes are not lost)
     result = await db.execute(
-        select(CardPromptComment).where(CardPromptComment.id == comment_uuid)
+        update(CardPromptComment)
+        .where(CardPromptComment.id == comment_uuid)
+        .values(upvotes=func.coalesce(CardPromptComment.upvotes, 0) + 1)
+        .returning(CardPromptComment)
     )
     comment = result.scalar_one_or_none()
     
     if not comment:
         raise HTTPException(status_code=404, detail="Comment not found")
     
-    # Increment upvote count
-    comment.upvotes = (comment.upvotes or 0) + 1
-    
     await db.commit()
-    await db.refresh(comment)
     
     return comment
 
@@ -259,16 +319,11 @@ async def increment_application_click(
     db: AsyncSession = Depends(get_db)
 ):
     """Record a click for an application (for analytics and statistics)"""
-    try:
-        app_uuid = UUID(request.app_id)
-    except ValueError:
-        raise HTTPException(status_code=400, detail="Invalid application ID format")
+    app_uuid = _parse_uuid(request.app_id, "Invalid application ID format")
     
     # Verify application exists
-    result = await db.execute(
-        select(Application).where(Application.id == app_uuid)
-    )
-    app = result.scalar_one_or_none()
+    result = await db.execute(_GET_APPLICATION_STMT, {"app_id": app_uuid})
+    app = result.one_or_none()
     
     if not app:
         raise HTTPException(status_code=404, detail="Application not found")
@@ -277,7 +332,6 @@ async def increment_application_click(
     new_click = ApplicationClick(app_id=app_uuid)
     db.add(new_click)
     await db.commit()
-    await db.refresh(app)
     
     return app
 
@@ -285,49 +339,47 @@ async def increment_application_click(
 @router.get("/application/clicks/stats", response_model=List[ClickStatsResponse])
 async def get_click_statistics(
     category: str = None,
-    db: AsyncSession = Depends(get_db)
+    db: AsyncSession = Depends(get_db_ro)
 ):
     """Get click statistics for applications, optionally filtered by category"""
-    from sqlalchemy import func
+    # Tags aggregated per application in a correlated subquery, so they come
+    # back with the counts
+    tags_subquery = (
+        select(func.array_agg(AppTag.tag))
+        .where(AppTag.app_id == Application.id)
+        .correlate(Application)
+        .scalar_subquery()
+    )
     
-    # Base query to count clicks per application
+    # Click totals come from the trigger-maintained counter table (one row
+    # per application) instead of counting the raw clicks
     query = select(
         Application.id,
         Application.name,
-        func.count(ApplicationClick.id).label('click_count')
+        func.coalesce(ApplicationClickCounter.click_count, 0).label('click_count'),
+        tags_subquery.label('tags')
     ).outerjoin(
-        ApplicationClick, Application.id == ApplicationClick.app_id
+        ApplicationClickCounter, Application.id == ApplicationClickCounter.app_id
     )
     
-    # If category filter is provided, join with AppTag
+    # If category filter is provided, keep only apps with that tag
     if category:
-        query = query.join(
-            AppTag, Application.id == AppTag.app_id
-        ).where(
-            AppTag.tag == category
+        query = query.where(
+            Application.id.in_(select(AppTag.app_id).where(AppTag.tag == category))
         )
     
-    # Group by application
-    query = query.group_by(Application.id, Application.name)
-    
     result = await db.execute(query)
     stats = result.all()
     
-    # Fetch tags for each app
-    response_data = []
-    for app_id, app_name, click_count in stats:
-        # Get tags for this app
-        tags_result = await db.execute(
-            select(AppTag.tag).where(AppTag.app_id == app_id)
-        )
-        tags = [tag[0] for tag in tags_result.all()]
-        
-        response_data.append(ClickStatsResponse(
+    response_data = [
+        ClickStatsResponse(
             app_id=str(app_id),
             app_name=app_name,
             click_count=click_count,
-            tags=tags
-        ))
+            tags=tags or []
+        )
+        for app_id, app_name, click_count, tags in stats
+    ]
     
     return response_data
 
@@ -335,41 +387,45 @@ async def get_click_statistics(
 @router.get("/application/clicks/category-analytics", response_model=CategoryAnalyticsResponse)
 async def get_category_analytics(
     category: str = None,
-    db: AsyncSession = Depends(get_db)
+    db: AsyncSession = Depends(get_db_ro)
 ):
     """Get click analytics showing percentage of clicks from a specific category"""
-    from sqlalchemy import func
-    
-    # Get total clicks across all applications
-    total_clicks_result = await db.execute(
-        select(func.count(ApplicationClick.id))
-    )
-    total_clicks = total_clicks_result.scalar() or 0
+    # Total and category clicks summed in a single pass over the per-app
+    # counter table (SUM ... FILTER); the app count is a scalar subquery
+    total_clicks_column = func.coalesce(func.sum(ApplicationClickCounter.click_count), 0)
     
     if category:
-        # Get clicks for apps in the specified category
-        category_clicks_result = await db.execute(
-            select(func.count(ApplicationClick.id))
-            .join(Application, ApplicationClick.app_id == Application.id)
-            .join(AppTag, Application.id == AppTag.app_id)
-            .where(AppTag.tag == category)
+        category_app_ids = select(AppTag.app_id).where(AppTag.tag == category)
+        category_clicks_column = func.coalesce(
+            func.sum(ApplicationClickCounter.click_count).filter(
+                ApplicationClickCounter.app_id.in_(category_app_ids)
+            ),
+            0
         )
-        category_clicks = category_clicks_result.scalar() or 0
         
-        # Get count of apps in this category
-        app_count_result = await db.execute(
-            select(func.count(func.distinct(Application.id)))
-            .join(AppTag, Application.id == AppTag.app_id)
+        # Count of apps in this category (index-only on apps_tags(tag, app_id))
+        app_count_subquery = (
+            select(func.count(func.distinct(AppTag.app_id)))
             .where(AppTag.tag == category)
+            .scalar_subquery()
         )
-        app_count = app_count_result.scalar() or 0
     else:
         # If no category specified, category_clicks = total_clicks
-        category_clicks = total_clicks
-        app_count_result = await db.execute(
-            select(func.count(Application.id))
+        category_clicks_column = total_clicks_column
+        app_count_subquery = select(func.count(Application.id)).scalar_subquery()
+    
+    # SUM over BIGINT is NUMERIC in Postgres; cast back to integers
+    result = await db.execute(
+        select(
+            cast(total_clicks_column, BigInteger).label('total_clicks'),
+            cast(category_clicks_column, BigInteger).label('category_clicks'),
+            app_count_subquery.label('app_count')
         )
-        app_count = app_count_result.scalar() or 0
+    )
+    total_clicks, category_clicks, app_count = result.one()
+    total_clicks = total_clicks or 0
+    category_clicks = category_clicks or 0
+    app_count = app_count or 0
     
     # Calculate percentage
     percentage = (category_clicks / total_clicks * 100) if total_clicks > 0 else 0.0
@@ -386,32 +442,54 @@ async def get_category_analytics(
 @router.get("/application/clicks/top-categories", response_model=TopCategoriesResponse)
 async def get_top_clicked_categories(
     limit: int = 5,
-    db: AsyncSession = Depends(get_db)
+    db: AsyncSession = Depends(get_db_ro)
 ):
     """Get top N categories by click count with percentages for graphing"""
-    from sqlalchemy import func
-    
-    # Get total clicks
-    total_clicks_result = await db.execute(
-        select(func.count(ApplicationClick.id))
+    # Totals come from the trigger-maintained per-app counter table
+    category_click_count = cast(
+        func.coalesce(func.sum(ApplicationClickCounter.click_count), 0),
+        BigInteger
     )
-    total_clicks = total_clicks_result.scalar() or 0
     
-    # Get clicks per category with app counts
-    category_stats_result = await db.execute(
+    # Total clicks
+    total_subquery = select(
+        cast(func.coalesce(func.sum(ApplicationClickCounter.click_count), 0), BigInteger).label('total_clicks')
+    ).subquery()
+    
+    # Clicks per category with app counts
+    category_subquery = (
         select(
             AppTag.tag,
-            func.count(ApplicationClick.id).label('click_count'),
-            func.count(func.distinct(Application.id)).label('app_count')
+            category_click_count.label('click_count'),
+            func.count(func.distinct(AppTag.app_id)).label('app_count')
         )
-        .join(Application, AppTag.app_id == Application.id)
-        .outerjoin(ApplicationClick, Application.id == ApplicationClick.app_id)
+        .outerjoin(ApplicationClickCounter, AppTag.app_id == ApplicationClickCounter.app_id)
         .group_by(AppTag.tag)
-        .order_by(func.count(ApplicationClick.id).desc())
+        .order_by(category_click_count.desc())
         .limit(limit)
+        .subquery()
     )
     
-    category_stats = category_stats_result.all()
+    # One statement: the single total row LEFT JOINed to the top categories
+    # (a row with NULL category when there are no categories at all)
+    result = await db.execute(
+        select(
+            total_subquery.c.total_clicks,
+            category_subquery.c.tag,
+            category_subquery.c.click_count,
+            category_subquery.c.app_count
+        )
+        .select_from(total_subquery.outerjoin(category_subquery, true()))
+        .order_by(category_subquery.c.click_count.desc())
+    )
+    rows = result.all()
+    
+    total_clicks = (rows[0].total_clicks if rows else 0) or 0
+    category_stats = [
+        (row.tag, row.click_count, row.app_count)
+        for row in rows
+        if row.tag is not None
+    ]
     
     # Build response with percentages
     categories = []
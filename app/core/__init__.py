@@ -2,14 +2,33 @@
 Core module for configuration and database
 """
 from .config import settings
-from .database import Base, get_db, init_db, close_db, engine, AsyncSessionLocal
+from .database import (
+    Base,
+    get_db,
+    get_db_ro,
+    init_db,
+    close_db,
+    engine,
+    AsyncSessionLocal,
+    AsyncReadOnlySessionLocal,
+    init_asyncpg_pool,
+    get_asyncpg_pool,
+)
+from .errors import ExternalServiceError, OpenAIServiceError, EmbeddingError
 
 __all__ = [
     "settings",
     "Base",
     "get_db",
+    "get_db_ro",
     "init_db",
     "close_db",
     "engine",
     "AsyncSessionLocal",
+    "AsyncReadOnlySessionLocal",
+    "init_asyncpg_pool",
+    "get_asyncpg_pool",
+    "ExternalServiceError",
+    "OpenAIServiceError",
+    "EmbeddingError",
 ]
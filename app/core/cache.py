@@ -0,0 +1,118 @@
+"""
+In-process caching helpers
+"""
+import asyncio
+import time
+from collections import OrderedDict
+from typing import Any, Awaitable, Callable, Dict, Hashable, Tuple
+
+_MISSING = object()
+
+
+class TTLCache:
+    """
+    Small LRU cache whose entries expire after a fixed time-to-live.
+
+    Not thread-safe; intended for use from the asyncio event loop.
+
+    Args:
+        maxsize: Maximum number of entries kept (least recently used evicted first)
+        ttl: Time-to-live of each entry in seconds
+    """
+
+    def __init__(self, maxsize: int, ttl: float):
+        self.maxsize = maxsize
+        self.ttl = ttl
+        self._data: "OrderedDict[Hashable, Tuple[float, Any]]" = OrderedDict()
+
+    def get(self, key: Hashable, default: Any = None) -> Any:
+        item = self._data.get(key, _MISSING)
+        if item is _MISSING:
+            return default
+
+        expires_at, value = item
+        if expires_at < time.monotonic():
+            del self._data[key]
+            return default
+
+        self._data.move_to_end(key)
+        return value
+
+    def set(self, key: Hashable, value: Any) -> None:
+        self._data[key] = (time.monotonic() + self.ttl, value)
+        self._data.move_to_end(key)
+        while len(self._data) > self.maxsize:
+            self._data.popitem(last=False)
+
+    def pop(self, key: Hashable, default: Any = None) -> Any:
+        item = self._data.pop(key, _MISSING)
+        return default if item is _MISSING else item[1]
+
+    def clear(self) -> None:
+        self._data.clear()
+
+    def __len__(self) -> int:
+        return len(self._data)
+
+
+class _LeaderCancelled(Exception):
+    """The caller running a shared call was cancelled before it finished"""
+
+
+class SingleFlight:
+    """
+    Coalesces concurrent calls that share the same key.
+
+    While a call for a key is in flight, later callers with the same key
+    wait for it and receive its result (or exception) instead of repeating
+    the work. If the caller running the call is cancelled (e.g. its client
+    disconnected), one of the waiters takes over and runs its own fn.
+    """
+
+    def __init__(self):
+        self._calls: Dict[Hashable, asyncio.Future] = {}
+
+    async def do(
+        self,
+        key: Hashable,
+        fn: Callable[[], Awaitable[Any]]
+    ) -> Tuple[Any, bool]:
+        """
+        Run fn once per key among concurrent callers.
+
+        Args:
+            key: Deduplication key
+            fn: Zero-argument coroutine function doing the actual work
+
+        Returns:
+            Tuple of (result, shared) where shared is True when the result
+            came from another caller's in-flight call
+        """
+        future = self._calls.get(key)
+        while future is not None:
+            try:
+                # shield: a cancelled waiter must not cancel the shared call
+                return await asyncio.shield(future), True
+            except _LeaderCancelled:
+                # The first waiter to wake up becomes the new leader
+                future = self._calls.get(key)
+
+        future = asyncio.get_running_loop().create_future()
+        self._calls[key] = future
+        try:
+            result = await fn()
+        except asyncio.CancelledError:
+            # Waiters retry instead of failing with the leader's cancellation
+            future.set_exception(_LeaderCancelled())
+            future.exception()
+            raise
+        except Exception as e:
+            future.set_exception(e)
+            # Mark as retrieved so a caller without waiters logs no warning
+            future.exception()
+            raise
+        else:
+            future.set_result(result)
+            return result, False
+        finally:
+            self._calls.pop(key, None)
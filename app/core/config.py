@@ -17,9 +17,24 @@ class Settings(BaseSettings):
     
     # Database
     database_url: str
+    # SQLAlchemy pool: size for the expected in-flight DB work per worker,
+    # and a short timeout so saturation fails fast instead of queueing
+    db_pool_size: int = 20
+    db_max_overflow: int = 10
+    db_pool_timeout: float = 5.0
+    db_pool_recycle: int = 1800
+    # Raw asyncpg pool for matching: kept warm so requests never pay the
+    # connection handshake
+    asyncpg_pool_min_size: int = 5
+    asyncpg_pool_max_size: int = 20
     
     # OpenAI
     openai_api_key: str
+    # Concurrent OpenAI requests per worker (also the HTTP connection limit)
+    openai_max_concurrency: int = 64
+    # Retries of rate-limited (429), timed-out, connection and 5xx errors,
+    # with exponential backoff and jitter, honouring Retry-After
+    openai_max_retries: int = 4
     
     # Tavily Search API
     tavily_api_key: str
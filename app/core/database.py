@@ -1,6 +1,10 @@
 """
 Database Configuration and Connection
 """
+from typing import Optional
+
+import asyncpg
+from pgvector.asyncpg import register_vector
 from sqlalchemy.ext.asyncio import AsyncSession, create_async_engine, async_sessionmaker
 from sqlalchemy.orm import declarative_base
 from app.core.config import settings
@@ -14,8 +18,10 @@ engine = create_async_engine(
     echo=settings.debug,
     future=True,
     pool_pre_ping=True,
-    pool_size=10,
-    max_overflow=20,
+    pool_size=settings.db_pool_size,
+    max_overflow=settings.db_max_overflow,
+    pool_timeout=settings.db_pool_timeout,
+    pool_recycle=settings.db_pool_recycle,
 )
 
 # Create async session factory
@@ -27,9 +33,23 @@ AsyncSessionLocal = async_sessionmaker(
     autoflush=False,
 )
 
+# Read-only sessions for endpoints that never write: same pool, but every
+# transaction is opened READ ONLY and is never committed
+read_only_engine = engine.execution_options(postgresql_readonly=True)
+AsyncReadOnlySessionLocal = async_sessionmaker(
+    read_only_engine,
+    class_=AsyncSession,
+    expire_on_commit=False,
+    autocommit=False,
+    autoflush=False,
+)
+
 # Base class for models
 Base = declarative_base()
 
+# Raw asyncpg pool for the pgvector matching queries (created in app lifespan)
+asyncpg_pool: Optional[asyncpg.Pool] = None
+
 
 async def get_db() -> AsyncSession:
     """
@@ -50,6 +70,49 @@ async def get_db() -> AsyncSession:
             await session.close()
 
 
+async def get_db_ro() -> AsyncSession:
+    """
+    Dependency for getting read-only async database sessions
+    
+    Use for endpoints that only read; nothing is committed (closing the
+    session ends the read-only transaction).
+    
+    Usage in FastAPI endpoints:
+        async def my_endpoint(db: AsyncSession = Depends(get_db_ro)):
+            ...
+    """
+    async with AsyncReadOnlySessionLocal() as session:
+        yield session
+
+
+async def init_asyncpg_pool() -> asyncpg.Pool:
+    """Create the shared asyncpg pool (idempotent)"""
+    global asyncpg_pool
+    if asyncpg_pool is None:
+        asyncpg_pool = await asyncpg.create_pool(
+            settings.database_url,
+            min_size=settings.asyncpg_pool_min_size,
+            max_size=settings.asyncpg_pool_max_size,
+            # Binary pgvector codec: embeddings are sent as float32 arrays
+            init=register_vector,
+        )
+    return asyncpg_pool
+
+
+async def get_asyncpg_pool() -> asyncpg.Pool:
+    """
+    Dependency for getting the shared asyncpg pool
+    
+    Usage in FastAPI endpoints:
+        async def my_endpoint(pool: asyncpg.Pool = Depends(get_asyncpg_pool)):
+            async with pool.acquire() as conn:
+                ...
+    """
+    if asyncpg_pool is None:
+        return await init_asyncpg_pool()
+    return asyncpg_pool
+
+
 async def init_db():
     """Initialize database - Create all tables"""
     async with engine.begin() as conn:
@@ -57,5 +120,9 @@ async def init_db():
 
 
 async def close_db():
-    """Close database connection"""
+    """Close database connections (SQLAlchemy engine and asyncpg pool)"""
+    global asyncpg_pool
     await engine.dispose()
+    if asyncpg_pool is not None:
+        await asyncpg_pool.close()
+        asyncpg_pool = None
@@ -0,0 +1,19 @@
+"""
+Application Errors
+Typed exceptions for failures of external services.
+"""
+
+
+class ExternalServiceError(Exception):
+    """Raised when an external dependency fails (returned to clients as 502)"""
+    pass
+
+
+class OpenAIServiceError(ExternalServiceError):
+    """Raised when a call to the OpenAI API fails"""
+    pass
+
+
+class EmbeddingError(OpenAIServiceError):
+    """Raised when generating an embedding fails"""
+    pass
@@ -0,0 +1,88 @@
+"""
+HTTP caching helpers for list endpoints
+"""
+import hashlib
+from typing import Hashable, Optional, Tuple
+
+from fastapi import Request, Response
+
+from app.core.cache import TTLCache
+
+
+class ResponseCache:
+    """
+    Short-lived cache of serialized responses, invalidated on writes.
+
+    Entries are stored under the cache version current when the data was
+    read, so a response computed before an invalidate() is never served
+    after it.
+
+    Args:
+        maxsize: Maximum number of cached responses
+        ttl: Time-to-live of each response in seconds
+    """
+
+    def __init__(self, maxsize: int, ttl: float):
+        self._cache = TTLCache(maxsize=maxsize, ttl=ttl)
+        self.version = 0
+
+    def get(self, key: Hashable) -> Optional[Tuple[str, bytes]]:
+        """Return (etag, body) for key, or None on a miss"""
+        return self._cache.get((self.version, key))
+
+    def set(self, key: Hashable, body: bytes, version: int) -> Tuple[str, bytes]:
+        """Store body for key as read at version, returning (etag, body)"""
+        entry = (compute_etag(body), body)
+        if version == self.version:
+            self._cache.set((version, key), entry)
+        return entry
+
+    def invalidate(self) -> None:
+        """Drop all cached responses (call after any write)"""
+        self.version += 1
+        self._cache.clear()
+
+
+def compute_etag(body: bytes) -> str:
+    """Strong ETag from the response body"""
+    return f'"{hashlib.blake2b(body, digest_size=16).hexdigest()}"'
+
+
+def etag_matches(request: Request, etag: str) -> bool:
+    """Whether the request's If-None-Match header matches etag"""
+    header = request.headers.get("if-none-match")
+    if not header:
+        return False
+    if header.strip() == "*":
+        return True
+    candidates = (value.strip() for value in header.split(","))
+    return any(value.removeprefix("W/") == etag for value in candidates)
+
+
+def cached_json_response(
+    request: Request,
+    etag: str,
+    body: bytes,
+    max_age: int = 10
+) -> Response:
+    """
+    Build a JSON response with caching headers, or a 304 if the client's copy is current.
+
+    Args:
+        request: Incoming request (for If-None-Match)
+        etag: ETag of body
+        body: Serialized JSON body
+        max_age: Seconds clients may reuse the response
+
+    Returns:
+        Response with ETag and Cache-Control headers
+    """
+    headers = {"ETag": etag, "Cache-Control": f"public, max-age={max_age}"}
+    if etag_matches(request, etag):
+        return Response(status_code=304, headers=headers)
+    return Response(content=body, media_type="application/json", headers=headers)
+
+
+# Shared caches for the list endpoints; writers call invalidate()
+cards_list_cache = ResponseCache(maxsize=256, ttl=15)
+application_links_cache = ResponseCache(maxsize=256, ttl=15)
@@ -1,11 +1,93 @@
 """
 OpenAI Client Configuration
 """
-from openai import AsyncOpenAI
+import asyncio
+import hashlib
+import re
+from typing import AsyncIterator, Dict, List, Set, Tuple
+
+import httpx
+from openai import AsyncOpenAI, BadRequestError
+from app.core.cache import TTLCache
 from app.core.config import settings
+from app.core.errors import EmbeddingError, OpenAIServiceError
+
+# Initialize OpenAI client over one explicitly pooled HTTP client, so
+# connections to the API are reused up to the concurrency limit. Transient
+# failures are retried by the SDK (exponential backoff with jitter, capped
+# by the server's Retry-After) before surfacing as OpenAIServiceError.
+client = AsyncOpenAI(
+    api_key=settings.openai_api_key,
+    max_retries=settings.openai_max_retries,
+    http_client=httpx.AsyncClient(
+        limits=httpx.Limits(
+            max_connections=settings.openai_max_concurrency,
+            max_keepalive_connections=settings.openai_max_concurrency,
+            keepalive_expiry=60.0
+        )
+    )
+)
+
+# Bounds in-flight OpenAI requests; wrap every client call with
+# "async with openai_semaphore:" so bursts queue here instead of failing
+# with connection errors
+openai_semaphore = asyncio.Semaphore(settings.openai_max_concurrency)
+
+# Embedding microbatching: texts requested within the window are sent together
+EMBEDDING_BATCH_SIZE = 100
+EMBEDDING_BATCH_WINDOW_SECONDS = 0.01
+
+# English normalizations keyed by content hash; backlog matching normalizes
+# the same card prompts over and over
+NORMALIZATION_TTL_SECONDS = 24 * 3600
+_normalized_texts = TTLCache(maxsize=10_000, ttl=NORMALIZATION_TTL_SECONDS)
+
+# Local language check so English input skips the translation call. Function
+# words are the most reliable short-text signal; the non-English list covers
+# German, French, Italian and Spanish, and words shared between the languages
+# (a, in, die, ...) are left out of both lists.
+_WORD_RE = re.compile(r"[^\W\d_]+(?:'[^\W\d_]+)?")
+_ENGLISH_WORDS = frozenset("""
+    the and of to is are was were be been for with that this these those it its
+    we our you your they their he she not but or from by at as have has had do
+    does can could would should will which who what when where how if then than
+    into about also only all any some more most other such need needs want wants
+    looking tool using use my me i an on
+""".split())
+_OTHER_WORDS = frozenset("""
+    der das und ist sind nicht mit für ein eine einen einem einer wir ich sie es
+    auf den dem des von zu zum zur auch oder aber wie bei nach unsere unser kein
+    le la les et est sont une pour avec dans du des nous vous pas qui que sur au
+    aux ce cette mais ou il elle je notre
+    il lo gli le della delle dei degli per con che non sono è una uno nel nella
+    anche ma noi voi questo questa
+    el los las y de en para por mi del se lo como al un su sus es son muy sin
+    tengo necesito nuestra nuestros
+""".split()) - _ENGLISH_WORDS
+MIN_WORDS_FOR_DETECTION = 4
+MIN_ENGLISH_WORD_SHARE = 0.15
+
 
-# Initialize OpenAI client
-client = AsyncOpenAI(api_key=settings.openai_api_key)
+def looks_english(text: str) -> bool:
+    """
+    Conservative local check whether text is English.
+    
+    Only returns True when English function words clearly dominate; short or
+    mixed texts return False and go through the translation model.
+    
+    Args:
+        text: Input text
+    
+    Returns:
+        True if the text can be used as English without translation
+    """
+    words = _WORD_RE.findall(text.lower())
+    if len(words) < MIN_WORDS_FOR_DETECTION:
+        return False
+    
+    english = sum(1 for word in words if word in _ENGLISH_WORDS)
+    other = sum(1 for word in words if word in _OTHER_WORDS)
+    return english >= MIN_ENGLISH_WORD_SHARE * len(words) and english >= 4 * other
 
 
 async def get_chat_completion(
@@ -34,36 +116,155 @@ async def get_chat_completion(
         response = await get_chat_completion(messages)
     """
     try:
-        response = await client.chat.completions.create(
-            model=model,
-            messages=messages,
-            temperature=temperature,
-            max_tokens=max_tokens
-        )
+        async with openai_semaphore:
+            response = await client.chat.completions.create(
+                model=model,
+                messages=messages,
+                temperature=temperature,
+                max_tokens=max_tokens
+            )
         return response.choices[0].message.content
     except Exception as e:
-        raise Exception(f"Error calling OpenAI API: {str(e)}")
+        raise OpenAIServiceError(f"Error calling OpenAI API: {str(e)}") from e
+
+
+async def stream_chat_completion(
+    messages: list,
+    model: str = "gpt-4o-mini",
+    temperature: float = 0.7,
+    max_tokens: int = 1000
+) -> AsyncIterator[str]:
+    """
+    Stream a chat completion from OpenAI, yielding text deltas as they arrive
+    
+    Args:
+        messages: List of message dicts with 'role' and 'content'
+        model: Model to use (gpt-4o, gpt-4o-mini, gpt-3.5-turbo, etc.)
+        temperature: Sampling temperature (0-2)
+        max_tokens: Maximum tokens to generate
+        
+    Yields:
+        str: Generated text fragments in order
+    """
+    try:
+        # The slot only covers opening the stream: holding it while a slow
+        # client reads would block every other OpenAI call
+        async with openai_semaphore:
+            stream = await client.chat.completions.create(
+                model=model,
+                messages=messages,
+                temperature=temperature,
+                max_tokens=max_tokens,
+                stream=True
+            )
+        # Closing the stream releases its connection, also when the client
+        # disconnects and this generator is closed early
+        async with stream:
+            async for chunk in stream:
+                if chunk.choices and chunk.choices[0].delta.content:
+                    yield chunk.choices[0].delta.content
+    except Exception as e:
+        raise OpenAIServiceError(f"Error calling OpenAI API: {str(e)}") from e
+
+
+class _EmbeddingBatcher:
+    """
+    Coalesces concurrent embedding requests into batched API calls.
+    
+    Texts are queued per model and flushed as one embeddings.create call when
+    the batch is full or the window elapses; each caller awaits its own future.
+    """
+    
+    def __init__(self, max_batch: int, window: float):
+        self.max_batch = max_batch
+        self.window = window
+        self._pending: Dict[str, List[Tuple[str, asyncio.Future]]] = {}
+        self._timers: Dict[str, asyncio.TimerHandle] = {}
+        self._tasks: Set[asyncio.Task] = set()
+    
+    async def embed(self, text: str, model: str) -> List[float]:
+        loop = asyncio.get_running_loop()
+        future = loop.create_future()
+        
+        queue = self._pending.setdefault(model, [])
+        queue.append((text, future))
+        
+        if len(queue) >= self.max_batch:
+            self._flush(model)
+        elif len(queue) == 1:
+            self._timers[model] = loop.call_later(self.window, self._flush, model)
+        
+        return await future
+    
+    def _flush(self, model: str) -> None:
+        timer = self._timers.pop(model, None)
+        if timer is not None:
+            timer.cancel()
+        
+        batch = self._pending.pop(model, None)
+        if batch:
+            # Keep a reference so the task is not garbage collected mid-flight
+            task = asyncio.get_running_loop().create_task(self._send(model, batch))
+            self._tasks.add(task)
+            task.add_done_callback(self._tasks.discard)
+    
+    async def _send(self, model: str, batch: List[Tuple[str, asyncio.Future]]) -> None:
+        try:
+            async with openai_semaphore:
+                response = await client.embeddings.create(
+                    model=model,
+                    input=[text for text, _ in batch]
+                )
+        except BadRequestError as e:
+            if len(batch) > 1:
+                # One invalid input rejects the whole batch; retry individually
+                for item in batch:
+                    await self._send(model, [item])
+                return
+            self._fail(batch, e)
+            return
+        except Exception as e:
+            self._fail(batch, e)
+            return
+        
+        for item in response.data:
+            future = batch[item.index][1]
+            if not future.done():
+                future.set_result(item.embedding)
+    
+    @staticmethod
+    def _fail(batch: List[Tuple[str, asyncio.Future]], error: Exception) -> None:
+        for _, future in batch:
+            if not future.done():
+                future.set_exception(EmbeddingError(f"Error getting embedding: {str(error)}"))
+
+
+_embedding_batcher = _EmbeddingBatcher(EMBEDDING_BATCH_SIZE, EMBEDDING_BATCH_WINDOW_SECONDS)
 
 
 async def get_embedding(text: str, model: str = "text-embedding-3-small"):
     """
     Get an embedding from OpenAI
     
+    Concurrent calls are batched into a single API request (up to
+    EMBEDDING_BATCH_SIZE texts within EMBEDDING_BATCH_WINDOW_SECONDS).
+    
     Args:
         text: Text to embed
         model: Embedding model to use
         
     Returns:
         list: The embedding vector
+        
+    Raises:
+        EmbeddingError: If the embedding request fails
     """
-    try:
-        response = await client.embeddings.create(
-            model=model,
-            input=text
-        )
-        return response.data[0].embedding
-    except Exception as e:
-        raise Exception(f"Error getting embedding: {str(e)}")
+    return await _embedding_batcher.embed(text, model)
+
+
+async def close_openai_client() -> None:
+    """Close the OpenAI client's HTTP connections (call on application shutdown)"""
+    await client.close()
 
 
 async def create_image(
@@ -85,22 +286,25 @@ async def create_image(
         list: URLs of generated images
     """
     try:
-        response = await client.images.generate(
-            model="dall-e-3",
-            prompt=prompt,
-            size=size,
-            quality=quality,
-            n=n
-        )
+        async with openai_semaphore:
+            response = await client.images.generate(
+                model="dall-e-3",
+                prompt=prompt,
+                size=size,
+                quality=quality,
+                n=n
+            )
         return [image.url for image in response.data]
     except Exception as e:
-        raise Exception(f"Error generating image: {str(e)}")
+        raise OpenAIServiceError(f"Error generating image: {str(e)}") from e
 
 
 async def normalize_to_english(text: str) -> str:
     """
     Normalize text to English using translation if needed.
-    If text is already in English, returns it unchanged.
+    If text is already in English, returns it unchanged; clearly English text
+    is recognized locally (looks_english) without calling the model.
+    Results are cached by content hash.
     
     Args:
         text: Input text in any language
@@ -108,6 +312,16 @@ async def normalize_to_english(text: str) -> str:
     Returns:
         Text in English
     """
+    key = hashlib.sha256(text.encode("utf-8")).digest()
+    cached = _normalized_texts.get(key)
+    if cached is not None:
+        return cached
+    
+    if looks_english(text):
+        normalized = text.strip()
+        _normalized_texts.set(key, normalized)
+        return normalized
+    
     try:
         messages = [
             {
@@ -120,14 +334,18 @@ async def normalize_to_english(text: str) -> str:
             }
         ]
         
-        response = await client.chat.completions.create(
-            model="gpt-4o-mini",
-            messages=messages,
-            temperature=0.3,
-            max_tokens=500
-        )
+        async with openai_semaphore:
+            response = await client.chat.completions.create(
+                model="gpt-4o-mini",
+                messages=messages,
+                temperature=0.3,
+                max_tokens=500
+            )
         
-        return response.choices[0].message.content.strip()
+        normalized = response.choices[0].message.content.strip()
     
     except Exception as e:
-        raise Exception(f"Error normalizing text to English: {str(e)}")
+        raise OpenAIServiceError(f"Error normalizing text to English: {str(e)}") from e
+    
+    _normalized_texts.set(key, normalized)
+    return normalized
@@ -1,13 +1,17 @@
 """
 Main FastAPI Application
 """
-from fastapi import FastAPI
+from fastapi import FastAPI, Request, status
 from fastapi.middleware.cors import CORSMiddleware
+from fastapi.responses import ORJSONResponse
 from contextlib import asynccontextmanager
 
 # Import configuration and database
 from app.core.config import settings
-from app.core.database import init_db, close_db
+from app.core.database import init_db, close_db, init_asyncpg_pool
+from app.core.errors import ExternalServiceError
+from app.core.openai_client import close_openai_client
+from app.services.provider_suggestions.tavily_service import get_http_client, close_http_client
 from app.api import routes
 from app.api import openai_routes
 from app.api import provider_suggestions_routes
@@ -24,13 +28,17 @@ async def lifespan(app: FastAPI):
     # Startup
     print("🚀 Starting up M01N API...")
     #await init_db()
+    await init_asyncpg_pool()
     print("✅ Database initialized")
+    get_http_client()
     
     yield
     
     # Shutdown
     print("🛑 Shutting down M01N API...")
     await close_db()
+    await close_http_client()
+    await close_openai_client()
     print("✅ Database connections closed")
 
 
@@ -39,7 +47,8 @@ app = FastAPI(
     title=settings.app_name,
     description="Backend API for M01N project with Supabase",
     version=settings.app_version,
-    lifespan=lifespan
+    lifespan=lifespan,
+    default_response_class=ORJSONResponse
 )
 
 # Configure CORS
@@ -51,6 +60,20 @@ app.add_middleware(
     allow_headers=["*"],
 )
 
+@app.exception_handler(ExternalServiceError)
+async def external_service_error_handler(request: Request, exc: ExternalServiceError):
+    """
+    Map failures of external services (OpenAI, embeddings) to 502.
+    
+    Route handlers re-raise ExternalServiceError ahead of their generic
+    500 handling so it reaches this handler.
+    """
+    return ORJSONResponse(
+        status_code=status.HTTP_502_BAD_GATEWAY,
+        content={"detail": f"External service error: {str(exc)}"}
+    )
+
+
 # Include routers
 app.include_router(routes.router)
 app.include_router(openai_routes.router)
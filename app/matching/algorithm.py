@@ -2,41 +2,53 @@
 Matching Algorithm for Buyer Requirements vs Applications
 Uses vector similarity + label/integration overlap for hybrid scoring.
 """
-import math
-from typing import List, Dict, Optional, Any, Tuple
+import hashlib
+import re
+from dataclasses import dataclass
+from functools import lru_cache
+from typing import AbstractSet, List, Dict, Optional, Any, Sequence, Tuple
 import asyncpg
+import numpy as np
 
+from app.core.cache import TTLCache
+
+
+# Numbers with optional decimal point (prices)
+_NUMBER_RE = re.compile(r'\d+(?:\.\d+)?')
+# Free-price indicators, matched in a single scan of the lowercased text
+_FREE_RE = re.compile(r'gratis|free|kostenlos|gratuit')
+
+# Integration keys repeat across requests, so their normalized form is memoized
+CANONICAL_CACHE_SIZE = 4096
 
-def sigmoid(x: float) -> float:
-    """
-    Sigmoid function for score normalization.
-    Maps any real number to (0, 1) range.
-    """
-    return 1 / (1 + math.exp(-x))
 
+# Percentages come from sigmoid(10 * (score - 0.5)), centered at 0.5 with
+# multiplier 10 controlling steepness. The sigmoid is monotonic, so instead of
+# evaluating it per candidate we precompute the scores at which the rounded
+# percentage steps up: 100 * sigmoid(10 * (t - 0.5)) = p + 0.5, p = 0..99
+_PERCENT_STEPS = (np.arange(100) + 0.5) / 100
+_PERCENT_THRESHOLDS = 0.5 + np.log(_PERCENT_STEPS / (1 - _PERCENT_STEPS)) / 10
 
-def overlap_ratio(list_a: List[str], list_b: List[str]) -> float:
+
+def overlap_ratio(set_a: AbstractSet[str], set_b: AbstractSet[str]) -> float:
     """
-    Calculate overlap ratio between two lists.
-    Returns 0.0 if list_a is empty, otherwise intersection_size / len(list_a).
+    Calculate overlap ratio between buyer requirements and app features.
+    Returns 0.1 if set_a is empty, otherwise intersection_size / len(set_a).
     
     Args:
-        list_a: Buyer requirements (denominator)
-        list_b: App features
+        set_a: Buyer requirements (denominator)
+        set_b: App features, normalized the same way as set_a
     
     Returns:
         Ratio in [0.0, 1.0]
     """
-    if not list_a:
+    if not set_a:
         return 0.1
     
-    set_a = set(s.lower().strip() for s in list_a)
-    set_b = set(s.lower().strip() for s in list_b)
-    
-    intersection = set_a & set_b
-    return len(intersection) / len(set_a)
+    return len(set_a & set_b) / len(set_a)
 
 
+@lru_cache(maxsize=CANONICAL_CACHE_SIZE)
 def normalize_integration_key(key: str) -> str:
     """
     Normalize integration key to Title Case and trim whitespace.
@@ -50,10 +62,77 @@ def normalize_integration_key(key: str) -> str:
     return key.strip().title()
 
 
+@dataclass(frozen=True)
+class NormalizedBuyer:
+    """
+    Buyer requirements normalized once per match for comparison with every
+    candidate: labels and tags lowercased and stripped, integrations passed
+    through normalize_integration_key and lowercased.
+    """
+    labels_must: frozenset
+    labels_nice: frozenset
+    tag_must: frozenset
+    tag_nice: frozenset
+    integration_required: frozenset
+    integration_nice: frozenset
+    price_max: Optional[float]
+    
+    @classmethod
+    def from_struct(cls, buyer_struct: Dict[str, Any]) -> "NormalizedBuyer":
+        """Build from a parsed buyer structure (see run_match)"""
+        def lowered(values: List[str]) -> frozenset:
+            return frozenset(v.lower().strip() for v in values)
+        
+        def integrations(values: List[str]) -> frozenset:
+            return frozenset(normalize_integration_key(v).lower().strip() for v in values)
+        
+        # price_max may come as text ("gratis", "CHF 50"): parse it once
+        price_max = buyer_struct.get("constraints", {}).get("price_max")
+        if isinstance(price_max, str):
+            price_max = extract_price_from_text(price_max)
+        
+        return cls(
+            labels_must=frozenset(label.lower() for label in buyer_struct.get("labels_must", [])),
+            labels_nice=lowered(buyer_struct.get("labels_nice", [])),
+            tag_must=lowered(buyer_struct.get("tag_must", [])),
+            tag_nice=lowered(buyer_struct.get("tag_nice", [])),
+            integration_required=integrations(buyer_struct.get("integration_required", [])),
+            integration_nice=integrations(buyer_struct.get("integration_nice", [])),
+            price_max=price_max
+        )
+
+
+@dataclass(frozen=True)
+class NormalizedCandidate:
+    """
+    Features of one candidate app as sets, shared by the must-have check and
+    the hybrid score. The database returns them canonical (lowercased and
+    trimmed at write time), comparable with NormalizedBuyer as they are.
+    """
+    labels: frozenset
+    integrations: frozenset
+    tags: frozenset
+    
+    @classmethod
+    def from_candidate(cls, candidate: Dict[str, Any]) -> "NormalizedCandidate":
+        """Build from a candidate returned by get_vector_candidates"""
+        return cls(
+            labels=frozenset(candidate["labels"]),
+            integrations=frozenset(candidate["integrations"]),
+            tags=frozenset(candidate["tags"])
+        )
+
+
+# Distinct price texts in the catalog; each is parsed once
+PRICE_CACHE_SIZE = 4096
+
+
+@lru_cache(maxsize=PRICE_CACHE_SIZE)
 def extract_price_from_text(price_text: Optional[str]) -> Optional[float]:
     """
     Extract numeric price from text format.
     Handles formats like: "CHF 50", "50 CHF/mes", "CHF 50.00", "Gratis", etc.
+    Results are memoized per price text.
     
     Args:
         price_text: Price text from database (e.g., "CHF 50", "Gratis")
@@ -64,21 +143,15 @@ def extract_price_from_text(price_text: Optional[str]) -> Optional[float]:
     if not price_text:
         return None
     
-    price_lower = price_text.lower().strip()
-    
     # Check for free indicators
-    free_keywords = ['gratis', 'free', 'kostenlos', 'gratuit']
-    if any(keyword in price_lower for keyword in free_keywords):
+    if _FREE_RE.search(price_text.lower()):
         return 0.0
     
-    # Extract numeric values using regex
-    import re
-    # Match numbers with optional decimal point
-    numbers = re.findall(r'\d+(?:\.\d+)?', price_text)
+    # The first number found is usually the price
+    number = _NUMBER_RE.search(price_text)
     
-    if numbers:
-        # Return the first number found (usually the price)
-        return float(numbers[0])
+    if number:
+        return float(number.group())
     
     return None
 
@@ -109,154 +182,138 @@ def is_within_budget(price_text: Optional[str], price_max: Optional[float]) -> b
     return app_price <= price_max
 
 
+# SQL of the matching queries. asyncpg prepares each query once per pooled
+# connection and reuses it by query text (statement cache), so every call
+# after the first on a connection skips parse and plan.
+
+# No "IS NOT NULL" filter in the ANN stage: HNSW indexes skip NULLs anyway,
+# and a filter there can steer the planner off the index. The re-rank orders
+# by the output column so each distance is computed once, and application
+# rows are only read for the top_k survivors, not the oversampled set.
+# Embeddings are unit-norm, so cosine similarity is the plain inner product:
+# <#> (negative inner product) skips the two norms that <=> computes.
+VECTOR_CANDIDATES_SQL = """
+    WITH ann AS (
+        SELECT s.id, s.app_id, s.embedding, s.labels, s.integrations
+        FROM application_search s
+        ORDER BY s.embedding_half <#> $1::vector::halfvec(1536)
+        LIMIT $3
+    ),
+    ranked AS (
+        SELECT 
+            ann.id as app_search_id,
+            ann.app_id,
+            ann.labels,
+            ann.integrations,
+            -(ann.embedding <#> $1::vector) as cosine_similarity
+        FROM ann
+        WHERE ann.embedding IS NOT NULL
+        ORDER BY cosine_similarity DESC
+        LIMIT $2
+    )
+    SELECT
+        r.*,
+        a.name,
+        a.price_text,
+        COALESCE((
+            SELECT array_agg(lower(btrim(t.tag)))
+            FROM apps_tags t
+            WHERE t.app_id = r.app_id
+        ), '{}') as tags
+    FROM ranked r
+    INNER JOIN application a ON r.app_id = a.id
+    ORDER BY r.cosine_similarity DESC
+"""
+
+LABEL_SYNONYMS_SQL = """
+    SELECT label, synonyms
+    FROM labels
+    WHERE LOWER(label) = ANY($1::text[])
+"""
+
+
+# The ANN stage over halfvec fetches this many times top_k rows, which are
+# then re-ranked with the full-precision embedding
+ANN_OVERSAMPLE = 4
+# pgvector's default hnsw.ef_search; an HNSW scan returns at most ef_search rows
+HNSW_DEFAULT_EF_SEARCH = 40
+
+# Candidates per (rounded query embedding, top_k). The catalog only changes
+# when the loader runs, so repeat searches within a minute skip the database
+VECTOR_CANDIDATES_TTL_SECONDS = 60
+VECTOR_CANDIDATES_ROUNDING_DECIMALS = 4
+_vector_candidates = TTLCache(maxsize=1024, ttl=VECTOR_CANDIDATES_TTL_SECONDS)
+
+
 async def get_vector_candidates(
     conn: asyncpg.Connection,
-    buyer_embedding: List[float],
+    buyer_embedding: Sequence[float],
     top_k: int
 ) -> List[Dict[str, Any]]:
     """
     Retrieve top K candidates by vector similarity using cosine distance.
     
+    Stored embeddings are L2-normalized, so after normalizing the query the
+    cosine similarity is computed as an inner product (<#>). Two stages: an
+    HNSW search over the half-precision copy of the embeddings (embedding_half)
+    selects top_k * ANN_OVERSAMPLE rows, which are then re-ranked with the
+    full-precision embedding. Labels and integration keys are read from the
+    arrays kept on application_search, and tags are aggregated in the same
+    query, so the candidates arrive complete in one round-trip and already
+    canonical (lowercased and trimmed). Results are cached briefly per query
+    embedding (rounded) and top_k; callers must not modify them.
+    
     Args:
-        conn: Database connection
-        buyer_embedding: Query embedding vector (1536 floats)
+        conn: Database connection (with the pgvector codec registered)
+        buyer_embedding: Query embedding vector (1536 floats, list or ndarray)
         top_k: Number of candidates to retrieve
     
     Returns:
-        List of dicts with app_search_id, app_id, and cosine_similarity
-    """
-    # Convert embedding to pgvector format
-    embedding_str = '[' + ','.join(map(str, buyer_embedding)) + ']'
-    
-    query = """
-        SELECT 
-            s.id as app_search_id,
-            s.app_id,
-            a.price_text,
-            1 - (s.embedding <=> $1::vector) as cosine_similarity
-        FROM application_search s
-        INNER JOIN application a ON s.app_id = a.id
-        WHERE s.embedding IS NOT NULL
-        ORDER BY s.embedding <=> $1::vector
-        LIMIT $2
-    """
-    
-    rows = await conn.fetch(query, embedding_str, top_k)
-    
-    return [
+        List of dicts with app_search_id and app_id (uuid.UUID), name,
+        price_text, cosine_similarity, labels, integrations and tags
+    """
+    # Sent in pgvector's binary format by the codec registered on the pool.
+    # One float32 copy per query, normalized in place (never the caller's array)
+    embedding = np.array(buyer_embedding, dtype=np.float32)
+    norm = np.linalg.norm(embedding)
+    if norm > 0:
+        embedding /= norm
+    
+    rounded = np.round(embedding, VECTOR_CANDIDATES_ROUNDING_DECIMALS)
+    key = (hashlib.blake2b(rounded.tobytes(), digest_size=16).digest(), top_k)
+    cached = _vector_candidates.get(key)
+    if cached is not None:
+        return cached
+    
+    ann_limit = top_k * ANN_OVERSAMPLE
+    
+    async with conn.transaction():
+        # The HNSW scan must be allowed to return the whole oversampled set
+        ef_search = max(HNSW_DEFAULT_EF_SEARCH, ann_limit)
+        await conn.execute(f"SET LOCAL hnsw.ef_search = {int(ef_search)}")
+        rows = await conn.fetch(VECTOR_CANDIDATES_SQL, embedding, top_k, ann_limit)
+    
+    candidates = [
         {
-            "app_search_id": str(row["app_search_id"]),
-            "app_id": str(row["app_id"]),
+            "app_search_id": row["app_search_id"],
+            "app_id": row["app_id"],
+            "name": row["name"],
             "price_text": row["price_text"],
-            "cosine_similarity": float(row["cosine_similarity"])
+            "cosine_similarity": float(row["cosine_similarity"]),
+            "labels": list(row["labels"]),
+            "integrations": list(row["integrations"]),
+            "tags": list(row["tags"])
         }
         for row in rows
     ]
+    _vector_candidates.set(key, candidates)
+    return candidates
 
 
-async def get_labels_for_apps(
-    conn: asyncpg.Connection,
-    app_search_ids: List[str]
-) -> Dict[str, List[str]]:
-    """
-    Batch fetch labels for multiple apps.
-    
-    Args:
-        conn: Database connection
-        app_search_ids: List of app_search_id UUIDs
-    
-    Returns:
-        Dict mapping app_search_id -> list of labels
-    """
-    if not app_search_ids:
-        return {}
-    
-    query = """
-        SELECT app_search_id, label
-        FROM application_labels
-        WHERE app_search_id = ANY($1::uuid[])
-    """
-    
-    rows = await conn.fetch(query, app_search_ids)
-    
-    result = {app_id: [] for app_id in app_search_ids}
-    for row in rows:
-        app_id = str(row["app_search_id"])
-        result[app_id].append(row["label"])
-    
-    return result
-
-
-async def get_integrations_for_apps(
-    conn: asyncpg.Connection,
-    app_search_ids: List[str]
-) -> Dict[str, List[str]]:
-    """
-    Batch fetch integration keys for multiple apps.
-    
-    Args:
-        conn: Database connection
-        app_search_ids: List of app_search_id UUIDs
-    
-    Returns:
-        Dict mapping app_search_id -> list of integration_keys
-    """
-    if not app_search_ids:
-        return {}
-    
-    query = """
-        SELECT app_search_id, integration_key
-        FROM application_integration_keys
-        WHERE app_search_id = ANY($1::uuid[])
-    """
-    
-    rows = await conn.fetch(query, app_search_ids)
-    
-    result = {app_id: [] for app_id in app_search_ids}
-    for row in rows:
-        app_id = str(row["app_search_id"])
-        result[app_id].append(row["integration_key"])
-    
-    return result
-
-
-async def get_tags_for_apps(
-    conn: asyncpg.Connection,
-    app_ids: List[str]
-) -> Dict[str, List[str]]:
-    """
-    Batch fetch tags for multiple apps.
-    Note: apps_tags uses app_id (from application table), not app_search_id.
-    
-    Args:
-        conn: Database connection
-        app_ids: List of app_id UUIDs from application table
-    
-    Returns:
-        Dict mapping app_id -> list of tags
-    """
-    if not app_ids:
-        return {}
-    
-    # Check if apps_tags table exists (it may not be in all schemas)
-    try:
-        query = """
-            SELECT app_id, tag
-            FROM apps_tags
-            WHERE app_id = ANY($1::uuid[])
-        """
-        
-        rows = await conn.fetch(query, app_ids)
-        
-        result = {app_id: [] for app_id in app_ids}
-        for row in rows:
-            app_id = str(row["app_id"])
-            result[app_id].append(row["tag"])
-        
-        return result
-    except Exception:
-        # If table doesn't exist or query fails, return empty dict
-        return {app_id: [] for app_id in app_ids}
+# Synonyms per lowercased label (empty tuple: label not in the catalog); the
+# labels table changes rarely, so matching reads it at most every few minutes
+LABEL_SYNONYMS_TTL_SECONDS = 300
+_label_synonyms = TTLCache(maxsize=10_000, ttl=LABEL_SYNONYMS_TTL_SECONDS)
 
 
 async def get_label_synonyms(
@@ -265,6 +322,7 @@ async def get_label_synonyms(
 ) -> Dict[str, List[str]]:
     """
     Get synonyms for given labels from the database.
+    Cached per label; only labels not seen recently are queried.
     
     Args:
         conn: Database connection
@@ -277,17 +335,23 @@ async def get_label_synonyms(
         return {}
     
     # Normalize labels for case-insensitive matching
-    labels_lower = [label.lower() for label in labels]
+    labels_lower = list(dict.fromkeys(label.lower() for label in labels))
     
-    query = """
-        SELECT label, synonyms
-        FROM labels
-        WHERE LOWER(label) = ANY($1::text[])
-    """
+    result = {}
+    missing = []
+    for label_name in labels_lower:
+        cached = _label_synonyms.get(label_name)
+        if cached is None:
+            missing.append(label_name)
+        elif cached:
+            result[label_name] = list(cached)
+    
+    if not missing:
+        return result
     
-    rows = await conn.fetch(query, labels_lower)
+    rows = await conn.fetch(LABEL_SYNONYMS_SQL, missing)
     
-    result = {}
+    found = {}
     for row in rows:
         label_name = row["label"].lower()
         synonyms_list = [label_name]  # Include the label itself
@@ -297,16 +361,18 @@ async def get_label_synonyms(
             # synonyms is stored as TEXT[] array in DB
             synonyms_list.extend([s.lower() for s in row["synonyms"]])
         
-        result[label_name] = synonyms_list
+        found[label_name] = synonyms_list
     
+    for label_name in missing:
+        _label_synonyms.set(label_name, tuple(found.get(label_name, ())))
+    
+    result.update(found)
     return result
 
 
 def check_must_have_requirements(
-    buyer_struct: Dict[str, Any],
-    app_labels: List[str],
-    app_integrations: List[str],
-    app_tags: List[str],
+    buyer: NormalizedBuyer,
+    app: NormalizedCandidate,
     label_synonyms: Dict[str, List[str]] = None
 ) -> bool:
     """
@@ -315,61 +381,46 @@ def check_must_have_requirements(
     Note: tag_must is NOT checked here - it's part of the hybrid score instead.
     
     Args:
-        buyer_struct: Buyer requirements structure
-        app_labels: Labels assigned to the app
-        app_integrations: Integration keys of the app
-        app_tags: Tags assigned to the app (not used in filtering)
+        buyer: Normalized buyer requirements
+        app: Normalized labels, integrations and tags of the app
         label_synonyms: Dict mapping labels to their synonyms (optional)
     
     Returns:
         True if all must-have requirements are met, False otherwise
     """
-    labels_must = buyer_struct.get("labels_must", [])
-    integration_required = buyer_struct.get("integration_required", [])
+    if not (buyer.labels_must or buyer.integration_required):
+        return True
     
     # Check required labels (with synonyms support)
-    if labels_must:
-        app_labels_lower = set(label.lower() for label in app_labels)
+    if buyer.labels_must:
+        label_synonyms = label_synonyms or {}
         
-        for required_label in labels_must:
-            required_lower = required_label.lower()
-            
-            # Check if the exact label exists
-            if required_lower in app_labels_lower:
+        for required_lower in buyer.labels_must:
+            # Exact label, or any of its synonyms (set operations run in C)
+            if required_lower in app.labels:
                 continue
-            
-            # If synonyms are provided, check if any synonym matches
-            if label_synonyms and required_lower in label_synonyms:
-                synonyms = label_synonyms[required_lower]
-                if any(syn in app_labels_lower for syn in synonyms):
-                    continue
-            
-            # No match found (neither exact nor synonym)
-            return False
-    
-    # Check required integrations (normalized comparison)
-    if integration_required:
-        app_integrations_normalized = set(
-            normalize_integration_key(integ).lower() 
-            for integ in app_integrations
-        )
-        for required_integ in integration_required:
-            normalized_required = normalize_integration_key(required_integ).lower()
-            if normalized_required not in app_integrations_normalized:
+            synonyms = label_synonyms.get(required_lower)
+            if not synonyms or app.labels.isdisjoint(synonyms):
                 return False
     
-    return True
+    # Check required integrations (normalized comparison)
+    return buyer.integration_required <= app.integrations
 
 
-def calculate_hybrid_score(
-    cosine_similarity: float,
-    buyer_struct: Dict[str, Any],
-    app_labels: List[str],
-    app_integrations: List[str],
-    app_tags: List[str]
-) -> float:
+# Hybrid score weights: embedding similarity, then the overlaps with tag_must,
+# labels_nice, tag_nice and integration_nice
+EMBEDDING_WEIGHT = 0.60
+OVERLAP_WEIGHTS = np.array([0.10, 0.10, 0.05, 0.15])
+
+
+def calculate_hybrid_scores(
+    cosine_similarities: np.ndarray,
+    buyer: NormalizedBuyer,
+    apps: List[NormalizedCandidate]
+) -> np.ndarray:
     """
-    Calculate hybrid score combining vector similarity and feature overlap.
+    Calculate hybrid scores combining vector similarity and feature overlap
+    for a batch of candidates.
     
     Weights:
     - 60% embedding similarity
@@ -379,75 +430,50 @@ def calculate_hybrid_score(
     - 15% nice-to-have integrations overlap (integration_nice)
     
     Args:
-        cosine_similarity: Vector similarity score [0, 1]
-        buyer_struct: Buyer requirements
-        app_labels: App labels
-        app_integrations: App integration keys
-        app_tags: App tags
+        cosine_similarities: Vector similarity scores [0, 1], one per candidate
+        buyer: Normalized buyer requirements
+        apps: Normalized features of each candidate
     
     Returns:
-        Hybrid score in [0, 1] range
-    """
-    labels_nice = buyer_struct.get("labels_nice", [])
-    tag_must = buyer_struct.get("tag_must", [])
-    tag_nice = buyer_struct.get("tag_nice", [])
-    integration_nice = buyer_struct.get("integration_nice", [])
-    
-    # Normalize integrations for comparison
-    app_integrations_normalized = [
-        normalize_integration_key(integ) 
-        for integ in app_integrations
-    ]
-    integration_nice_normalized = [
-        normalize_integration_key(integ)
-        for integ in integration_nice
-    ]
-    
-    # Calculate overlap ratios
-    labels_nice_overlap = overlap_ratio(labels_nice, app_labels)
-    tag_must_overlap = overlap_ratio(tag_must, app_tags)
-    tag_nice_overlap = overlap_ratio(tag_nice, app_tags)
-    integrations_nice_overlap = overlap_ratio(
-        integration_nice_normalized, 
-        app_integrations_normalized
-    )
-    
-    # Weighted hybrid score (total: 100%)
-    score = (
-        (0.60 * cosine_similarity +
-        0.10 * tag_must_overlap +
-        0.10 * labels_nice_overlap +
-        0.05 * tag_nice_overlap +
-        0.15 * integrations_nice_overlap)*0.45 +0.55
-    )
+        Hybrid scores in [0, 1] range, one per candidate
+    """
+    # One row of overlap ratios per candidate, in OVERLAP_WEIGHTS order
+    overlaps = np.array(
+        [
+            (
+                overlap_ratio(buyer.tag_must, app.tags),
+                overlap_ratio(buyer.labels_nice, app.labels),
+                overlap_ratio(buyer.tag_nice, app.tags),
+                overlap_ratio(buyer.integration_nice, app.integrations)
+            )
+            for app in apps
+        ],
+        dtype=np.float64
+    ).reshape(len(apps), len(OVERLAP_WEIGHTS))
     
-    return score
+    # Weighted hybrid score (total: 100%), all candidates in one matrix product
+    weighted = EMBEDDING_WEIGHT * cosine_similarities + overlaps @ OVERLAP_WEIGHTS
+    return weighted * 0.45 + 0.55
 
-
-def score_to_percentage(score: float) -> int:
+def scores_to_percentages(scores: np.ndarray) -> np.ndarray:
     """
-    Convert hybrid score to interpretable percentage using sigmoid.
-    Maps [0, 1] score to [0, 100] percentage with sigmoid transformation.
+    Convert hybrid scores to interpretable percentages using sigmoid.
+    Maps [0, 1] scores to [0, 100] percentages with sigmoid transformation.
     
     Args:
-        score: Hybrid score in [0, 1]
+        scores: Hybrid scores in [0, 1]
     
     Returns:
-        Percentage in [0, 100]
+        Integer percentages in [0, 100]
     """
-    # Sigmoid transformation centered at 0.5
-    # Multiplier 10 controls steepness
-    transformed = sigmoid(10 * (score - 0.5))
-    percentage = round(100 * transformed)
-    
-    # Clamp to [0, 100]
-    return max(0, min(100, percentage))
+    # Number of percentage steps each score has reached (always in [0, 100])
+    return np.searchsorted(_PERCENT_THRESHOLDS, scores, side="right")
 
 
 async def run_match(
     conn: asyncpg.Connection,
     buyer_struct: Dict[str, Any],
-    buyer_embedding: List[float],
+    buyer_embedding: Sequence[float],
     top_k: int = 30,
     top_n: int = 10
 ) -> List[Dict[str, Any]]:
@@ -456,7 +482,7 @@ async def run_match(
     
     Algorithm:
     1. Retrieve top K candidates by vector similarity (cosine distance)
-    2. Batch fetch labels and integrations for candidates
+    2. Labels, integrations and tags come with the candidates from step 1
     3. Filter out apps that don't meet must-have requirements
     4. Calculate hybrid score (embedding + labels + integrations)
     5. Convert scores to percentages
@@ -479,7 +505,7 @@ async def run_match(
         top_n: Number of final results to return
     
     Returns:
-        List of dicts with app_id and similarity_percent, sorted by similarity desc
+        List of dicts with app_id, name and similarity_percent, sorted by similarity desc
     
     Raises:
         ValueError: If all arrays (labels, tags, integrations) are empty
@@ -502,83 +528,69 @@ async def run_match(
             "Cannot match applications without any criteria."
         )
     
-    # Step 1: Vector search for top K candidates
+    # Step 1: Vector search for top K candidates (with labels, integrations and tags)
     candidates = await get_vector_candidates(conn, buyer_embedding, top_k)
     
     if not candidates:
         return []
     
-    # Extract app_search_ids for batch queries
-    app_search_ids = [c["app_search_id"] for c in candidates]
-    app_ids = [c["app_id"] for c in candidates]
-    
-    # Step 2: Batch fetch labels, integrations, and tags
-    labels_map = await get_labels_for_apps(conn, app_search_ids)
-    integrations_map = await get_integrations_for_apps(conn, app_search_ids)
-    tags_map = await get_tags_for_apps(conn, app_ids)
-    
-    # Step 2.5: Get synonyms for must-have labels
+    # Step 2: Get synonyms for must-have labels (cached; usually no query)
     labels_must = buyer_struct.get("labels_must", [])
     label_synonyms = await get_label_synonyms(conn, labels_must)
     
-    # Step 3: Score and filter candidates
-    scored_results = []
-    
-    for candidate in candidates:
-        app_search_id = candidate["app_search_id"]
-        app_id = candidate["app_id"]
-        price_text = candidate.get("price_text")
-        cosine_sim = candidate["cosine_similarity"]
-        
-        app_labels = labels_map.get(app_search_id, [])
-        app_integrations = integrations_map.get(app_search_id, [])
-        app_tags = tags_map.get(app_id, [])
-        
-        # Filter: Check must-have requirements (with synonyms and tags)
-        meets_requirements = check_must_have_requirements(
-            buyer_struct,
-            app_labels,
-            app_integrations,
-            app_tags,
-            label_synonyms
+    # Buyer-side sets and price limit, normalized once for all candidates
+    buyer = NormalizedBuyer.from_struct(buyer_struct)
+    
+    # Candidate-side sets, normalized once and shared by filtering and scoring
+    apps = [NormalizedCandidate.from_candidate(c) for c in candidates]
+    
+    # Step 3: Filter candidates on must-have requirements (with synonyms)
+    # and the price constraint. Buyers without must-haves or a price limit
+    # (the common nice-to-have-only case) skip the per-candidate checks
+    if buyer.labels_must or buyer.integration_required or buyer.price_max is not None:
+        passes = np.fromiter(
+            (
+                check_must_have_requirements(buyer, app, label_synonyms)
+                and is_within_budget(c.get("price_text"), buyer.price_max)
+                for c, app in zip(candidates, apps)
+            ),
+            dtype=bool,
+            count=len(candidates)
         )
-        
-        # Filter: Check price constraint
-        price_max_raw = buyer_struct.get("constraints", {}).get("price_max")
-        # Process price_max: if it's a string with "gratis"/"gratuito", convert to 0.0
-        if isinstance(price_max_raw, str):
-            price_max = extract_price_from_text(price_max_raw)
-        else:
-            price_max = price_max_raw
-        within_budget = is_within_budget(price_text, price_max)
-        
-        if not meets_requirements or not within_budget:
-            # Strategy: Assign very low score instead of completely discarding
-            # This allows some visibility but ranks them at the bottom
-            similarity_percent = 5
-        else:
-            # Calculate hybrid score
-            hybrid_score = calculate_hybrid_score(
-                cosine_sim,
-                buyer_struct,
-                app_labels,
-                app_integrations,
-                app_tags
-            )
-            
-            # Convert to percentage
-            similarity_percent = score_to_percentage(hybrid_score)
-        
-        scored_results.append({
-            "app_id": app_id,
-            "similarity_percent": similarity_percent
-        })
+    else:
+        passes = np.ones(len(candidates), dtype=bool)
+    
+    # Step 4: Score the candidates that passed, all at once, and convert to
+    # percentages. Strategy for rejects: very low score instead of completely
+    # discarding, which allows some visibility but ranks them at the bottom
+    survivors = np.flatnonzero(passes)
+    similarity_percents = np.full(len(candidates), 5, dtype=np.int64)
+    
+    if survivors.size:
+        cosine_similarities = np.fromiter(
+            (candidates[i]["cosine_similarity"] for i in survivors),
+            dtype=np.float64,
+            count=survivors.size
+        )
+        hybrid_scores = calculate_hybrid_scores(
+            cosine_similarities,
+            buyer,
+            [apps[i] for i in survivors]
+        )
+        similarity_percents[survivors] = scores_to_percentages(hybrid_scores)
     
-    # Step 4: Sort by similarity percentage (descending)
-    scored_results.sort(key=lambda x: x["similarity_percent"], reverse=True)
+    # Sort by similarity percentage (descending; stable keeps vector order on ties)
+    order = np.argsort(-similarity_percents, kind="stable")[:top_n]
     
     # Step 5: Return top N
-    return scored_results[:top_n]
+    return [
+        {
+            "app_id": str(candidates[i]["app_id"]),
+            "name": candidates[i]["name"],
+            "similarity_percent": int(similarity_percents[i])
+        }
+        for i in order
+    ]
 
 
 # Example usage
@@ -586,6 +598,7 @@ async def example_usage():
     """Example of how to use the matching algorithm."""
     import os
     from dotenv import load_dotenv
+    from pgvector.asyncpg import register_vector
     
     load_dotenv()
     DATABASE_URL = os.getenv("DATABASE_URL")
@@ -606,6 +619,7 @@ async def example_usage():
     
     # Run matching
     conn = await asyncpg.connect(DATABASE_URL)
+    await register_vector(conn)
     try:
         results = await run_match(
             conn,
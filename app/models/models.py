@@ -1,7 +1,7 @@
 """
 Example Database Model
 """
-from sqlalchemy import Column, Integer, String, DateTime, Boolean, Text, ForeignKey, Float
+from sqlalchemy import Column, Integer, BigInteger, String, DateTime, Boolean, Text, ForeignKey, Float, Index, DDL, event
 from sqlalchemy.dialects.postgresql import UUID
 from sqlalchemy.orm import relationship
 from sqlalchemy.sql import func
@@ -39,6 +39,11 @@ class AppTag(Base):
     # Relationship to application
     application = relationship("Application", back_populates="tags")
 
+    # Covering index for per-category lookups (tag -> app ids)
+    __table_args__ = (
+        Index("idx_apps_tags_tag_app_id", "tag", "app_id"),
+    )
+
     def __repr__(self):
         return f"<AppTag app_id={self.app_id} tag={self.tag}>"
 
@@ -86,4 +91,47 @@ class ApplicationClick(Base):
     created_at = Column(DateTime(timezone=True), server_default=func.now())
 
     def __repr__(self):
-        return f"<ApplicationClick {self.id} for App {self.app_id}>"
\ No newline at end of file
+        return f"<ApplicationClick {self.id} for App {self.app_id}>"
+
+
+class ApplicationClickCounter(Base):
+    """Per-application click totals, maintained by a trigger on application_clicks"""
+    __tablename__ = "application_click_counter"
+
+    app_id = Column(UUID(as_uuid=True), ForeignKey("application.id", ondelete="CASCADE"), primary_key=True)
+    click_count = Column(BigInteger, default=0, nullable=False)
+    updated_at = Column(DateTime(timezone=True), server_default=func.now())
+
+    def __repr__(self):
+        return f"<ApplicationClickCounter {self.app_id}: {self.click_count}>"
+
+
+# Keep application_click_counter in sync with every inserted click. Created
+# after all tables (the trigger spans both), and backfilled from the raw
+# clicks so existing databases start with correct totals.
+for _statement in (
+    """
+    CREATE OR REPLACE FUNCTION increment_application_click_counter() RETURNS trigger AS $$
+    BEGIN
+        INSERT INTO application_click_counter (app_id, click_count, updated_at)
+        VALUES (NEW.app_id, 1, NOW())
+        ON CONFLICT (app_id) DO UPDATE
+        SET click_count = application_click_counter.click_count + 1,
+            updated_at = NOW();
+        RETURN NEW;
+    END;
+    $$ LANGUAGE plpgsql
+    """,
+    "DROP TRIGGER IF EXISTS trg_application_clicks_counter ON application_clicks",
+    """
+    CREATE TRIGGER trg_application_clicks_counter
+    AFTER INSERT ON application_clicks
+    FOR EACH ROW EXECUTE FUNCTION increment_application_click_counter()
+    """,
+    """
+    INSERT INTO application_click_counter (app_id, click_count, updated_at)
+    SELECT app_id, COUNT(*), NOW() FROM application_clicks GROUP BY app_id
+    ON CONFLICT (app_id) DO NOTHING
+    """,
+):
+    event.listen(Base.metadata, "after_create", DDL(_statement).execute_if(dialect="postgresql"))
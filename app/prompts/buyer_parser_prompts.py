@@ -2,6 +2,7 @@
 Buyer Requirements Parser Prompts
 OpenAI prompts for converting natural language buyer requirements into structured JSON.
 """
+from typing import Optional
 
 SYSTEM_PROMPT = """You are a business application requirements parser. Your task is to convert a buyer's natural language description into structured JSON data for matching applications in a marketplace.
 
@@ -91,16 +92,11 @@ VALIDATION:
 - Output must be valid JSON parseable by json.loads()"""
 
 
-USER_PROMPT = """Parse the following buyer requirements into structured JSON.
-
-ALLOWED LABELS (use ONLY these exact strings for labels_must and labels_nice):
-{allowed_labels}
-
-ALLOWED TAGS (use ONLY these exact strings for tag_must and tag_nice):
-{allowed_tags}
-
-BUYER INPUT:
-{buyer_prompt}
+# Everything static comes before the buyer input, which is always last: with
+# the same system prompt, every request then shares one long prefix that
+# OpenAI's prompt caching can reuse. The prefix is a template for the
+# allowed labels/tags.
+USER_PROMPT_PREFIX = """Parse the following buyer requirements into structured JSON.
 
 Return ONLY the JSON object with this exact structure:
 {{
@@ -115,7 +111,16 @@ Return ONLY the JSON object with this exact structure:
     "price_max": number|null
   }},
   "notes": "string"
-}}"""
+}}
+
+ALLOWED LABELS (use ONLY these exact strings for labels_must and labels_nice):
+{allowed_labels}
+
+ALLOWED TAGS (use ONLY these exact strings for tag_must and tag_nice):
+{allowed_tags}
+
+BUYER INPUT:
+"""
 
 
 # Label catalog for reference
@@ -128,6 +133,26 @@ LABEL_CATALOG = [
     "Sales", "Shipping & Logistics", "Tax Management", "Time Tracking", "Workflow Automation"
 ]
 
+# Catalog lookups for validating parsed labels (exact and case-insensitive)
+_LABEL_CATALOG_SET = frozenset(LABEL_CATALOG)
+_LABELS_BY_LOWER = {label.lower(): label for label in LABEL_CATALOG}
+
+
+def normalize_label(label: str) -> Optional[str]:
+    """
+    Map a label to its catalog spelling, ignoring case and surrounding spaces.
+    
+    Args:
+        label: Label as returned by the parser model
+    
+    Returns:
+        Canonical catalog label, or None if it is not in LABEL_CATALOG
+    """
+    # The model usually returns the exact catalog spelling
+    if label in _LABEL_CATALOG_SET:
+        return label
+    return _LABELS_BY_LOWER.get(label.strip().lower())
+
 
 # Tag catalog for categories
 TAG_CATALOG = [
@@ -143,6 +168,18 @@ TAG_CATALOG = [
 ]
 
 
+def _quoted_list(values: list) -> str:
+    """Comma-separated, double-quoted catalog entries"""
+    return ", ".join(f'"{value}"' for value in values)
+
+
+# Prefix for the default catalogs, formatted once at import
+_DEFAULT_USER_PROMPT_PREFIX = USER_PROMPT_PREFIX.format(
+    allowed_labels=_quoted_list(LABEL_CATALOG),
+    allowed_tags=_quoted_list(TAG_CATALOG)
+)
+
+
 def format_user_prompt(buyer_prompt: str, allowed_labels: list = None, allowed_tags: list = None) -> str:
     """
     Format the user prompt with buyer input and allowed labels/tags.
@@ -155,19 +192,15 @@ def format_user_prompt(buyer_prompt: str, allowed_labels: list = None, allowed_t
     Returns:
         Formatted user prompt ready for OpenAI
     """
-    if allowed_labels is None:
-        allowed_labels = LABEL_CATALOG
-    if allowed_tags is None:
-        allowed_tags = TAG_CATALOG
-    
-    labels_str = ", ".join(f'"{label}"' for label in allowed_labels)
-    tags_str = ", ".join(f'"{tag}"' for tag in allowed_tags)
+    if allowed_labels is None and allowed_tags is None:
+        prefix = _DEFAULT_USER_PROMPT_PREFIX
+    else:
+        prefix = USER_PROMPT_PREFIX.format(
+            allowed_labels=_quoted_list(LABEL_CATALOG if allowed_labels is None else allowed_labels),
+            allowed_tags=_quoted_list(TAG_CATALOG if allowed_tags is None else allowed_tags)
+        )
     
-    return USER_PROMPT.format(
-        allowed_labels=labels_str,
-        allowed_tags=tags_str,
-        buyer_prompt=buyer_prompt
-    )
+    return f"{prefix}{buyer_prompt}"
 
 
 # Example usage
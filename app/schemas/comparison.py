@@ -3,8 +3,9 @@ Comparison Schemas
 Pydantic models for application comparison responses.
 """
 from __future__ import annotations
+import unicodedata
 from typing import List, Literal
-from pydantic import BaseModel, Field, field_validator
+from pydantic import BaseModel, ConfigDict, Field, PrivateAttr, field_validator, model_validator
 
 
 class ComparisonRequest(BaseModel):
@@ -12,16 +13,33 @@ class ComparisonRequest(BaseModel):
     company_a: str = Field(..., min_length=1, description="First company name")
     company_b: str = Field(..., min_length=1, description="Second company name")
     
+    # Case-folded names, computed once at validation time
+    _key_a: str = PrivateAttr(default="")
+    _key_b: str = PrivateAttr(default="")
+    
     @field_validator('company_a', 'company_b')
     @classmethod
-    def strip_whitespace(cls, v: str) -> str:
-        return v.strip()
+    def normalize_name(cls, v: str) -> str:
+        return unicodedata.normalize("NFKC", v).strip()
+    
+    @model_validator(mode='after')
+    def compute_keys(self) -> "ComparisonRequest":
+        self._key_a = self.company_a.casefold()
+        self._key_b = self.company_b.casefold()
+        return self
+    
+    @property
+    def is_same_company(self) -> bool:
+        """Whether both names refer to the same company (case-insensitive)"""
+        return self._key_a == self._key_b
 
 
 class Highlight(BaseModel):
     """Single highlight/competitive advantage"""
     title: str = Field(..., max_length=100, description="Highlight title (max 8 words)")
     detail: str = Field(..., max_length=300, description="Highlight detail (max 30 words)")
+    
+    model_config = ConfigDict(frozen=True)
 
 
 class AttributeItem(BaseModel):
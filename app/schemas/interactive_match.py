@@ -3,7 +3,7 @@ Interactive Match Schemas
 Pydantic models for interactive matching system.
 """
 from typing import List, Optional, Literal
-from pydantic import BaseModel, Field
+from pydantic import BaseModel, ConfigDict, Field
 
 
 # Core parsing schemas
@@ -14,6 +14,13 @@ class MissingRequirements(BaseModel):
     integrations_needed: int = Field(0, ge=0, description="Number of additional integrations needed")
 
 
+class ExtractedRequirements(BaseModel):
+    """Raw labels, tags and integrations returned by the extraction model"""
+    labels: List[str] = Field(default_factory=list)
+    tags: List[str] = Field(default_factory=list)
+    integrations: List[str] = Field(default_factory=list)
+
+
 class ParsedPromptResult(BaseModel):
     """Result from parsing a user prompt"""
     combined_prompt_english: str = Field(..., description="User prompt translated/normalized to English")
@@ -99,6 +106,8 @@ class MatchResult(BaseModel):
     app_id: str = Field(..., description="Application UUID")
     name: str = Field(..., description="Application name")
     similarity_percent: float = Field(..., description="Match percentage")
+    
+    model_config = ConfigDict(frozen=True)
 
 
 class NeedsMoreResponse(BaseModel):
@@ -1,7 +1,7 @@
 """
 OpenAI API Schemas
 """
-from pydantic import BaseModel, Field
+from pydantic import BaseModel, ConfigDict, Field
 from typing import List, Optional, Literal
 
 
@@ -9,6 +9,8 @@ class Message(BaseModel):
     """Chat message schema"""
     role: Literal["system", "user", "assistant"]
     content: str
+    
+    model_config = ConfigDict(frozen=True)
 
 
 class ChatRequest(BaseModel):
@@ -17,6 +19,8 @@ class ChatRequest(BaseModel):
     model: str = Field(default="gpt-4o-mini", description="Model to use")
     temperature: float = Field(default=0.7, ge=0, le=2, description="Sampling temperature")
     max_tokens: int = Field(default=1000, gt=0, description="Maximum tokens to generate")
+    
+    model_config = ConfigDict(frozen=True)
 
 
 class ChatResponse(BaseModel):
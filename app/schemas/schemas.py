@@ -1,9 +1,9 @@
 """
 Pydantic Schemas for API validation
 """
-from pydantic import BaseModel, EmailStr, Field, field_serializer
+from pydantic import BaseModel, ConfigDict, EmailStr, Field, field_serializer
 from datetime import datetime
-from typing import Optional, List, Any
+from typing import Optional, List
 from uuid import UUID
 
 
@@ -25,8 +25,7 @@ class UserResponse(UserBase):
     is_active: bool
     created_at: datetime
     
-    class Config:
-        from_attributes = True
+    model_config = ConfigDict(from_attributes=True)
 
 
 # Item Schemas
@@ -54,8 +53,7 @@ class ItemResponse(ItemBase):
     is_active: bool
     created_at: datetime
     
-    class Config:
-        from_attributes = True
+    model_config = ConfigDict(from_attributes=True)
 
 
 # Application Schemas
@@ -69,23 +67,15 @@ class ApplicationLinkResponse(BaseModel):
     price_text: Optional[str] = None
     rating: Optional[float] = None
     stars: Optional[int] = 0  # default since not in DB
-    tags: Any = []  # Accept AppTag objects, will be serialized to list of strings
+    tags: List[str] = []  # Tag names, aggregated in the query
     
     @field_serializer('id')
     def serialize_id(self, value: UUID) -> str:
         """Convert UUID to string for JSON response"""
         return str(value)
     
-    @field_serializer('tags')
-    def serialize_tags(self, value) -> List[str]:
-        """Extract tag names from AppTag objects"""
-        if not value:
-            return []
-        return [tag.tag for tag in value]
-   
     
-    class Config:
-        from_attributes = True
+    model_config = ConfigDict(from_attributes=True)
 
 
 # Generic Response Schemas
@@ -119,8 +109,7 @@ class CardResponse(BaseModel):
         """Convert UUID to string for JSON response"""
         return str(value)
     
-    class Config:
-        from_attributes = True
+    model_config = ConfigDict(from_attributes=True)
 
 
 class CardDeleteRequest(BaseModel):
@@ -148,8 +137,7 @@ class CardPromptCommentResponse(BaseModel):
         """Convert UUID to string for JSON response"""
         return str(value)
     
-    class Config:
-        from_attributes = True
+    model_config = ConfigDict(from_attributes=True)
 class CardUpvoteRequest(BaseModel):
     """Schema for upvoting a card"""
     card_id: str = Field(..., description="UUID of the card to upvote")
@@ -4,7 +4,8 @@ Generates concise titles and descriptions for new backlog cards using OpenAI.
 """
 import json
 from typing import Tuple, List
-from app.core.openai_client import client, normalize_to_english
+from app.core.errors import OpenAIServiceError
+from app.core.openai_client import client, normalize_to_english, openai_semaphore
 
 
 SYSTEM_PROMPT = """You are a technical product manager creating backlog cards. Your task is to generate a concise title and description for a feature request card.
@@ -54,7 +55,7 @@ async def generate_card_title_description(
         Tuple of (title, description) both in English
     
     Raises:
-        Exception: If generation fails after retries
+        OpenAIServiceError: If generation fails after retries
     
     Example:
         title, desc = await generate_card_title_description(
@@ -83,13 +84,14 @@ Output the JSON now:"""
     
     for attempt in range(3):
         try:
-            response = await client.chat.completions.create(
-                model="gpt-4o-mini",
-                messages=messages,
-                temperature=0.2,
-                max_tokens=800,
-                response_format={"type": "json_object"}
-            )
+            async with openai_semaphore:
+                response = await client.chat.completions.create(
+                    model="gpt-4o-mini",
+                    messages=messages,
+                    temperature=0.2,
+                    max_tokens=800,
+                    response_format={"type": "json_object"}
+                )
             
             content = response.choices[0].message.content.strip()
             data = json.loads(content)
@@ -125,7 +127,7 @@ Output the JSON now:"""
         except Exception as e:
             if attempt < 2:
                 continue
-            raise Exception(f"Failed to generate card after {attempt + 1} attempts: {str(e)}")
+            raise OpenAIServiceError(f"Failed to generate card after {attempt + 1} attempts: {str(e)}")
     
     return generate_fallback(normalized_text)
 
@@ -7,6 +7,7 @@ from typing import List, Tuple, Optional, Union
 from uuid import UUID
 from sqlalchemy.ext.asyncio import AsyncSession
 from sqlalchemy import select, func
+from app.core.errors import ExternalServiceError
 from app.models.models import Card, CardPromptComment
 from app.services.backlog_similarity import evaluate_similarity
 
@@ -123,6 +124,8 @@ async def find_matching_card_id(
         
         return 0
     
+    except ExternalServiceError:
+        raise
     except Exception as e:
         raise Exception(f"Error finding matching card: {str(e)}")
 
@@ -185,6 +188,8 @@ async def find_best_matching_card(
         
         return (best_match_id, best_similarity)
     
+    except ExternalServiceError:
+        raise
     except Exception as e:
         raise Exception(f"Error finding best matching card: {str(e)}")
 
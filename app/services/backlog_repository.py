@@ -9,6 +9,10 @@ from sqlalchemy import select, update
 from app.models.models import Card, CardPromptComment
 
 
+# Card id passed to process_incoming_request when no existing card matched
+ZERO_UUID = UUID(int=0)
+
+
 async def add_prompt_to_existing_card(
     db: AsyncSession,
     card_id: UUID,
@@ -325,7 +329,7 @@ async def process_incoming_request(
         # No match found (card_id is zero UUID)
         card_id = await process_incoming_request(
             db,
-            card_id=UUID('00000000-0000-0000-0000-000000000000'),
+            card_id=ZERO_UUID,
             title="New feature request",
             description="Description here",
             prompt_text="User request",
@@ -344,9 +348,7 @@ async def process_incoming_request(
         )
         # Returns: existing_uuid with incremented counter
     """
-    zero_uuid = UUID('00000000-0000-0000-0000-000000000000')
-    
-    if card_id == zero_uuid or card_id == 0:
+    if card_id == ZERO_UUID or card_id == 0:
         return await create_new_card_with_prompt(
             db,
             title=title,
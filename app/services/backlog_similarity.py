@@ -2,11 +2,14 @@
 Backlog Similarity Evaluation Module
 Compares incoming requests against backlog card prompts using embeddings and cosine similarity.
 """
+import asyncio
 import math
 import time
 from typing import List, Tuple
-from app.matching.algorithm import sigmoid
-from app.core.openai_client import get_embedding, normalize_to_english
+from app.matching.algorithm import scores_to_percentages
+from app.core.errors import ExternalServiceError
+from app.core.openai_client import normalize_to_english
+from app.services.embedding_cache import get_cached_embedding
 
 
 def cosine_similarity(vec_a: List[float], vec_b: List[float]) -> float:
@@ -36,7 +39,8 @@ def cosine_similarity(vec_a: List[float], vec_b: List[float]) -> float:
 def similarity_to_percentage(similarity: float) -> int:
     """
     Convert cosine similarity to interpretable percentage using sigmoid.
-    Reuses the same transformation as the marketplace matching algorithm.
+    Reuses the same transformation (precomputed thresholds, no exp per call)
+    as the marketplace matching algorithm.
     
     Args:
         similarity: Cosine similarity score in [0, 1]
@@ -44,15 +48,14 @@ def similarity_to_percentage(similarity: float) -> int:
     Returns:
         Percentage in [0, 100]
     """
-    transformed = sigmoid(10 * (similarity - 0.5))
-    percentage = round(100 * transformed)
-    return max(0, min(100, percentage))
+    return int(scores_to_percentages(similarity))
 
 
 async def compute_embedding(text: str) -> List[float]:
     """
     Generate embedding vector for text using OpenAI.
     Reuses the same model as the marketplace matching algorithm.
+    Card prompts are re-embedded on every ingest, so results are cached by content.
     
     Args:
         text: Text to embed (should be in English)
@@ -60,7 +63,7 @@ async def compute_embedding(text: str) -> List[float]:
     Returns:
         Embedding vector (1536 dimensions)
     """
-    return await get_embedding(text)
+    return await get_cached_embedding(text)
 
 
 async def evaluate_similarity(
@@ -100,11 +103,15 @@ async def evaluate_similarity(
         if incoming_comment and incoming_comment.strip():
             combined_incoming += "\n" + incoming_comment.strip()
         
-        incoming_text = await normalize_to_english(combined_incoming)
-        card_text = await normalize_to_english(card_prompt)
+        incoming_text, card_text = await asyncio.gather(
+            normalize_to_english(combined_incoming),
+            normalize_to_english(card_prompt)
+        )
         
-        incoming_embedding = await compute_embedding(incoming_text)
-        card_embedding = await compute_embedding(card_text)
+        incoming_embedding, card_embedding = await asyncio.gather(
+            compute_embedding(incoming_text),
+            compute_embedding(card_text)
+        )
         
         similarity = cosine_similarity(incoming_embedding, card_embedding)
         
@@ -112,6 +119,8 @@ async def evaluate_similarity(
         
         return percentage
     
+    except ExternalServiceError:
+        raise
     except Exception as e:
         raise Exception(f"Error evaluating similarity: {str(e)}")
 
@@ -152,20 +161,22 @@ async def batch_evaluate_similarity(
         incoming_text = await normalize_to_english(combined_incoming)
         incoming_embedding = await compute_embedding(incoming_text)
         
-        results = []
-        
-        for card_id, card_prompt in card_prompts:
+        async def score_card(card_id: str, card_prompt: str) -> Tuple[str, int]:
             card_text = await normalize_to_english(card_prompt)
             card_embedding = await compute_embedding(card_text)
             
             similarity = cosine_similarity(incoming_embedding, card_embedding)
-            percentage = similarity_to_percentage(similarity)
-            
-            results.append((card_id, percentage))
+            return (card_id, similarity_to_percentage(similarity))
+        
+        results = list(await asyncio.gather(
+            *(score_card(card_id, card_prompt) for card_id, card_prompt in card_prompts)
+        ))
         
         results.sort(key=lambda x: x[1], reverse=True)
         
         return results
     
+    except ExternalServiceError:
+        raise
     except Exception as e:
         raise Exception(f"Error in batch similarity evaluation: {str(e)}")
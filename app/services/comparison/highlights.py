@@ -7,7 +7,7 @@ import asyncio
 from typing import List, Dict, Optional
 from sqlalchemy.ext.asyncio import AsyncSession
 
-from app.core.openai_client import client
+from app.core.openai_client import client, openai_semaphore
 from app.services.comparison.repository import (
     get_app_by_name,
     get_features_text,
@@ -89,18 +89,19 @@ async def generate_highlights(features_text: str) -> List[Dict[str, str]]:
         return FALLBACK_HIGHLIGHTS
     
     async def _call():
-        response = await client.chat.completions.create(
-            model="gpt-4o-mini",
-            messages=[
-                {"role": "system", "content": HIGHLIGHTS_SYSTEM_PROMPT},
-                {"role": "user", "content": HIGHLIGHTS_USER_PROMPT.format(
-                    features_text=features_text[:4000]
-                )}
-            ],
-            temperature=0.2,
-            max_tokens=800,
-            response_format={"type": "json_object"}
-        )
+        async with openai_semaphore:
+            response = await client.chat.completions.create(
+                model="gpt-4o-mini",
+                messages=[
+                    {"role": "system", "content": HIGHLIGHTS_SYSTEM_PROMPT},
+                    {"role": "user", "content": HIGHLIGHTS_USER_PROMPT.format(
+                        features_text=features_text[:4000]
+                    )}
+                ],
+                temperature=0.2,
+                max_tokens=800,
+                response_format={"type": "json_object"}
+            )
         content = response.choices[0].message.content.strip()
         return json.loads(content)
     
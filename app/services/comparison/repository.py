@@ -7,6 +7,13 @@ from uuid import UUID
 from sqlalchemy.ext.asyncio import AsyncSession
 from sqlalchemy import select, text, func
 
+from app.core.cache import TTLCache
+
+
+# Resolved company names (exact input -> app); only hits are cached so a
+# newly loaded company is found on the next request
+_apps_by_name = TTLCache(maxsize=4096, ttl=300)
+
 
 async def get_app_by_name(db: AsyncSession, company_name: str) -> Optional[Dict]:
     """
@@ -20,6 +27,10 @@ async def get_app_by_name(db: AsyncSession, company_name: str) -> Optional[Dict]
     Returns:
         Dict with app_id and name, or None if not found
     """
+    cached = _apps_by_name.get(company_name)
+    if cached is not None:
+        return dict(cached)
+    
     query = text("""
         SELECT id, name
         FROM application
@@ -33,10 +44,12 @@ async def get_app_by_name(db: AsyncSession, company_name: str) -> Optional[Dict]
     row = result.fetchone()
     
     if row:
-        return {
+        app_data = {
             "app_id": row[0],
             "name": row[1]
         }
+        _apps_by_name.set(company_name, app_data)
+        return dict(app_data)
     return None
 
 
@@ -0,0 +1,96 @@
+"""
+Embedding Cache Module
+Content-addressed cache for OpenAI embeddings: an in-process tier backed by
+the embedding_cache table in Postgres, shared across workers and restarts.
+"""
+import asyncio
+import hashlib
+from typing import List, Optional, Set
+
+import numpy as np
+
+from app.core.cache import TTLCache
+from app.core.database import get_asyncpg_pool
+from app.core.openai_client import get_embedding
+
+
+EMBEDDING_MODEL = "text-embedding-3-small"
+EMBEDDING_TTL_SECONDS = 7 * 24 * 3600
+
+# Vectors are stored as float16 bytes (~3 KB per 1536-dim embedding)
+_embeddings = TTLCache(maxsize=10_000, ttl=EMBEDDING_TTL_SECONDS)
+
+# Pending write-throughs to the persistent tier (kept referenced until done)
+_pending_writes: Set[asyncio.Task] = set()
+
+
+def _cache_key(text: str, model: str) -> bytes:
+    return hashlib.sha256(f"{model}:{text}".encode("utf-8")).digest()
+
+
+# Embeddings travel in pgvector's binary format: the pool registers the
+# vector codec on every connection, which maps vector <-> float32 ndarray
+async def _load_persisted(key: bytes) -> Optional[np.ndarray]:
+    """Read an embedding from the embedding_cache table (None on miss or error)"""
+    try:
+        pool = await get_asyncpg_pool()
+        return await pool.fetchval(
+            "SELECT embedding FROM embedding_cache WHERE hash = $1",
+            key
+        )
+    except Exception as e:
+        print(f"⚠️  Embedding cache lookup failed: {str(e)}")
+        return None
+
+
+async def _persist(key: bytes, model: str, embedding: List[float]) -> None:
+    """Write an embedding to the embedding_cache table (errors are logged)"""
+    try:
+        pool = await get_asyncpg_pool()
+        await pool.execute(
+            """
+            INSERT INTO embedding_cache (hash, model, embedding)
+            VALUES ($1, $2, $3)
+            ON CONFLICT (hash) DO NOTHING
+            """,
+            key, model, np.asarray(embedding, dtype=np.float32)
+        )
+    except Exception as e:
+        print(f"⚠️  Embedding cache write failed: {str(e)}")
+
+
+async def get_cached_embedding(text: str, model: str = EMBEDDING_MODEL) -> List[float]:
+    """
+    Get an embedding, reusing a cached vector for previously seen text.
+    
+    Looks up the in-process cache, then the embedding_cache table, and only
+    then calls the API; new vectors are written through to both tiers.
+    
+    Args:
+        text: Text to embed
+        model: Embedding model to use
+    
+    Returns:
+        Embedding vector
+    """
+    key = _cache_key(text, model)
+    
+    cached = _embeddings.get(key)
+    if cached is not None:
+        return np.frombuffer(cached, dtype=np.float16).astype(np.float32).tolist()
+    
+    embedding = await _load_persisted(key)
+    if embedding is not None:
+        _embeddings.set(key, embedding.astype(np.float16).tobytes())
+        return embedding.tolist()
+    
+    embedding = await get_embedding(text, model)
+    _embeddings.set(key, np.asarray(embedding, dtype=np.float16).tobytes())
+    
+    # Persist in the background so the caller does not wait for the insert
+    task = asyncio.get_running_loop().create_task(_persist(key, model, embedding))
+    _pending_writes.add(task)
+    task.add_done_callback(_pending_writes.discard)
+    
+    return embedding
+
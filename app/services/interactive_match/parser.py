@@ -2,11 +2,16 @@
 Interactive Match Parser
 Multi-turn prompt parser with validation and missing requirements detection.
 """
+import asyncio
+import hashlib
 import json
 from typing import Optional, Tuple, List
-from app.core.openai_client import client
-from app.prompts.buyer_parser_prompts import LABEL_CATALOG, TAG_CATALOG
-from app.schemas.interactive_match import ParsedPromptResult, PriorState, MissingRequirements
+from app.core.cache import SingleFlight, TTLCache
+from app.core.openai_client import client, openai_semaphore
+from app.prompts.buyer_parser_prompts import LABEL_CATALOG, TAG_CATALOG, normalize_label
+from app.services.embedding_cache import get_cached_embedding
+from app.services.semantic_cache import SemanticCache
+from app.schemas.interactive_match import ExtractedRequirements, ParsedPromptResult, PriorState, MissingRequirements
 from app.services.validation_helpers import (
     validate_parsed_data,
     deduplicate_and_normalize_tags,
@@ -50,9 +55,10 @@ EXTRACTION GUIDELINES:
 - If nothing found for a category, use empty array []."""
 
 
-def format_extraction_prompt(english_text: str) -> str:
-    """Format user prompt for extraction"""
-    return f"""Extract structured data from this business application requirement:
+# Static part of the extraction prompt, built once. The user text goes last so
+# every request shares the same prefix, which OpenAI's prompt caching reuses
+EXTRACTION_PROMPT_PREFIX = f"""Extract structured data from the business application requirement below.
+Return ONLY the JSON object with labels, tags, and integrations arrays.
 
 ALLOWED LABELS (choose ONLY from these):
 {json.dumps(LABEL_CATALOG)}
@@ -61,12 +67,31 @@ ALLOWED TAGS (choose from these or create similar ones):
 {json.dumps(TAG_CATALOG)}
 
 USER TEXT:
-{english_text}
+"""
+
 
-Return ONLY the JSON object with labels, tags, and integrations arrays."""
+# Translation + extraction results per user text. Exact repeats (ignoring case
+# and whitespace) hit the first tier and skip both chat calls; paraphrases are
+# found by embedding similarity in the second, which only holds extractions:
+# the caller's own text is still translated, since it feeds the final prompt.
+PARSE_CACHE_TTL_SECONDS = 24 * 3600
+PARSE_CACHE_SIMILARITY_THRESHOLD = 0.95
+_parsed_texts = TTLCache(maxsize=10_000, ttl=PARSE_CACHE_TTL_SECONDS)
+_similar_parsed_texts = SemanticCache(
+    maxsize=2048,
+    dim=1536,
+    threshold=PARSE_CACHE_SIMILARITY_THRESHOLD,
+    ttl=PARSE_CACHE_TTL_SECONDS
+)
+_parse_flights = SingleFlight()
+
+
+def format_extraction_prompt(english_text: str) -> str:
+    """Format user prompt for extraction"""
+    return EXTRACTION_PROMPT_PREFIX + english_text
 
 
-async def translate_to_english(user_prompt: str) -> str:
+async def translate_to_english(user_prompt: str) -> Tuple[str, bool]:
     """
     Translate user prompt to English if needed.
     
@@ -74,23 +99,25 @@ async def translate_to_english(user_prompt: str) -> str:
         user_prompt: User input in any language
         
     Returns:
-        English text
+        Tuple of (english_text, translated); on a translation failure the
+        original text is returned with translated=False
     """
     try:
-        response = await client.chat.completions.create(
-            model="gpt-4o-mini",
-            messages=[
-                {"role": "system", "content": TRANSLATION_SYSTEM_PROMPT},
-                {"role": "user", "content": user_prompt}
-            ],
-            temperature=0.2,
-            max_tokens=500
-        )
+        async with openai_semaphore:
+            response = await client.chat.completions.create(
+                model="gpt-4o-mini",
+                messages=[
+                    {"role": "system", "content": TRANSLATION_SYSTEM_PROMPT},
+                    {"role": "user", "content": user_prompt}
+                ],
+                temperature=0.2,
+                max_tokens=500
+            )
         
-        return response.choices[0].message.content.strip()
+        return response.choices[0].message.content.strip(), True
     except Exception as e:
         print(f"Translation error: {e}. Using original text.")
-        return user_prompt
+        return user_prompt, False
 
 
 async def extract_structured_data(english_text: str) -> dict:
@@ -106,24 +133,22 @@ async def extract_structured_data(english_text: str) -> dict:
     user_prompt = format_extraction_prompt(english_text)
     
     try:
-        response = await client.chat.completions.create(
-            model="gpt-4o-mini",
-            messages=[
-                {"role": "system", "content": EXTRACTION_SYSTEM_PROMPT},
-                {"role": "user", "content": user_prompt}
-            ],
-            temperature=0.3,
-            max_tokens=800,
-            response_format={"type": "json_object"}
-        )
+        async with openai_semaphore:
+            response = await client.chat.completions.create(
+                model="gpt-4o-mini",
+                messages=[
+                    {"role": "system", "content": EXTRACTION_SYSTEM_PROMPT},
+                    {"role": "user", "content": user_prompt}
+                ],
+                temperature=0.3,
+                max_tokens=800,
+                response_format={"type": "json_object"}
+            )
         
-        result = json.loads(response.choices[0].message.content)
+        # Parse and validate the JSON in one pass
+        result = ExtractedRequirements.model_validate_json(response.choices[0].message.content)
         
-        return {
-            "labels": result.get("labels", []),
-            "tags": result.get("tags", []),
-            "integrations": result.get("integrations", [])
-        }
+        return result.model_dump()
     except Exception as e:
         print(f"Extraction error: {e}")
         return {
@@ -133,9 +158,72 @@ async def extract_structured_data(english_text: str) -> dict:
         }
 
 
+async def translate_and_extract(user_prompt: str) -> Tuple[str, dict]:
+    """
+    Translate user text and extract its structured data, reusing cached
+    results for identical text and cached extractions for semantically
+    equivalent text.
+    
+    Args:
+        user_prompt: User input in any language
+        
+    Returns:
+        Tuple of (english_text, extracted) as produced by translate_to_english
+        and extract_structured_data
+    """
+    key = hashlib.sha256(" ".join(user_prompt.lower().split()).encode("utf-8")).digest()
+    cached = _parsed_texts.get(key)
+    if cached is not None:
+        return cached
+    
+    # Concurrent turns with the same text (retries, double submits) share one
+    # embedding + translation + extraction round
+    result, _ = await _parse_flights.do(key, lambda: _translate_and_extract_uncached(key, user_prompt))
+    return result
+
+
+async def _embed_for_parse_cache(user_prompt: str) -> Optional[List[float]]:
+    """Embedding for the semantic tier (None if it cannot be computed)"""
+    try:
+        return await get_cached_embedding(user_prompt)
+    except Exception as e:
+        print(f"Parse cache embedding error: {e}. Skipping semantic lookup.")
+        return None
+
+
+async def _translate_and_extract_uncached(key: bytes, user_prompt: str) -> Tuple[str, dict]:
+    """Translation, then a semantic cache lookup or the extraction call"""
+    (english_text, translated), embedding = await asyncio.gather(
+        translate_to_english(user_prompt),
+        _embed_for_parse_cache(user_prompt)
+    )
+    
+    extracted = None
+    if embedding is not None:
+        extracted = _similar_parsed_texts.get(embedding)
+    
+    if extracted is None:
+        extracted = await extract_structured_data(english_text)
+        # An empty extraction may be an API failure, and a failed translation
+        # left the text untranslated; only cache real results
+        if not translated or not any(extracted.values()):
+            return english_text, extracted
+        if embedding is not None:
+            _similar_parsed_texts.set(embedding, extracted)
+    elif not translated:
+        # The extraction came from the cache, but the untranslated text must
+        # not be remembered as this text's English version
+        return english_text, extracted
+    
+    result = (english_text, extracted)
+    _parsed_texts.set(key, result)
+    return result
+
+
 def filter_labels_from_catalog(labels: list) -> list:
-    """Filter labels to only include valid catalog items"""
-    return [label for label in labels if label in LABEL_CATALOG]
+    """Filter labels to only include valid catalog items (in catalog spelling, deduplicated)"""
+    normalized = (normalize_label(label) for label in labels)
+    return list(dict.fromkeys(label for label in normalized if label is not None))
 
 
 def merge_with_prior_state(
@@ -180,9 +268,7 @@ async def parse_user_prompt(
     Returns:
         ParsedPromptResult with extracted data and validation status
     """
-    english_text = await translate_to_english(user_prompt)
-    
-    extracted = await extract_structured_data(english_text)
+    english_text, extracted = await translate_and_extract(user_prompt)
     
     current_labels = filter_labels_from_catalog(extracted["labels"])
     current_tags = deduplicate_and_normalize_tags(extracted["tags"])
@@ -6,7 +6,7 @@ import json
 import hashlib
 from typing import Optional, Union
 from pydantic import BaseModel, Field
-from app.core.openai_client import client
+from app.core.openai_client import client, openai_semaphore
 from app.prompts.buyer_parser_prompts import LABEL_CATALOG
 from app.services.interactive_match.parser import parse_user_prompt
 from app.schemas.interactive_match import (
@@ -143,16 +143,17 @@ Generate a question asking about their business context - {examples_text}. Ask f
         return "Can you provide any additional details about your requirements?"
     
     try:
-        response = await client.chat.completions.create(
-            model="gpt-4o-mini",
-            messages=[
-                {"role": "system", "content": QUESTION_GENERATION_SYSTEM_PROMPT},
-                {"role": "user", "content": context}
-            ],
-            temperature=0.3,
-            max_tokens=200,
-            response_format={"type": "json_object"}
-        )
+        async with openai_semaphore:
+            response = await client.chat.completions.create(
+                model="gpt-4o-mini",
+                messages=[
+                    {"role": "system", "content": QUESTION_GENERATION_SYSTEM_PROMPT},
+                    {"role": "user", "content": context}
+                ],
+                temperature=0.3,
+                max_tokens=200,
+                response_format={"type": "json_object"}
+            )
         
         result = json.loads(response.choices[0].message.content)
         return result.get("question", "What other requirements do you have?")
@@ -7,12 +7,12 @@ import asyncpg
 from app.matching.algorithm import run_match
 from app.schemas.interactive_match import SessionState
 from app.services.prompt_composer import compose_final_prompt, format_for_matching_service
-from app.core.openai_client import client
+from app.services.embedding_cache import get_cached_embedding
 
 
 async def generate_embedding(text: str) -> List[float]:
     """
-    Generate embedding vector for text using OpenAI.
+    Generate embedding vector for text using OpenAI (cached by content).
     
     Args:
         text: Text to embed
@@ -20,12 +20,7 @@ async def generate_embedding(text: str) -> List[float]:
     Returns:
         Embedding vector (1536 floats)
     """
-    response = await client.embeddings.create(
-        model="text-embedding-3-small",
-        input=text[:8000]
-    )
-    
-    return response.data[0].embedding
+    return await get_cached_embedding(text[:8000])
 
 
 async def run_final_match(
@@ -69,31 +64,6 @@ async def run_final_match(
     return final_prompt_text, matches
 
 
-async def get_app_names(conn: asyncpg.Connection, app_ids: List[str]) -> Dict[str, str]:
-    """
-    Batch fetch application names.
-    
-    Args:
-        conn: Database connection
-        app_ids: List of application UUIDs
-        
-    Returns:
-        Dict mapping app_id -> app_name
-    """
-    if not app_ids:
-        return {}
-    
-    query = """
-        SELECT id, name
-        FROM application
-        WHERE id = ANY($1::uuid[])
-    """
-    
-    rows = await conn.fetch(query, app_ids)
-    
-    return {str(row["id"]): row["name"] for row in rows}
-
-
 async def run_final_match_with_names(
     conn: asyncpg.Connection,
     state: SessionState,
@@ -101,7 +71,10 @@ async def run_final_match_with_names(
     top_n: int = 10
 ) -> Dict[str, Any]:
     """
-    Execute matching and enrich results with application names.
+    Execute matching and return results with application names.
+    
+    Names come back with the vector candidates in the same query, so no
+    extra lookup is needed after ranking.
     
     Args:
         conn: Database connection
@@ -117,13 +90,10 @@ async def run_final_match_with_names(
     """
     final_prompt_text, matches = await run_final_match(conn, state, top_k, top_n)
     
-    app_ids = [match["app_id"] for match in matches]
-    app_names = await get_app_names(conn, app_ids)
-    
     results = [
         {
             "app_id": match["app_id"],
-            "name": app_names.get(match["app_id"], "Unknown"),
+            "name": match["name"] or "Unknown",
             "similarity_percent": match["similarity_percent"]
         }
         for match in matches
@@ -2,9 +2,71 @@
 Tavily Search Service for Provider Suggestions
 Real web search powered by Tavily API
 """
+import asyncio
+import hashlib
 from typing import Dict, List, Optional
 from urllib.parse import urlparse
 
+import httpx
+
+from app.core.cache import SingleFlight, TTLCache
+from app.core.config import settings
+
+
+# Suggestions keyed by card content; identical cards reuse the web search
+SUGGESTION_TTL_SECONDS = 3600
+_suggestions = TTLCache(maxsize=4096, ttl=SUGGESTION_TTL_SECONDS)
+_suggestion_flights = SingleFlight()
+
+# company_name of the suggestion returned when nothing was found (or the
+# search failed); callers must not cache it
+FALLBACK_COMPANY_NAME = "No specific provider found"
+
+# Bounds on web searches: concurrent searches (protects the Tavily quota and
+# the event loop) and total time per card search, including the wait for a slot
+MAX_CONCURRENT_SEARCHES = 16
+SEARCH_TIMEOUT_SECONDS = 8
+_search_semaphore = asyncio.Semaphore(MAX_CONCURRENT_SEARCHES)
+
+# Tavily REST endpoint, called through one pooled client so the TCP/TLS
+# connection to api.tavily.com is reused across searches
+TAVILY_SEARCH_URL = "https://api.tavily.com/search"
+_http_client: Optional[httpx.AsyncClient] = None
+
+
+def get_http_client() -> httpx.AsyncClient:
+    """
+    Get the shared HTTP client for Tavily, creating it on first use.
+    
+    Returns:
+        Pooled httpx.AsyncClient with keep-alive connections
+    """
+    global _http_client
+    if _http_client is None or _http_client.is_closed:
+        _http_client = httpx.AsyncClient(
+            timeout=httpx.Timeout(10.0, connect=2.0),
+            limits=httpx.Limits(
+                max_connections=100,
+                max_keepalive_connections=20,
+                keepalive_expiry=60.0
+            )
+        )
+    return _http_client
+
+
+async def close_http_client() -> None:
+    """Close the shared HTTP client (call on application shutdown)"""
+    global _http_client
+    if _http_client is not None:
+        await _http_client.aclose()
+        _http_client = None
+
+
+def _suggestion_key(card_title: str, card_description: str) -> str:
+    """Content hash identifying a card's title and description"""
+    payload = f"{(card_title or '').strip()}\x00{(card_description or '').strip()}"
+    return hashlib.blake2b(payload.encode("utf-8"), digest_size=16).hexdigest()
+
 
 async def search_with_tavily(query: str, max_results: int = 5) -> List[Dict]:
     """
@@ -18,23 +80,24 @@ async def search_with_tavily(query: str, max_results: int = 5) -> List[Dict]:
         List of search results with title, url, snippet
     """
     try:
-        from tavily import TavilyClient
-        from app.core.config import settings
-        
         api_key = settings.tavily_api_key
         if not api_key:
             raise ValueError("TAVILY_API_KEY not configured in settings")
         
-        client = TavilyClient(api_key=api_key)
-        
         print(f"🔍 Searching Tavily for: '{query}'")
         
-        # Perform search
-        response = client.search(
-            query=query,
-            max_results=max_results,
-            search_depth="basic"  # or "advanced" for deeper search
+        # Perform search (non-blocking, over the pooled connection)
+        http_response = await get_http_client().post(
+            TAVILY_SEARCH_URL,
+            json={
+                "api_key": api_key,
+                "query": query,
+                "max_results": max_results,
+                "search_depth": "basic"  # or "advanced" for deeper search
+            }
         )
+        http_response.raise_for_status()
+        response = http_response.json()
         
         results = []
         for item in response.get("results", []):
@@ -48,9 +111,6 @@ async def search_with_tavily(query: str, max_results: int = 5) -> List[Dict]:
         print(f"   ✅ Found {len(results)} results")
         return results
         
-    except ImportError:
-        print("❌ Tavily library not installed. Run: pip install tavily-python")
-        return []
     except ValueError as e:
         print(f"❌ Configuration error: {e}")
         return []
@@ -155,7 +215,44 @@ async def suggest_provider_with_tavily(
         
     Returns:
         Dict with company_name, company_url, marketplace_url, reasoning_brief
+    
+    Raises:
+        asyncio.TimeoutError: If the search takes longer than SEARCH_TIMEOUT_SECONDS
     """
+    key = _suggestion_key(card_title, card_description)
+    
+    cached = _suggestions.get(key)
+    if cached is not None:
+        return dict(cached)
+    
+    # Concurrent requests for the same card content share one search; the
+    # timeout is applied inside the shared call so waiters get the same error
+    suggestion, _ = await _suggestion_flights.do(
+        key,
+        lambda: asyncio.wait_for(
+            _search_provider_limited(key, card_title, card_description),
+            timeout=SEARCH_TIMEOUT_SECONDS
+        )
+    )
+    return dict(suggestion)
+
+
+async def _search_provider_limited(
+    key: str,
+    card_title: str,
+    card_description: str
+) -> Dict:
+    """Run _search_provider once a search slot is free"""
+    async with _search_semaphore:
+        return await _search_provider(key, card_title, card_description)
+
+
+async def _search_provider(
+    key: str,
+    card_title: str,
+    card_description: str
+) -> Dict:
+    """Run the Tavily search for a card and cache a found provider under key"""
     print(f"\n🌐 Searching web for provider: '{card_title[:50]}...'")
     
     # Generate queries
@@ -191,12 +288,13 @@ async def suggest_provider_with_tavily(
         words = best_match['reasoning_brief'].split()
         if len(words) > 60:
             best_match['reasoning_brief'] = ' '.join(words[:60]) + '...'
+        _suggestions.set(key, best_match)
         return best_match
     
-    # Fallback if no results
+    # Fallback if no results (not cached: search errors also end up here)
     print("   ⚠️  No results found")
     return {
-        "company_name": "No specific provider found",
+        "company_name": FALLBACK_COMPANY_NAME,
         "company_url": "https://aws.amazon.com/marketplace",
         "marketplace_url": "https://aws.amazon.com/marketplace",
         "reasoning_brief": "No specific providers found in web search. Try AWS Marketplace for general software solutions."
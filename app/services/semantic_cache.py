@@ -0,0 +1,67 @@
+"""
+Semantic Cache Module
+In-process cache looked up by embedding similarity instead of exact key, so
+paraphrased inputs can reuse a previously computed result.
+"""
+import time
+from typing import Any, Optional, Sequence
+
+import numpy as np
+
+
+class SemanticCache:
+    """
+    Fixed-size cache of (unit embedding, value) pairs searched by cosine similarity.
+
+    Entries live in a preallocated matrix that is overwritten in insertion
+    order once full; a lookup is one matrix-vector product over all slots.
+    Not thread-safe; intended for use from the asyncio event loop.
+
+    Args:
+        maxsize: Maximum number of entries kept (oldest overwritten first)
+        dim: Embedding dimension
+        threshold: Minimum cosine similarity for a hit
+        ttl: Time-to-live of each entry in seconds
+    """
+
+    def __init__(self, maxsize: int, dim: int, threshold: float, ttl: float):
+        self.threshold = threshold
+        self.ttl = ttl
+        self._vectors = np.zeros((maxsize, dim), dtype=np.float32)
+        self._expires_at = np.zeros(maxsize)
+        self._values: list = [None] * maxsize
+        self._next = 0
+
+    @staticmethod
+    def _unit(embedding: Sequence[float]) -> Optional[np.ndarray]:
+        vector = np.asarray(embedding, dtype=np.float32)
+        norm = np.linalg.norm(vector)
+        return vector / norm if norm > 0 else None
+
+    def get(self, embedding: Sequence[float], default: Any = None) -> Any:
+        vector = self._unit(embedding)
+        if vector is None:
+            return default
+
+        similarities = self._vectors @ vector
+        similarities[self._expires_at < time.monotonic()] = -1.0
+        best = int(np.argmax(similarities))
+        if similarities[best] < self.threshold:
+            return default
+        return self._values[best]
+
+    def set(self, embedding: Sequence[float], value: Any) -> None:
+        vector = self._unit(embedding)
+        if vector is None:
+            return
+
+        slot = self._next
+        self._vectors[slot] = vector
+        self._expires_at[slot] = time.monotonic() + self.ttl
+        self._values[slot] = value
+        self._next = (slot + 1) % len(self._values)
+
+    def clear(self) -> None:
+        self._expires_at[:] = 0
+        self._values = [None] * len(self._values)
+        self._next = 0
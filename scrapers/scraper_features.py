@@ -1,110 +1,570 @@
 from selenium import webdriver
-from selenium.webdriver.common.by import By
-from selenium.webdriver.support.ui import WebDriverWait
-from selenium.webdriver.support import expected_conditions as EC
 from selenium.webdriver.chrome.options import Options
+from selenium.webdriver.chrome.remote_connection import ChromiumRemoteConnection
+from selenium.webdriver.chrome.service import Service
+from selenium.webdriver.common.driver_finder import DriverFinder
+from selenium.common.exceptions import InvalidSessionIdException, NoSuchWindowException, TimeoutException, WebDriverException
+import asyncio
+import atexit
+from concurrent.futures import ThreadPoolExecutor
 import time
 import csv
 import json
+import os
+import threading
+from email.utils import parsedate_to_datetime
 
-def scrape_app_features(url, app_name):
+try:
+    import httpx
+    from selectolax.parser import HTMLParser
+except ImportError:
+    # Sin httpx/selectolax se usa solo Selenium
+    httpx = None
+    HTMLParser = None
+
+try:
+    import orjson
+except ImportError:
+    # Sin orjson se usa el json estándar
+    orjson = None
+
+USER_AGENT = 'Mozilla/5.0 (Windows NT 10.0; Win64; x64) AppleWebKit/537.36 (KHTML, like Gecko) Chrome/120.0.0.0 Safari/537.36'
+# Secciones de features: divs dentro del primer <component>/<section>
+FEATURES_CSS = 'component:first-of-type > section > div'
+# Textos de todas las secciones en una sola llamada (innerText, como .text)
+JS_TEXTOS_FEATURES = (
+    f"return Array.from(document.querySelectorAll('{FEATURES_CSS}'))"
+    ".map(d => d.innerText.trim()).filter(Boolean);"
+)
+# Tiempo máximo de espera a las secciones y cada cuánto se consultan
+ESPERA_FEATURES = 10
+INTERVALO_SONDEO = 0.25
+
+# Recursos que Chrome no necesita descargar
+BLOCKED_URLS = ['*.png', '*.jpg', '*.jpeg', '*.gif', '*.svg', '*.webp', '*.woff', '*.woff2', '*.ttf']
+
+# Número de navegadores (y de apps) procesados en paralelo
+MAX_CONCURRENCY = 5
+# Reciclar cada navegador tras N usos para evitar fugas de memoria de Chrome
+MAX_USOS_POR_DRIVER = 100
+# Límite global de requests por segundo (token bucket compartido por los workers)
+REQUESTS_POR_SEGUNDO = 5
+# Espera por defecto si el servidor responde 429/503 sin Retry-After
+ESPERA_POR_DEFECTO = 30
+
+
+# Un único proceso chromedriver compartido por todos los navegadores
+_servicio = None
+_servicio_lock = threading.Lock()
+
+
+def obtener_servicio(chrome_options):
     """
-    Extrae todas las features de una app
+    Arranca (una sola vez) el chromedriver compartido y lo devuelve
+    
+    webdriver.Chrome() lanza un chromedriver nuevo por navegador; así cada
+    navegador nuevo es solo una sesión más contra el mismo proceso.
+    """
+    global _servicio
+    with _servicio_lock:
+        if _servicio is None:
+            servicio = Service(port=0)
+            servicio.path = DriverFinder.get_path(servicio, chrome_options)
+            servicio.start()
+            _servicio = servicio
+        return _servicio
+
+
+def detener_servicio():
+    """Detiene el chromedriver compartido si está en marcha"""
+    global _servicio
+    with _servicio_lock:
+        if _servicio is not None:
+            try:
+                _servicio.stop()
+            except Exception:
+                pass
+            _servicio = None
+
+
+def initialise_webdriver():
+    """
+    Crea un navegador Chrome headless con las opciones del scraper
+    
+    Returns:
+        Instancia de webdriver.Remote conectada al chromedriver compartido
+    """
+    chrome_options = Options()
+    chrome_options.add_argument('--headless')
+    chrome_options.add_argument('--no-sandbox')
+    chrome_options.add_argument('--disable-dev-shm-usage')
+    chrome_options.add_argument('--disable-gpu')
+    chrome_options.add_argument('--window-size=1920,1080')
+    chrome_options.add_argument(f'user-agent={USER_AGENT}')
+    
+    # Solo se lee el texto: no cargar imágenes ni servicios de fondo
+    chrome_options.add_argument('--blink-settings=imagesEnabled=false')
+    chrome_options.add_argument('--disable-extensions')
+    chrome_options.add_argument('--disable-background-networking')
+    chrome_options.add_argument('--disable-sync')
+    chrome_options.add_argument('--mute-audio')
+    chrome_options.add_argument('--disable-features=TranslateUI,BlinkGenPropertyTrees')
+    chrome_options.add_experimental_option('prefs', {
+        'profile.managed_default_content_settings.images': 2,
+        'profile.default_content_setting_values.notifications': 2
+    })
+    # No esperar a subrecursos: esperamos explícitamente al <component>
+    chrome_options.page_load_strategy = 'eager'
+    
+    servicio = obtener_servicio(chrome_options)
+    # La conexión de Chromium registra el comando CDP que Remote no trae
+    conexion = ChromiumRemoteConnection(
+        remote_server_addr=servicio.service_url,
+        vendor_prefix='goog',
+        browser_name='chrome'
+    )
+    driver = webdriver.Remote(command_executor=conexion, options=chrome_options)
+    
+    # Bloquear imágenes y fuentes a nivel de red. El CSS se mantiene porque
+    # innerText depende de la visibilidad calculada de los elementos.
+    _cdp(driver, 'Network.enable', {})
+    _cdp(driver, 'Network.setBlockedURLs', {'urls': BLOCKED_URLS})
+    
+    return driver
+
+
+def _cdp(driver, cmd, params):
+    """Ejecuta un comando CDP (equivalente a Chrome.execute_cdp_cmd)"""
+    return driver.execute('executeCdpCommand', {'cmd': cmd, 'params': params})['value']
+
+
+class TokenBucket:
+    """
+    Limitador de requests por segundo compartido por todos los workers
+    
+    Permite ráfagas de hasta `capacidad` requests y después `rate` por
+    segundo. Si el servidor pide esperar (Retry-After), cooldown() bloquea
+    todas las requests hasta que pase ese tiempo.
+    """
+    
+    def __init__(self, rate, capacidad):
+        self.rate = rate
+        self.capacidad = capacidad
+        self._tokens = capacidad
+        self._ultimo = time.monotonic()
+        self._bloqueado_hasta = 0.0
+        self._lock = asyncio.Lock()
+    
+    async def acquire(self):
+        """Espera hasta que haya un token disponible y lo consume"""
+        async with self._lock:
+            while True:
+                ahora = time.monotonic()
+                if ahora < self._bloqueado_hasta:
+                    await asyncio.sleep(self._bloqueado_hasta - ahora)
+                    continue
+                self._tokens = min(self.capacidad, self._tokens + (ahora - self._ultimo) * self.rate)
+                self._ultimo = ahora
+                if self._tokens >= 1:
+                    self._tokens -= 1
+                    return
+                await asyncio.sleep((1 - self._tokens) / self.rate)
+    
+    def cooldown(self, segundos):
+        """Pausa todas las requests durante `segundos`"""
+        self._bloqueado_hasta = max(self._bloqueado_hasta, time.monotonic() + segundos)
+
+
+def _segundos_retry_after(valor):
+    """Convierte una cabecera Retry-After (segundos o fecha HTTP) a segundos"""
+    if not valor:
+        return ESPERA_POR_DEFECTO
+    try:
+        return max(0.0, float(valor))
+    except ValueError:
+        pass
+    try:
+        return max(0.0, parsedate_to_datetime(valor).timestamp() - time.time())
+    except (TypeError, ValueError):
+        return ESPERA_POR_DEFECTO
+
+
+def cerrar_driver(driver):
+    """Cierra un navegador ignorando errores (p. ej. si ya se cayó)"""
+    try:
+        driver.quit()
+    except Exception:
+        pass
+
+
+class BrowserPool:
+    """
+    Pool de navegadores Chrome reutilizables entre apps
+    
+    Los navegadores se crean una sola vez al inicio y se prestan a cada tarea
+    con acquire()/release(). Cada navegador se recicla tras max_usos usos y
+    se reemplaza si se cae durante un scraping. Si no se puede crear el
+    reemplazo, el pool se queda con un navegador menos.
+    """
+    
+    def __init__(self, size, max_usos=MAX_USOS_POR_DRIVER):
+        self.size = size
+        self.max_usos = max_usos
+        self._queue = asyncio.Queue()
+        self._usos = {}
+        # Navegadores que siguen en el pool (prestados o libres)
+        self._vivos = 0
+        # Un hilo por navegador: cada driver solo lo usa un hilo a la vez
+        self.executor = ThreadPoolExecutor(max_workers=size, thread_name_prefix='chrome')
+        # Garantiza que no queden procesos de Chrome huérfanos al salir
+        atexit.register(self.quit_all)
+    
+    async def start(self):
+        """Arranca todos los navegadores del pool en paralelo"""
+        loop = asyncio.get_running_loop()
+        drivers = await asyncio.gather(
+            *[loop.run_in_executor(self.executor, initialise_webdriver) for _ in range(self.size)]
+        )
+        for driver in drivers:
+            self._usos[driver] = 0
+            self._queue.put_nowait(driver)
+        self._vivos = len(drivers)
+    
+    async def acquire(self):
+        """
+        Toma un navegador libre (espera si no hay ninguno disponible)
+        
+        Raises:
+            RuntimeError: Si el pool se quedó sin navegadores
+        """
+        driver = await self._queue.get()
+        if driver is None:
+            # Marca de pool vacío: se deja para despertar al siguiente
+            self._queue.put_nowait(None)
+            raise RuntimeError("No quedan navegadores en el pool")
+        return driver
+    
+    async def release(self, driver):
+        """Devuelve un navegador al pool, reciclándolo si alcanzó max_usos"""
+        self._usos[driver] = self._usos.get(driver, 0) + 1
+        if self._usos[driver] >= self.max_usos:
+            try:
+                driver = await self.discard(driver)
+            except Exception as e:
+                print(f"  ❌ No se pudo reciclar el navegador: {e}")
+                return
+        self._queue.put_nowait(driver)
+    
+    async def discard(self, driver):
+        """
+        Descarta un navegador (caído o gastado) y devuelve uno nuevo
+        
+        Raises:
+            Exception: Si no se pudo crear el reemplazo; el hueco se elimina
+                del pool y el navegador descartado no debe devolverse
+        """
+        try:
+            return await self._reemplazar(driver)
+        except Exception:
+            self._vivos -= 1
+            if self._vivos == 0:
+                self._queue.put_nowait(None)
+            raise
+    
+    async def _reemplazar(self, driver):
+        loop = asyncio.get_running_loop()
+        self._usos.pop(driver, None)
+        await loop.run_in_executor(self.executor, cerrar_driver, driver)
+        nuevo = await loop.run_in_executor(self.executor, initialise_webdriver)
+        self._usos[nuevo] = 0
+        return nuevo
+    
+    async def close(self):
+        """Cierra todos los navegadores del pool"""
+        loop = asyncio.get_running_loop()
+        while not self._queue.empty():
+            driver = self._queue.get_nowait()
+            if driver is None:
+                continue
+            self._usos.pop(driver, None)
+            await loop.run_in_executor(self.executor, cerrar_driver, driver)
+        self.executor.shutdown(wait=False)
+        detener_servicio()
+    
+    def quit_all(self):
+        """Cierra cualquier navegador que siga vivo (usado por atexit)"""
+        for driver in list(self._usos):
+            cerrar_driver(driver)
+        self._usos.clear()
+        detener_servicio()
+
+
+def _esperar_textos_features(driver):
+    """
+    Devuelve el texto de cada sección de features, esperando a que carguen
     
     Args:
+        driver: Navegador Chrome con la página de features abierta
+        
+    Returns:
+        Lista con el texto (no vacío) de cada sección; vacía si no aparecen
+        antes de ESPERA_FEATURES segundos
+    """
+    limite = time.monotonic() + ESPERA_FEATURES
+    while True:
+        textos = driver.execute_script(JS_TEXTOS_FEATURES)
+        if textos or time.monotonic() >= limite:
+            return textos or []
+        time.sleep(INTERVALO_SONDEO)
+
+
+def _sesion_viva(driver):
+    """Comprueba con una llamada mínima si el navegador sigue respondiendo"""
+    try:
+        driver.execute_script("return 1")
+        return True
+    except Exception:
+        return False
+
+
+def _sync_scrape(driver, url, app_name):
+    """
+    Extrae todas las features de una app usando un navegador ya abierto
+    
+    Args:
+        driver: Navegador Chrome del pool
         url: URL de la app
         app_name: Nombre de la app
         
     Returns:
         Diccionario con información de features
+        
+    Raises:
+        WebDriverException: Solo si se perdió la sesión del navegador (el
+            pool lo reemplaza); otros errores de la página devuelven None
     """
-    driver = None
+    # Construir URL de features
+    features_url = _features_url(url)
+    
     try:
-        # Configurar opciones de Chrome
-        chrome_options = Options()
-        chrome_options.add_argument('--headless')
-        chrome_options.add_argument('--no-sandbox')
-        chrome_options.add_argument('--disable-dev-shm-usage')
-        chrome_options.add_argument('--disable-gpu')
-        chrome_options.add_argument('--window-size=1920,1080')
-        chrome_options.add_argument('user-agent=Mozilla/5.0 (Windows NT 10.0; Win64; x64) AppleWebKit/537.36 (KHTML, like Gecko) Chrome/120.0.0.0 Safari/537.36')
-        
-        # Iniciar el navegador
-        driver = webdriver.Chrome(options=chrome_options)
-        
-        # Construir URL de features
-        features_url = url.rstrip('/') + '/features'
-        
         print(f"  Navegando a: {features_url}")
         driver.get(features_url)
         
-        # Esperar a que se cargue el contenido
-        wait = WebDriverWait(driver, 10)
+        # Extraer el texto de todas las secciones con un único execute_script
+        # (un solo round-trip a chromedriver), repitiendo hasta que aparezcan
+        all_features_text = _esperar_textos_features(driver)
         
-        try:
-            # Esperar a que aparezca el componente de features
-            wait.until(EC.presence_of_element_located((By.TAG_NAME, "component")))
-            time.sleep(1)
-        except:
+        if not all_features_text:
             print(f"  ⚠️ No se encontró contenido de features")
             return None
         
-        # Buscar todos los divs dentro de component[1]/section
-        # XPath base: /html/body/div[2]/main/div/div/div/div/component[1]/section/div[XXX]
-        base_xpath = "//component[1]/section/div"
+        print(f"  ✓ Encontrados {len(all_features_text)} secciones de features")
         
-        try:
-            feature_divs = driver.find_elements(By.XPATH, base_xpath)
-            
-            if not feature_divs:
-                print(f"  ⚠️ No se encontraron divs de features")
-                return None
-            
-            print(f"  ✓ Encontrados {len(feature_divs)} secciones de features")
-            
-            all_features_text = []
-            
-            # Extraer todo el texto de cada div
-            for i, div in enumerate(feature_divs, 1):
-                try:
-                    # Obtener todo el texto del div y sus subdivisiones
-                    text = div.text.strip()
-                    if text:
-                        all_features_text.append(text)
-                        print(f"    - Sección {i}: {len(text)} caracteres")
-                except Exception as e:
-                    print(f"    ⚠️ Error en sección {i}: {e}")
-                    continue
-            
-            if not all_features_text:
-                print(f"  ⚠️ No se extrajo texto de las features")
-                return None
-            
-            # Combinar todo el texto
-            combined_text = "\n\n".join(all_features_text)
-            
-            return {
-                'nombre': app_name,
-                'url': url,
-                'features_url': features_url,
-                'num_secciones': len(all_features_text),
-                'features_text': combined_text
-            }
-            
-        except Exception as e:
-            print(f"  ❌ Error al extraer features: {e}")
-            return None
+        # Combinar todo el texto
+        combined_text = "\n\n".join(all_features_text)
+        
+        # Limpiar cookies para que la siguiente app empiece con sesión limpia
+        driver.delete_all_cookies()
+        
+        return {
+            'nombre': app_name,
+            'url': url,
+            'features_url': features_url,
+            'num_secciones': len(all_features_text),
+            'features_text': combined_text
+        }
     
+    except TimeoutException:
+        print(f"  ⚠️ Tiempo de espera agotado en {features_url}")
+        return None
+    except (InvalidSessionIdException, NoSuchWindowException):
+        # El navegador se cayó: lo reemplaza el pool
+        raise
+    except WebDriverException as e:
+        # Un error de la página (p. ej. JavascriptException) no invalida el
+        # navegador; solo se reemplaza si ya no responde
+        if not _sesion_viva(driver):
+            raise
+        print(f"  ❌ Error de WebDriver: {e}")
+        return None
     except Exception as e:
         print(f"  ❌ Error general: {e}")
         return None
+
+
+def _features_url(url):
+    """Construye la URL de la página de features de una app"""
+    return url.rstrip('/') + '/features'
+
+
+async def fetch_features_static(client, url, app_name, limiter=None):
+    """
+    Extrae las features con una petición HTTP simple, sin navegador
+    
+    Args:
+        client: httpx.AsyncClient compartido
+        url: URL de la app
+        app_name: Nombre de la app
+        limiter: TokenBucket compartido (opcional)
+        
+    Returns:
+        Diccionario con información de features, o None si la página
+        necesita JavaScript (o falla) y hay que usar Selenium
+    """
+    features_url = _features_url(url)
+    if limiter is not None:
+        await limiter.acquire()
+    try:
+        response = await client.get(features_url)
+        if response.status_code in (429, 503) and limiter is not None:
+            # El servidor pide frenar: pausar a todos los workers
+            espera = _segundos_retry_after(response.headers.get('Retry-After'))
+            print(f"  ⚠️ {response.status_code} en {app_name}, pausando {espera:.0f}s")
+            limiter.cooldown(espera)
+        response.raise_for_status()
+    except httpx.HTTPError as e:
+        print(f"  ⚠️ Petición estática fallida para {app_name}: {e}")
+        return None
+    
+    tree = HTMLParser(response.text)
+    all_features_text = []
+    for node in tree.css(FEATURES_CSS):
+        text = node.text(separator='\n', strip=True)
+        if text:
+            all_features_text.append(text)
+    
+    if not all_features_text:
+        return None
+    
+    print(f"  ✓ {app_name}: {len(all_features_text)} secciones (HTML estático)")
+    return {
+        'nombre': app_name,
+        'url': url,
+        'features_url': features_url,
+        'num_secciones': len(all_features_text),
+        'features_text': "\n\n".join(all_features_text)
+    }
+
+
+async def scrape_app_features(pool, client, url, app_name, limiter=None):
+    """
+    Extrae todas las features de una app
+    
+    Intenta primero con HTML estático (httpx + selectolax) y solo usa un
+    navegador del pool si la página necesita JavaScript.
+    
+    Args:
+        pool: BrowserPool con los navegadores disponibles
+        client: httpx.AsyncClient compartido (None para usar solo Selenium)
+        url: URL de la app
+        app_name: Nombre de la app
+        limiter: TokenBucket compartido (opcional)
+        
+    Returns:
+        Diccionario con información de features
+    """
+    if client is not None:
+        features = await fetch_features_static(client, url, app_name, limiter)
+        if features:
+            return features
     
+    loop = asyncio.get_running_loop()
+    driver = await pool.acquire()
+    try:
+        # Un reintento con un navegador nuevo si la sesión se cayó
+        for _ in range(2):
+            if limiter is not None:
+                await limiter.acquire()
+            try:
+                features = await loop.run_in_executor(pool.executor, _sync_scrape, driver, url, app_name)
+                break
+            except WebDriverException as e:
+                print(f"  ❌ Navegador caído scrapeando {app_name}, reemplazándolo: {e}")
+                caido, driver = driver, None
+                features = None
+                try:
+                    driver = await pool.discard(caido)
+                except Exception as e:
+                    # El hueco ya salió del pool: no hay navegador que devolver
+                    print(f"  ❌ No se pudo reemplazar el navegador: {e}")
+                    break
     finally:
-        if driver:
-            driver.quit()
+        if driver is not None:
+            await pool.release(driver)
+    return features
+
+
+def _json_bytes(data):
+    """Serializa a JSON indentado (UTF-8), con orjson si está disponible"""
+    if orjson is not None:
+        return orjson.dumps(data, option=orjson.OPT_INDENT_2)
+    return json.dumps(data, ensure_ascii=False, indent=2).encode('utf-8')
 
 
-def main():
+class FeaturesWriter:
+    """
+    Escribe cada app en los archivos de salida en cuanto termina su scraping
+    
+    Los tres archivos se abren antes de empezar, con un buffer grande, así
+    la memoria no crece con el número de apps y un fallo a mitad del proceso
+    no pierde lo ya extraído. El JSON se escribe como un array incremental
+    para que siga siendo compatible con scripts/load_supabase.py.
+    """
+    
+    BUFFER = 1 << 20
+    SEPARADOR = "="*80
+    
+    def __init__(self, prefijo='features_encontradas'):
+        self.txt_path = f'{prefijo}.txt'
+        self.json_path = f'{prefijo}.json'
+        self.csv_path = f'{prefijo}.csv'
+        self.count = 0
+        self._txt = open(self.txt_path, 'w', encoding='utf-8', buffering=self.BUFFER)
+        # Binario: orjson produce bytes UTF-8 directamente
+        self._json = open(self.json_path, 'wb', buffering=self.BUFFER)
+        self._csv = open(self.csv_path, 'w', encoding='utf-8', newline='', buffering=self.BUFFER)
+        self._csv_writer = csv.DictWriter(
+            self._csv,
+            fieldnames=['nombre', 'url', 'features_url', 'num_secciones', 'features_text']
+        )
+        self._csv_writer.writeheader()
+        self._json.write(b"[")
+    
+    def write(self, feature_data):
+        """Añade una app a los tres archivos"""
+        self.count += 1
+        
+        # Indentar el texto de features (un único write por app)
+        features_text = feature_data['features_text'].replace('\n', '\n   ')
+        self._txt.write(
+            f"{self.count}. {feature_data['nombre']}\n"
+            f"   URL: {feature_data['features_url']}\n"
+            f"   Secciones encontradas: {feature_data['num_secciones']}\n"
+            f"\n   FEATURES:\n"
+            f"   {'-'*76}\n"
+            f"   {features_text}\n"
+            f"\n{self.SEPARADOR}\n\n"
+        )
+        
+        self._json.write((b"\n" if self.count == 1 else b",\n") + _json_bytes(feature_data))
+        
+        self._csv_writer.writerow(feature_data)
+    
+    def close(self, total):
+        """Escribe el resumen final, cierra el JSON y sincroniza a disco"""
+        # El resumen va al final porque el total solo se conoce al terminar
+        self._txt.write(
+            f"Total de apps con features: {self.count}\n"
+            f"Total de apps procesadas: {total}\n"
+        )
+        self._json.write(b"\n]\n" if self.count else b"]\n")
+        for f in (self._txt, self._json, self._csv):
+            f.flush()
+            os.fsync(f.fileno())
+            f.close()
+
+
+async def main():
     print("="*60)
     print("SCRAPER DE FEATURES DE APPS")
     print("="*60)
@@ -121,71 +581,59 @@ def main():
         print("   Ejecuta primero el scraper principal (scraper.py)")
         return
     
-    all_features = []
     total = len(apps)
     
     print("="*60)
     print(f"INICIANDO SCRAPING DE FEATURES ({total} apps)")
     print("="*60 + "\n")
     
-    for i, app in enumerate(apps, 1):
-        app_name = app['nombre']
-        app_link = app['link']
-        
-        print(f"[{i}/{total}] {app_name}")
-        
-        features = scrape_app_features(app_link, app_name)
-        
-        if features:
-            all_features.append(features)
-            print(f"  ✓ Features extraídas exitosamente")
-        else:
-            print(f"  ⚠️ No se pudieron extraer features")
-        
-        print()
-        
-        # Pequeña pausa entre requests
-        time.sleep(1)
+    writer = FeaturesWriter()
+    pool = BrowserPool(MAX_CONCURRENCY)
+    await pool.start()
+    # Un único cliente HTTP compartido para reutilizar conexiones
+    client = None
+    if httpx is not None:
+        client = httpx.AsyncClient(
+            http2=True,
+            follow_redirects=True,
+            headers={'User-Agent': USER_AGENT},
+            timeout=15
+        )
+    sem = asyncio.Semaphore(MAX_CONCURRENCY)
+    # Sustituye a la pausa fija entre apps: solo se espera si se supera el ritmo
+    limiter = TokenBucket(REQUESTS_POR_SEGUNDO, capacidad=MAX_CONCURRENCY)
     
-    # Guardar resultados
-    print("\n" + "="*60)
-    print("GUARDANDO RESULTADOS")
-    print("="*60)
+    async def bounded(i, app):
+        async with sem:
+            app_name = app['nombre']
+            print(f"[{i}/{total}] {app_name}")
+            
+            features = await scrape_app_features(pool, client, app['link'], app_name, limiter)
+            
+            if features:
+                # Guardar en cuanto llega (orden de finalización)
+                writer.write(features)
+                print(f"  ✓ [{i}/{total}] Features extraídas exitosamente")
+            else:
+                print(f"  ⚠️ [{i}/{total}] No se pudieron extraer features")
     
-    # Guardar en archivo de texto
-    with open('features_encontradas.txt', 'w', encoding='utf-8') as f:
-        f.write(f"Total de apps con features: {len(all_features)}\n")
-        f.write(f"Total de apps procesadas: {total}\n\n")
-        f.write("="*80 + "\n\n")
-        
-        for i, feature_data in enumerate(all_features, 1):
-            f.write(f"{i}. {feature_data['nombre']}\n")
-            f.write(f"   URL: {feature_data['features_url']}\n")
-            f.write(f"   Secciones encontradas: {feature_data['num_secciones']}\n")
-            f.write(f"\n   FEATURES:\n")
-            f.write("   " + "-"*76 + "\n")
-            # Indentar el texto de features
-            features_text = feature_data['features_text'].replace('\n', '\n   ')
-            f.write(f"   {features_text}\n")
-            f.write("\n" + "="*80 + "\n\n")
-    
-    # Guardar en JSON para fácil procesamiento
-    with open('features_encontradas.json', 'w', encoding='utf-8') as f:
-        json.dump(all_features, f, ensure_ascii=False, indent=2)
-    
-    # Guardar en CSV
-    if all_features:
-        with open('features_encontradas.csv', 'w', encoding='utf-8', newline='') as f:
-            writer = csv.DictWriter(f, fieldnames=['nombre', 'url', 'features_url', 'num_secciones', 'features_text'])
-            writer.writeheader()
-            writer.writerows(all_features)
+    try:
+        await asyncio.gather(*[bounded(i, app) for i, app in enumerate(apps, 1)])
+    finally:
+        await pool.close()
+        if client is not None:
+            await client.aclose()
+        writer.close(total)
     
+    print("\n" + "="*60)
+    print("RESULTADOS GUARDADOS")
+    print("="*60)
     print(f"\n✓ Resultados guardados en:")
-    print(f"  - features_encontradas.txt (formato legible)")
-    print(f"  - features_encontradas.json (formato estructurado)")
-    print(f"  - features_encontradas.csv (formato tabla)")
-    print(f"\n✓ Apps con features extraídas: {len(all_features)}/{total}")
+    print(f"  - {writer.txt_path} (formato legible)")
+    print(f"  - {writer.json_path} (formato estructurado)")
+    print(f"  - {writer.csv_path} (formato tabla)")
+    print(f"\n✓ Apps con features extraídas: {writer.count}/{total}")
 
 
 if __name__ == "__main__":
-    main()
+    asyncio.run(main())
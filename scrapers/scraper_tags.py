@@ -8,6 +8,12 @@ import csv
 import json
 import os
 
+# Selectores CSS equivalentes a los XPath originales (querySelectorAll nativo)
+# //component[1]//nav//ol/li[2]/ul/li/a/span
+CATEGORIAS_CSS = 'component:first-of-type nav ol > li:nth-of-type(2) > ul > li > a > span'
+# //pageorderablecontainer//aside//dl/dd[1]/ul/li/a/span
+INDUSTRIAS_CSS = 'pageorderablecontainer aside dl > dd:first-of-type > ul > li > a > span'
+
 def scrape_app_tags(url, app_name):
     """
     Extrae todas las categorías e industrias de una app
@@ -47,8 +53,7 @@ def scrape_app_tags(url, app_name):
         try:
             # XPath base para categorías: /html/body/div[2]/main/div/div/div/component[1]/div/div[2]/nav/ol/li[2]/ul/li[XXX]/a/span
             # Simplificado: buscar todos los li dentro de la estructura de navegación
-            category_xpath = "//component[1]//nav//ol/li[2]/ul/li/a/span"
-            category_elements = driver.find_elements(By.XPATH, category_xpath)
+            category_elements = driver.find_elements(By.CSS_SELECTOR, CATEGORIAS_CSS)
             
             for element in category_elements:
                 category_text = element.text.strip()
@@ -66,8 +71,7 @@ def scrape_app_tags(url, app_name):
         try:
             # XPath base para industrias: /html/body/div[2]/main/div/div/div/div/pageorderablecontainer/div/div[3]/div/div[2]/div[3]/aside/div/dl/dd[1]/ul/li[XXX]/a/span
             # Simplificado: buscar todos los li dentro de la estructura de industrias
-            industry_xpath = "//pageorderablecontainer//aside//dl/dd[1]/ul/li/a/span"
-            industry_elements = driver.find_elements(By.XPATH, industry_xpath)
+            industry_elements = driver.find_elements(By.CSS_SELECTOR, INDUSTRIAS_CSS)
             
             for element in industry_elements:
                 industry_text = element.text.strip()
@@ -11,7 +11,9 @@ import time
 from pathlib import Path
 from typing import List, Dict, Optional, Tuple
 import asyncpg
+import numpy as np
 from openai import AsyncOpenAI
+from pgvector.asyncpg import register_vector
 from dotenv import load_dotenv
 
 # Load environment variables from .env file
@@ -32,6 +34,9 @@ if not OPENAI_API_KEY:
 
 openai_client = AsyncOpenAI(api_key=OPENAI_API_KEY)
 
+# Texts embedded per embeddings.create request
+EMBEDDING_BATCH_SIZE = 100
+
 LABEL_CATALOG = [
     "Accounting", "Analytics", "Banking", "CRM", "Communication", "Compliance",
     "Customer Support", "Data Management", "Debt Collection", "Document Management",
@@ -90,14 +95,18 @@ async def retry_openai_call(func, *args, retries=2, **kwargs):
             print(f"Retry {attempt + 1}/{retries} after error: {e}")
             time.sleep(1)
 
-async def generate_embedding(text: str) -> List[float]:
-    """Generate embedding using OpenAI"""
-    response = await retry_openai_call(
-        openai_client.embeddings.create,
-        model="text-embedding-3-small",
-        input=text[:8000]
-    )
-    return response.data[0].embedding
+async def generate_embeddings(texts: List[str]) -> List[List[float]]:
+    """Generate embeddings for many texts, EMBEDDING_BATCH_SIZE per request"""
+    embeddings = []
+    for start in range(0, len(texts), EMBEDDING_BATCH_SIZE):
+        batch = [text[:8000] for text in texts[start:start + EMBEDDING_BATCH_SIZE]]
+        response = await retry_openai_call(
+            openai_client.embeddings.create,
+            model="text-embedding-3-small",
+            input=batch
+        )
+        embeddings.extend(item.embedding for item in sorted(response.data, key=lambda item: item.index))
+    return embeddings
 
 async def extract_labels(text: str, allowed_labels: List[str]) -> List[str]:
     """Extract labels using OpenAI"""
@@ -183,18 +192,24 @@ async def upsert_features(conn, app_id: str, features: Dict):
             features_text = EXCLUDED.features_text
     """, app_id, features.get("features_url"), features.get("num_sections", 0), features.get("features_text", ""))
 
+def normalize_embedding(embedding: List[float]) -> np.ndarray:
+    """Scale embedding to unit length (matching ranks by inner product)"""
+    vector = np.array(embedding, dtype=np.float32)
+    norm = np.linalg.norm(vector)
+    if norm > 0:
+        vector /= norm
+    return vector
+
 async def upsert_application_search(conn, app_id: str, embedding: List[float]) -> str:
     """Upsert application_search and return app_search_id"""
-    # Convert embedding list to pgvector format string
-    embedding_str = '[' + ','.join(map(str, embedding)) + ']'
-    
+    # Sent in pgvector's binary format (codec registered on the connection)
     app_search_id = await conn.fetchval("""
         INSERT INTO application_search (app_id, embedding)
-        VALUES ($1, $2::vector)
+        VALUES ($1, $2)
         ON CONFLICT (app_id) DO UPDATE SET
             embedding = EXCLUDED.embedding
         RETURNING id
-    """, app_id, embedding_str)
+    """, app_id, normalize_embedding(embedding))
     
     return str(app_search_id)
 
@@ -234,6 +249,10 @@ async def initialize_schema(conn):
         embedding vector(1536)
     );
 
+    ALTER TABLE application_search
+        ADD COLUMN IF NOT EXISTS embedding_half halfvec(1536)
+        GENERATED ALWAYS AS (embedding::halfvec(1536)) STORED;
+
     CREATE TABLE IF NOT EXISTS labels (
         label TEXT PRIMARY KEY,
         synonyms TEXT[] DEFAULT '{}'
@@ -251,6 +270,54 @@ async def initialize_schema(conn):
         PRIMARY KEY (app_search_id, integration_key)
     );
 
+    -- Denormalized copies of each app's labels and integration keys, so matching
+    -- reads them with the embedding row, canonicalized (lowercased and trimmed)
+    -- once at write time. The child tables stay the source of truth; triggers
+    -- keep the arrays in sync and the UPDATE backfills them.
+    ALTER TABLE application_search
+        ADD COLUMN IF NOT EXISTS labels TEXT[] NOT NULL DEFAULT '{}',
+        ADD COLUMN IF NOT EXISTS integrations TEXT[] NOT NULL DEFAULT '{}';
+
+    CREATE OR REPLACE FUNCTION sync_application_search_labels() RETURNS trigger AS $$
+    BEGIN
+        UPDATE application_search s
+        SET labels = COALESCE((
+            SELECT array_agg(lower(btrim(l.label))) FROM application_labels l WHERE l.app_search_id = s.id
+        ), '{}')
+        WHERE s.id IN (NEW.app_search_id, OLD.app_search_id);
+        RETURN NULL;
+    END;
+    $$ LANGUAGE plpgsql;
+
+    CREATE OR REPLACE FUNCTION sync_application_search_integrations() RETURNS trigger AS $$
+    BEGIN
+        UPDATE application_search s
+        SET integrations = COALESCE((
+            SELECT array_agg(lower(btrim(i.integration_key))) FROM application_integration_keys i WHERE i.app_search_id = s.id
+        ), '{}')
+        WHERE s.id IN (NEW.app_search_id, OLD.app_search_id);
+        RETURN NULL;
+    END;
+    $$ LANGUAGE plpgsql;
+
+    DROP TRIGGER IF EXISTS trg_application_labels_sync ON application_labels;
+    CREATE TRIGGER trg_application_labels_sync
+    AFTER INSERT OR UPDATE OR DELETE ON application_labels
+    FOR EACH ROW EXECUTE FUNCTION sync_application_search_labels();
+
+    DROP TRIGGER IF EXISTS trg_application_integration_keys_sync ON application_integration_keys;
+    CREATE TRIGGER trg_application_integration_keys_sync
+    AFTER INSERT OR UPDATE OR DELETE ON application_integration_keys
+    FOR EACH ROW EXECUTE FUNCTION sync_application_search_integrations();
+
+    UPDATE application_search s
+    SET labels = COALESCE((
+            SELECT array_agg(lower(btrim(l.label))) FROM application_labels l WHERE l.app_search_id = s.id
+        ), '{}'),
+        integrations = COALESCE((
+            SELECT array_agg(lower(btrim(i.integration_key))) FROM application_integration_keys i WHERE i.app_search_id = s.id
+        ), '{}');
+
     CREATE TABLE IF NOT EXISTS apps_tags (
         id SERIAL PRIMARY KEY,
         app_id UUID NOT NULL REFERENCES application(id) ON DELETE CASCADE,
@@ -277,16 +344,66 @@ async def initialize_schema(conn):
         updated_at TIMESTAMP WITH TIME ZONE
     );
 
+    CREATE TABLE IF NOT EXISTS application_clicks (
+        id UUID PRIMARY KEY DEFAULT gen_random_uuid(),
+        app_id UUID NOT NULL REFERENCES application(id) ON DELETE CASCADE,
+        created_at TIMESTAMP WITH TIME ZONE DEFAULT NOW()
+    );
+
+    -- Per-application click totals read by the click analytics endpoints. A
+    -- trigger keeps them in sync with every inserted click; the INSERT backfills
+    -- databases that already have clicks.
+    CREATE TABLE IF NOT EXISTS application_click_counter (
+        app_id UUID PRIMARY KEY REFERENCES application(id) ON DELETE CASCADE,
+        click_count BIGINT NOT NULL DEFAULT 0,
+        updated_at TIMESTAMP WITH TIME ZONE DEFAULT NOW()
+    );
+
+    CREATE OR REPLACE FUNCTION increment_application_click_counter() RETURNS trigger AS $$
+    BEGIN
+        INSERT INTO application_click_counter (app_id, click_count, updated_at)
+        VALUES (NEW.app_id, 1, NOW())
+        ON CONFLICT (app_id) DO UPDATE
+        SET click_count = application_click_counter.click_count + 1,
+            updated_at = NOW();
+        RETURN NEW;
+    END;
+    $$ LANGUAGE plpgsql;
+
+    DROP TRIGGER IF EXISTS trg_application_clicks_counter ON application_clicks;
+    CREATE TRIGGER trg_application_clicks_counter
+    AFTER INSERT ON application_clicks
+    FOR EACH ROW EXECUTE FUNCTION increment_application_click_counter();
+
+    INSERT INTO application_click_counter (app_id, click_count, updated_at)
+    SELECT app_id, COUNT(*), NOW() FROM application_clicks GROUP BY app_id
+    ON CONFLICT (app_id) DO NOTHING;
+
+    CREATE TABLE IF NOT EXISTS embedding_cache (
+        hash BYTEA PRIMARY KEY,
+        model TEXT NOT NULL,
+        embedding vector(1536) NOT NULL,
+        created_at TIMESTAMP WITH TIME ZONE DEFAULT NOW()
+    );
+
     CREATE INDEX IF NOT EXISTS idx_application_url ON application(url);
     CREATE INDEX IF NOT EXISTS idx_apps_tags_app_id ON apps_tags(app_id);
     CREATE INDEX IF NOT EXISTS idx_apps_tags_tag ON apps_tags(tag);
+    CREATE INDEX IF NOT EXISTS idx_apps_tags_tag_app_id ON apps_tags(tag, app_id);
     CREATE INDEX IF NOT EXISTS idx_cards_status ON cards(status);
     CREATE INDEX IF NOT EXISTS idx_card_prompts_comments_card_id ON card_prompts_comments(card_id);
+    CREATE INDEX IF NOT EXISTS ix_application_clicks_app_id ON application_clicks(app_id);
     CREATE INDEX IF NOT EXISTS idx_application_search_app_id ON application_search(app_id);
     CREATE INDEX IF NOT EXISTS idx_application_labels_app_search_id ON application_labels(app_search_id);
     CREATE INDEX IF NOT EXISTS idx_application_labels_label ON application_labels(label);
     CREATE INDEX IF NOT EXISTS idx_application_integration_keys_app_search_id ON application_integration_keys(app_search_id);
-    CREATE INDEX IF NOT EXISTS idx_application_search_embedding ON application_search USING hnsw (embedding vector_cosine_ops);
+    -- Inner-product HNSW indexes: embeddings are stored L2-normalized, so the
+    -- inner product ranks exactly like cosine similarity without the norms.
+    -- m/ef_construction above the defaults (16/64) for better recall at 1536 dims
+    DROP INDEX IF EXISTS idx_application_search_embedding;
+    DROP INDEX IF EXISTS idx_application_search_embedding_half;
+    CREATE INDEX IF NOT EXISTS idx_application_search_embedding_ip ON application_search USING hnsw (embedding vector_ip_ops) WITH (m = 24, ef_construction = 128);
+    CREATE INDEX IF NOT EXISTS idx_application_search_embedding_half_ip ON application_search USING hnsw (embedding_half halfvec_ip_ops) WITH (m = 24, ef_construction = 128);
     """
     
     await conn.execute(schema_sql)
@@ -341,6 +458,8 @@ async def main():
     try:
         print("\n[3/6] Initializing database schema...")
         await initialize_schema(conn)
+        # The vector type exists now: send embeddings in binary instead of text
+        await register_vector(conn)
         print("✓ Schema initialized (tables and indexes created)")
         
         print("\n[4/6] Initializing label catalog...")
@@ -350,6 +469,19 @@ async def main():
         
         print("\n[5/6] Processing applications...")
         total = len(apps)
+        
+        texts_for_embedding = []
+        for app in apps:
+            features = features_by_url.get(app["url"], {})
+            text_for_embedding = f"{app['name']}\n{app.get('description', '')}"
+            if features.get("features_text"):
+                text_for_embedding += f"\n{features['features_text'][:2000]}"
+            texts_for_embedding.append(text_for_embedding)
+        
+        print(f"  → Generating {total} embeddings in batches of {EMBEDDING_BATCH_SIZE}...")
+        embeddings = await generate_embeddings(texts_for_embedding)
+        print(f"  ✓ Generated {len(embeddings)} embeddings")
+        
         for idx, app in enumerate(apps, 1):
             print(f"\n  [{idx}/{total}] Processing: {app['name']}")
             
@@ -361,14 +493,10 @@ async def main():
                 await upsert_features(conn, app_id, features)
                 print(f"    ✓ Upserted features")
             
-            text_for_embedding = f"{app['name']}\n{app.get('description', '')}"
-            if features.get("features_text"):
-                text_for_embedding += f"\n{features['features_text'][:2000]}"
+            text_for_embedding = texts_for_embedding[idx - 1]
             
-            print(f"    → Generating embedding...")
-            embedding = await generate_embedding(text_for_embedding)
-            app_search_id = await upsert_application_search(conn, app_id, embedding)
-            print(f"    ✓ Generated embedding (search_id: {app_search_id[:8]}...)")
+            app_search_id = await upsert_application_search(conn, app_id, embeddings[idx - 1])
+            print(f"    ✓ Stored embedding (search_id: {app_search_id[:8]}...)")
             
             print(f"    → Extracting labels...")
             labels = await extract_labels(text_for_embedding, LABEL_CATALOG)
@@ -23,6 +23,12 @@ CREATE TABLE IF NOT EXISTS application_search (
     embedding vector(1536)
 );
 
+-- Half-precision copy of the embedding for the ANN stage of matching
+-- (kept in sync automatically; re-ranking uses the full-precision column)
+ALTER TABLE application_search
+    ADD COLUMN IF NOT EXISTS embedding_half halfvec(1536)
+    GENERATED ALWAYS AS (embedding::halfvec(1536)) STORED;
+
 CREATE TABLE IF NOT EXISTS labels (
     label TEXT PRIMARY KEY,
     synonyms TEXT[] DEFAULT '{}'
@@ -40,9 +46,116 @@ CREATE TABLE IF NOT EXISTS application_integration_keys (
     PRIMARY KEY (app_search_id, integration_key)
 );
 
+-- Denormalized copies of each app's labels and integration keys, so matching
+-- reads them with the embedding row, canonicalized (lowercased and trimmed)
+-- once at write time. The child tables stay the source of truth; triggers
+-- keep the arrays in sync and the UPDATE backfills them.
+ALTER TABLE application_search
+    ADD COLUMN IF NOT EXISTS labels TEXT[] NOT NULL DEFAULT '{}',
+    ADD COLUMN IF NOT EXISTS integrations TEXT[] NOT NULL DEFAULT '{}';
+
+CREATE OR REPLACE FUNCTION sync_application_search_labels() RETURNS trigger AS $$
+BEGIN
+    UPDATE application_search s
+    SET labels = COALESCE((
+        SELECT array_agg(lower(btrim(l.label))) FROM application_labels l WHERE l.app_search_id = s.id
+    ), '{}')
+    WHERE s.id IN (NEW.app_search_id, OLD.app_search_id);
+    RETURN NULL;
+END;
+$$ LANGUAGE plpgsql;
+
+CREATE OR REPLACE FUNCTION sync_application_search_integrations() RETURNS trigger AS $$
+BEGIN
+    UPDATE application_search s
+    SET integrations = COALESCE((
+        SELECT array_agg(lower(btrim(i.integration_key))) FROM application_integration_keys i WHERE i.app_search_id = s.id
+    ), '{}')
+    WHERE s.id IN (NEW.app_search_id, OLD.app_search_id);
+    RETURN NULL;
+END;
+$$ LANGUAGE plpgsql;
+
+DROP TRIGGER IF EXISTS trg_application_labels_sync ON application_labels;
+CREATE TRIGGER trg_application_labels_sync
+AFTER INSERT OR UPDATE OR DELETE ON application_labels
+FOR EACH ROW EXECUTE FUNCTION sync_application_search_labels();
+
+DROP TRIGGER IF EXISTS trg_application_integration_keys_sync ON application_integration_keys;
+CREATE TRIGGER trg_application_integration_keys_sync
+AFTER INSERT OR UPDATE OR DELETE ON application_integration_keys
+FOR EACH ROW EXECUTE FUNCTION sync_application_search_integrations();
+
+UPDATE application_search s
+SET labels = COALESCE((
+        SELECT array_agg(lower(btrim(l.label))) FROM application_labels l WHERE l.app_search_id = s.id
+    ), '{}'),
+    integrations = COALESCE((
+        SELECT array_agg(lower(btrim(i.integration_key))) FROM application_integration_keys i WHERE i.app_search_id = s.id
+    ), '{}');
+
+CREATE TABLE IF NOT EXISTS apps_tags (
+    id SERIAL PRIMARY KEY,
+    app_id UUID NOT NULL REFERENCES application(id) ON DELETE CASCADE,
+    tag TEXT NOT NULL,
+    created_at TIMESTAMP WITH TIME ZONE DEFAULT NOW()
+);
+
+CREATE TABLE IF NOT EXISTS application_clicks (
+    id UUID PRIMARY KEY DEFAULT gen_random_uuid(),
+    app_id UUID NOT NULL REFERENCES application(id) ON DELETE CASCADE,
+    created_at TIMESTAMP WITH TIME ZONE DEFAULT NOW()
+);
+
+-- Per-application click totals read by the click analytics endpoints. A
+-- trigger keeps them in sync with every inserted click; the INSERT backfills
+-- databases that already have clicks.
+CREATE TABLE IF NOT EXISTS application_click_counter (
+    app_id UUID PRIMARY KEY REFERENCES application(id) ON DELETE CASCADE,
+    click_count BIGINT NOT NULL DEFAULT 0,
+    updated_at TIMESTAMP WITH TIME ZONE DEFAULT NOW()
+);
+
+CREATE OR REPLACE FUNCTION increment_application_click_counter() RETURNS trigger AS $$
+BEGIN
+    INSERT INTO application_click_counter (app_id, click_count, updated_at)
+    VALUES (NEW.app_id, 1, NOW())
+    ON CONFLICT (app_id) DO UPDATE
+    SET click_count = application_click_counter.click_count + 1,
+        updated_at = NOW();
+    RETURN NEW;
+END;
+$$ LANGUAGE plpgsql;
+
+DROP TRIGGER IF EXISTS trg_application_clicks_counter ON application_clicks;
+CREATE TRIGGER trg_application_clicks_counter
+AFTER INSERT ON application_clicks
+FOR EACH ROW EXECUTE FUNCTION increment_application_click_counter();
+
+INSERT INTO application_click_counter (app_id, click_count, updated_at)
+SELECT app_id, COUNT(*), NOW() FROM application_clicks GROUP BY app_id
+ON CONFLICT (app_id) DO NOTHING;
+
+-- Persistent tier of the embedding cache (key: sha256 of model and text)
+CREATE TABLE IF NOT EXISTS embedding_cache (
+    hash BYTEA PRIMARY KEY,
+    model TEXT NOT NULL,
+    embedding vector(1536) NOT NULL,
+    created_at TIMESTAMP WITH TIME ZONE DEFAULT NOW()
+);
+
 CREATE INDEX IF NOT EXISTS idx_application_url ON application(url);
+CREATE INDEX IF NOT EXISTS idx_apps_tags_app_id ON apps_tags(app_id);
+CREATE INDEX IF NOT EXISTS idx_apps_tags_tag_app_id ON apps_tags(tag, app_id);
+CREATE INDEX IF NOT EXISTS ix_application_clicks_app_id ON application_clicks(app_id);
 CREATE INDEX IF NOT EXISTS idx_application_search_app_id ON application_search(app_id);
 CREATE INDEX IF NOT EXISTS idx_application_labels_app_search_id ON application_labels(app_search_id);
 CREATE INDEX IF NOT EXISTS idx_application_labels_label ON application_labels(label);
 CREATE INDEX IF NOT EXISTS idx_application_integration_keys_app_search_id ON application_integration_keys(app_search_id);
-CREATE INDEX IF NOT EXISTS idx_application_search_embedding ON application_search USING hnsw (embedding vector_cosine_ops);
+-- Inner-product HNSW indexes: embeddings are stored L2-normalized, so the
+-- inner product ranks exactly like cosine similarity without the norms.
+-- m/ef_construction above the defaults (16/64) for better recall at 1536 dims
+DROP INDEX IF EXISTS idx_application_search_embedding;
+DROP INDEX IF EXISTS idx_application_search_embedding_half;
+CREATE INDEX IF NOT EXISTS idx_application_search_embedding_ip ON application_search USING hnsw (embedding vector_ip_ops) WITH (m = 24, ef_construction = 128);
+CREATE INDEX IF NOT EXISTS idx_application_search_embedding_half_ip ON application_search USING hnsw (embedding_half halfvec_ip_ops) WITH (m = 24, ef_construction = 128);
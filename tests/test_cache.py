@@ -0,0 +1,153 @@
+"""
+Unit tests for the in-process caching helpers (TTLCache, SingleFlight)
+"""
+import asyncio
+
+import pytest
+
+from app.core import cache as cache_module
+from app.core.cache import SingleFlight, TTLCache
+
+
+class FakeClock:
+    """Stand-in for time.monotonic that only moves when told to"""
+
+    def __init__(self):
+        self.now = 1000.0
+
+    def __call__(self) -> float:
+        return self.now
+
+
+@pytest.fixture
+def clock(monkeypatch):
+    fake = FakeClock()
+    monkeypatch.setattr(cache_module.time, "monotonic", fake)
+    return fake
+
+
+def test_ttl_cache_entry_expires(clock):
+    cache = TTLCache(maxsize=10, ttl=5)
+    cache.set("a", 1)
+
+    clock.now += 4
+    assert cache.get("a") == 1
+
+    clock.now += 2
+    assert cache.get("a") is None
+    assert cache.get("a", "default") == "default"
+    assert len(cache) == 0
+
+
+def test_ttl_cache_evicts_least_recently_used(clock):
+    cache = TTLCache(maxsize=2, ttl=60)
+    cache.set("a", 1)
+    cache.set("b", 2)
+
+    # Reading "a" makes "b" the least recently used entry
+    assert cache.get("a") == 1
+    cache.set("c", 3)
+
+    assert cache.get("b") is None
+    assert cache.get("a") == 1
+    assert cache.get("c") == 3
+    assert len(cache) == 2
+
+
+def test_single_flight_concurrent_callers_share_one_result():
+    async def scenario():
+        flight = SingleFlight()
+        calls = 0
+        release = asyncio.Event()
+
+        async def work():
+            nonlocal calls
+            calls += 1
+            await release.wait()
+            return "result"
+
+        tasks = [asyncio.create_task(flight.do("key", work)) for _ in range(3)]
+        await asyncio.sleep(0)
+        release.set()
+        return calls, await asyncio.gather(*tasks)
+
+    calls, results = asyncio.run(scenario())
+
+    assert calls == 1
+    assert [result for result, _ in results] == ["result"] * 3
+    assert sorted(shared for _, shared in results) == [False, True, True]
+
+
+def test_single_flight_exception_reaches_every_waiter():
+    async def scenario():
+        flight = SingleFlight()
+        calls = 0
+        release = asyncio.Event()
+
+        async def work():
+            nonlocal calls
+            calls += 1
+            await release.wait()
+            raise ValueError("boom")
+
+        tasks = [asyncio.create_task(flight.do("key", work)) for _ in range(3)]
+        await asyncio.sleep(0)
+        release.set()
+        return calls, await asyncio.gather(*tasks, return_exceptions=True)
+
+    calls, results = asyncio.run(scenario())
+
+    assert calls == 1
+    assert len(results) == 3
+    assert all(isinstance(result, ValueError) for result in results)
+
+
+def test_single_flight_cancelled_leader_hands_call_to_waiter():
+    async def scenario():
+        flight = SingleFlight()
+        started = []
+        leader_started = asyncio.Event()
+
+        async def leader_work():
+            started.append("leader")
+            leader_started.set()
+            await asyncio.sleep(3600)
+
+        async def waiter_work():
+            started.append("waiter")
+            return "waiter result"
+
+        leader = asyncio.create_task(flight.do("key", leader_work))
+        await leader_started.wait()
+        waiter = asyncio.create_task(flight.do("key", waiter_work))
+        await asyncio.sleep(0)
+
+        leader.cancel()
+        with pytest.raises(asyncio.CancelledError):
+            await leader
+
+        return started, await waiter, flight._calls
+
+    started, waiter_result, calls_in_flight = asyncio.run(scenario())
+
+    assert started == ["leader", "waiter"]
+    # The waiter ran the call itself rather than sharing the cancelled one
+    assert waiter_result == ("waiter result", False)
+    assert calls_in_flight == {}
+
+
+def test_single_flight_runs_again_after_call_finishes():
+    async def scenario():
+        flight = SingleFlight()
+        calls = 0
+
+        async def work():
+            nonlocal calls
+            calls += 1
+            return calls
+
+        first = await flight.do("key", work)
+        second = await flight.do("key", work)
+        return first, second
+
+    assert asyncio.run(scenario()) == ((1, False), (2, False))
@@ -0,0 +1,110 @@
+"""
+Unit tests for the embedding microbatcher in app.core.openai_client
+"""
+import asyncio
+from types import SimpleNamespace
+
+import httpx
+import pytest
+from openai import BadRequestError
+
+from app.core import openai_client
+from app.core.errors import EmbeddingError
+from app.core.openai_client import _EmbeddingBatcher
+
+
+def _bad_request(message: str) -> BadRequestError:
+    request = httpx.Request("POST", "https://api.openai.com/v1/embeddings")
+    return BadRequestError(message, response=httpx.Response(400, request=request), body=None)
+
+
+class FakeEmbeddings:
+    """Records embeddings.create calls and answers with one vector per text"""
+
+    def __init__(self, reverse: bool = False, bad_texts=(), error: Exception = None):
+        self.calls = []
+        self.reverse = reverse
+        self.bad_texts = set(bad_texts)
+        self.error = error
+
+    async def create(self, model, input):
+        self.calls.append(list(input))
+        if self.error is not None:
+            raise self.error
+        if self.bad_texts.intersection(input):
+            raise _bad_request("invalid input")
+
+        data = [
+            SimpleNamespace(index=index, embedding=[float(len(text)), float(index)])
+            for index, text in enumerate(input)
+        ]
+        if self.reverse:
+            data.reverse()
+        return SimpleNamespace(data=data)
+
+
+@pytest.fixture
+def fake_embeddings(monkeypatch):
+    def install(**kwargs):
+        fake = FakeEmbeddings(**kwargs)
+        monkeypatch.setattr(openai_client, "client", SimpleNamespace(embeddings=fake))
+        return fake
+    return install
+
+
+def _embed_all(texts, max_batch=100):
+    async def scenario():
+        batcher = _EmbeddingBatcher(max_batch=max_batch, window=0.01)
+        return await asyncio.gather(
+            *(batcher.embed(text, "text-embedding-3-small") for text in texts),
+            return_exceptions=True
+        )
+    return asyncio.run(scenario())
+
+
+def test_concurrent_callers_share_one_request(fake_embeddings):
+    fake = fake_embeddings()
+
+    results = _embed_all(["a", "bb", "ccc"])
+
+    assert fake.calls == [["a", "bb", "ccc"]]
+    assert results == [[1.0, 0.0], [2.0, 1.0], [3.0, 2.0]]
+
+
+def test_out_of_order_results_are_matched_by_index(fake_embeddings):
+    fake = fake_embeddings(reverse=True)
+
+    results = _embed_all(["a", "bb", "ccc"])
+
+    assert fake.calls == [["a", "bb", "ccc"]]
+    assert results == [[1.0, 0.0], [2.0, 1.0], [3.0, 2.0]]
+
+
+def test_full_batch_is_sent_without_waiting_for_the_window(fake_embeddings):
+    fake = fake_embeddings()
+
+    results = _embed_all(["a", "bb", "ccc"], max_batch=2)
+
+    assert fake.calls == [["a", "bb"], ["ccc"]]
+    assert results == [[1.0, 0.0], [2.0, 1.0], [3.0, 0.0]]
+
+
+def test_bad_request_falls_back_to_one_request_per_input(fake_embeddings):
+    fake = fake_embeddings(bad_texts={"bad"})
+
+    results = _embed_all(["a", "bad", "ccc"])
+
+    assert fake.calls == [["a", "bad", "ccc"], ["a"], ["bad"], ["ccc"]]
+    assert results[0] == [1.0, 0.0]
+    assert isinstance(results[1], EmbeddingError)
+    assert results[2] == [3.0, 0.0]
+
+
+def test_batch_failure_reaches_every_pending_future(fake_embeddings):
+    fake = fake_embeddings(error=RuntimeError("connection reset"))
+
+    results = _embed_all(["a", "bb", "ccc"])
+
+    assert fake.calls == [["a", "bb", "ccc"]]
+    assert all(isinstance(result, EmbeddingError) for result in results)
+    assert all("connection reset" in str(result) for result in results)
@@ -0,0 +1,58 @@
+"""
+Unit tests for the local English check in front of normalize_to_english
+"""
+import asyncio
+from types import SimpleNamespace
+
+import pytest
+
+from app.core import openai_client
+from app.core.openai_client import looks_english, normalize_to_english
+
+SPANISH_PROMPT = "Necesito un CRM para mi equipo de ventas con integración de Stripe"
+MIXED_PROMPT = "I need a CRM for my sales team with integración de Stripe y el email para los clientes"
+ENGLISH_PROMPT = "I need a CRM for my sales team with Stripe integration and email marketing"
+
+
+class FakeCompletions:
+    """Records chat.completions.create calls and answers with a fixed translation"""
+
+    def __init__(self):
+        self.calls = []
+
+    async def create(self, model, messages, **kwargs):
+        self.calls.append(messages)
+        message = SimpleNamespace(content="  I need a CRM for my sales team with Stripe integration  ")
+        return SimpleNamespace(choices=[SimpleNamespace(message=message)])
+
+
+@pytest.fixture
+def fake_completions(monkeypatch):
+    fake = FakeCompletions()
+    monkeypatch.setattr(openai_client, "client", SimpleNamespace(chat=SimpleNamespace(completions=fake)))
+    monkeypatch.setattr(openai_client, "_normalized_texts", openai_client.TTLCache(maxsize=10, ttl=60))
+    return fake
+
+
+@pytest.mark.parametrize("text", [SPANISH_PROMPT, MIXED_PROMPT])
+def test_spanish_text_is_not_english(text):
+    assert not looks_english(text)
+
+
+def test_english_text_is_english():
+    assert looks_english(ENGLISH_PROMPT)
+
+
+def test_spanish_prompt_is_routed_to_translation(fake_completions):
+    result = asyncio.run(normalize_to_english(SPANISH_PROMPT))
+
+    assert result == "I need a CRM for my sales team with Stripe integration"
+    assert len(fake_completions.calls) == 1
+    assert fake_completions.calls[0][-1]["content"] == SPANISH_PROMPT
+
+
+def test_english_prompt_skips_translation(fake_completions):
+    result = asyncio.run(normalize_to_english(ENGLISH_PROMPT))
+
+    assert result == ENGLISH_PROMPT
+    assert fake_completions.calls == []